@@ -5,4 +5,43 @@ DEFAULT_RETRIES = 3
 DEFAULT_COOLDOWN_MINUTES = 120
 DEFAULT_MIN_PROB = 0.01
 DEFAULT_MAX_PROB = 0.99
+DEFAULT_WORKERS = 4
 MODEL_VERSION = "sentinel-v1"
+DEFAULT_EXA_CACHE_TTL_MINUTES = 360
+DEFAULT_EXA_CACHE_MAX_ENTRIES = 2000
+DEFAULT_LLM_CACHE_TTL_MINUTES = 0
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 5000
+DEFAULT_SUBMIT_BATCH_SIZE = 20
+DEFAULT_COMMENT_WORKERS = 4
+# Requests per second per host, overridable with RATE_LIMITS="host=rate,...".
+DEFAULT_RATE_LIMITS = "www.metaculus.com=2,api.exa.ai=5,openrouter.ai=10"
+# Comma-separated OpenRouter models for the forecaster role; empty keeps the single client.
+DEFAULT_FORECASTER_MODELS = ""
+DEFAULT_FORECASTER_QUORUM = 2
+# Hard cap on the whole fan-out; models still running then are cancelled.
+DEFAULT_FORECASTER_BUDGET_SECONDS = 45.0
+DEFAULT_FORECASTER_AGGREGATE = "median"
+# OpenRouter latency controls: SSE streaming, a wall-clock budget per call spanning retries
+# (0 disables it) and the delay before a hedged second request (0 disables hedging).
+DEFAULT_LLM_STREAM = False
+DEFAULT_LLM_DEADLINE_SECONDS = 60.0
+DEFAULT_LLM_HEDGE_AFTER_SECONDS = 0.0
+# Estimated tokens of evidence snippets packed into each LLM role prompt.
+DEFAULT_PROMPT_EVIDENCE_TOKENS = 1500
+# HTTP_MODE: "live", "record" (capture a cassette) or "replay" (serve one locally).
+DEFAULT_HTTP_MODE = "live"
+REPLAY_PLACEHOLDER_KEY = "replay"
+# Research planner: queries per question, queries in flight at once, and the number of
+# unseen URLs a wave must add for planning to continue.
+DEFAULT_RESEARCH_MAX_QUERIES = 4
+DEFAULT_RESEARCH_CONCURRENCY = 2
+DEFAULT_RESEARCH_MIN_NEW_SOURCES = 2
+# Earlier questions' documents a query must match before they are added (0 disables the pool).
+DEFAULT_EVIDENCE_POOL_MIN_DOCS = 4
+# Full-text contents fetch: top-ranked results fetched per question (0 disables it), the
+# byte cap per page, passages kept per page, and the extracted-passage cache TTL.
+DEFAULT_CONTENTS_MAX_DOCS = 0
+DEFAULT_CONTENTS_MAX_BYTES = 1_000_000
+DEFAULT_CONTENTS_PASSAGES = 4
+DEFAULT_CONTENTS_CACHE_TTL_MINUTES = 1440
+DEFAULT_CONTENTS_CACHE_MAX_ENTRIES = 5000
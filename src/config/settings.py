@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from src.config import constants
@@ -21,6 +21,36 @@ class Settings:
     tournament_id: int | str
     data_dir: Path
     fixtures_dir: Path
+    workers: int = constants.DEFAULT_WORKERS
+    exa_cache_ttl_minutes: int = constants.DEFAULT_EXA_CACHE_TTL_MINUTES
+    exa_cache_max_entries: int = constants.DEFAULT_EXA_CACHE_MAX_ENTRIES
+    llm_cache_ttl_minutes: int = constants.DEFAULT_LLM_CACHE_TTL_MINUTES
+    llm_cache_max_entries: int = constants.DEFAULT_LLM_CACHE_MAX_ENTRIES
+    submit_batch_size: int = constants.DEFAULT_SUBMIT_BATCH_SIZE
+    comment_workers: int = constants.DEFAULT_COMMENT_WORKERS
+    rate_limits: dict[str, float] = field(
+        default_factory=lambda: Settings._parse_rate_limits(constants.DEFAULT_RATE_LIMITS)
+    )
+    forecaster_models: tuple[str, ...] = ()
+    forecaster_quorum: int = constants.DEFAULT_FORECASTER_QUORUM
+    forecaster_budget_seconds: float = constants.DEFAULT_FORECASTER_BUDGET_SECONDS
+    forecaster_aggregate: str = constants.DEFAULT_FORECASTER_AGGREGATE
+    llm_stream: bool = constants.DEFAULT_LLM_STREAM
+    llm_deadline_seconds: float = constants.DEFAULT_LLM_DEADLINE_SECONDS
+    llm_hedge_after_seconds: float = constants.DEFAULT_LLM_HEDGE_AFTER_SECONDS
+    prompt_evidence_tokens: int = constants.DEFAULT_PROMPT_EVIDENCE_TOKENS
+    research_max_queries: int = constants.DEFAULT_RESEARCH_MAX_QUERIES
+    research_concurrency: int = constants.DEFAULT_RESEARCH_CONCURRENCY
+    research_min_new_sources: int = constants.DEFAULT_RESEARCH_MIN_NEW_SOURCES
+    evidence_pool_min_docs: int = constants.DEFAULT_EVIDENCE_POOL_MIN_DOCS
+    contents_max_docs: int = constants.DEFAULT_CONTENTS_MAX_DOCS
+    contents_max_bytes: int = constants.DEFAULT_CONTENTS_MAX_BYTES
+    contents_passages: int = constants.DEFAULT_CONTENTS_PASSAGES
+    contents_cache_ttl_minutes: int = constants.DEFAULT_CONTENTS_CACHE_TTL_MINUTES
+    http_mode: str = constants.DEFAULT_HTTP_MODE
+    cassette_path: Path | None = None
+    replay_latency_ms: float = 0.0
+    replay_error_rate: float = 0.0
 
     @staticmethod
     def _parse_tournament_id(value: str) -> int | str:
@@ -30,14 +60,30 @@ class Settings:
         except ValueError:
             return value
 
+    @staticmethod
+    def _parse_rate_limits(value: str) -> dict[str, float]:
+        """Parse RATE_LIMITS as comma-separated ``host=requests_per_second`` pairs."""
+        limits: dict[str, float] = {}
+        for pair in value.split(","):
+            host, sep, rate = pair.partition("=")
+            if sep and host.strip():
+                limits[host.strip()] = float(rate)
+        return limits
+
     @classmethod
     def from_env(cls) -> "Settings":
         base = Path(__file__).resolve().parents[2]
-        metaculus_token = os.getenv("METACULUS_TOKEN") or os.getenv("METACULUS_API_KEY")
+        http_mode = os.getenv("HTTP_MODE", constants.DEFAULT_HTTP_MODE).strip().lower()
+        # Replayed runs never reach the real APIs, so missing keys get a placeholder.
+        placeholder = constants.REPLAY_PLACEHOLDER_KEY if http_mode == "replay" else None
+        metaculus_token = (
+            os.getenv("METACULUS_TOKEN") or os.getenv("METACULUS_API_KEY") or placeholder
+        )
+        cassette = os.getenv("CASSETTE")
         return cls(
             metaculus_token=metaculus_token,
-            exa_api_key=os.getenv("EXA_API_KEY"),
-            openrouter_api_key=os.getenv("OPENROUTER_API_KEY"),
+            exa_api_key=os.getenv("EXA_API_KEY") or placeholder,
+            openrouter_api_key=os.getenv("OPENROUTER_API_KEY") or placeholder,
             max_questions=int(os.getenv("MAX_QUESTIONS", constants.DEFAULT_MAX_QUESTIONS)),
             timeout_seconds=int(os.getenv("TIMEOUT_SECONDS", constants.DEFAULT_TIMEOUT_SECONDS)),
             retries=int(os.getenv("RETRIES", constants.DEFAULT_RETRIES)),
@@ -45,11 +91,94 @@ class Settings:
             min_prob=float(os.getenv("MIN_PROB", constants.DEFAULT_MIN_PROB)),
             max_prob=float(os.getenv("MAX_PROB", constants.DEFAULT_MAX_PROB)),
             tournament_id=cls._parse_tournament_id(os.getenv("TOURNAMENT_ID", str(constants.TOURNAMENT_ID))),
-            data_dir=base / "data",
+            data_dir=Path(os.getenv("DATA_DIR") or base / "data"),
             fixtures_dir=base / "tests" / "fixtures",
+            workers=max(1, int(os.getenv("WORKERS", constants.DEFAULT_WORKERS))),
+            exa_cache_ttl_minutes=int(
+                os.getenv("EXA_CACHE_TTL_MINUTES", constants.DEFAULT_EXA_CACHE_TTL_MINUTES)
+            ),
+            exa_cache_max_entries=int(
+                os.getenv("EXA_CACHE_MAX_ENTRIES", constants.DEFAULT_EXA_CACHE_MAX_ENTRIES)
+            ),
+            llm_cache_ttl_minutes=int(
+                os.getenv("LLM_CACHE_TTL_MINUTES", constants.DEFAULT_LLM_CACHE_TTL_MINUTES)
+            ),
+            llm_cache_max_entries=int(
+                os.getenv("LLM_CACHE_MAX_ENTRIES", constants.DEFAULT_LLM_CACHE_MAX_ENTRIES)
+            ),
+            submit_batch_size=int(
+                os.getenv("SUBMIT_BATCH_SIZE", constants.DEFAULT_SUBMIT_BATCH_SIZE)
+            ),
+            comment_workers=int(
+                os.getenv("COMMENT_WORKERS", constants.DEFAULT_COMMENT_WORKERS)
+            ),
+            rate_limits=cls._parse_rate_limits(
+                os.getenv("RATE_LIMITS", constants.DEFAULT_RATE_LIMITS)
+            ),
+            forecaster_models=tuple(
+                model.strip()
+                for model in os.getenv(
+                    "FORECASTER_MODELS", constants.DEFAULT_FORECASTER_MODELS
+                ).split(",")
+                if model.strip()
+            ),
+            forecaster_quorum=int(
+                os.getenv("FORECASTER_QUORUM", constants.DEFAULT_FORECASTER_QUORUM)
+            ),
+            forecaster_budget_seconds=float(
+                os.getenv(
+                    "FORECASTER_BUDGET_SECONDS", constants.DEFAULT_FORECASTER_BUDGET_SECONDS
+                )
+            ),
+            forecaster_aggregate=os.getenv(
+                "FORECASTER_AGGREGATE", constants.DEFAULT_FORECASTER_AGGREGATE
+            ),
+            llm_stream=os.getenv("LLM_STREAM", str(constants.DEFAULT_LLM_STREAM)).lower()
+            in {"1", "true", "yes"},
+            llm_deadline_seconds=float(
+                os.getenv("LLM_DEADLINE_SECONDS", constants.DEFAULT_LLM_DEADLINE_SECONDS)
+            ),
+            llm_hedge_after_seconds=float(
+                os.getenv("LLM_HEDGE_AFTER_SECONDS", constants.DEFAULT_LLM_HEDGE_AFTER_SECONDS)
+            ),
+            prompt_evidence_tokens=int(
+                os.getenv("PROMPT_EVIDENCE_TOKENS", constants.DEFAULT_PROMPT_EVIDENCE_TOKENS)
+            ),
+            research_max_queries=int(
+                os.getenv("RESEARCH_MAX_QUERIES", constants.DEFAULT_RESEARCH_MAX_QUERIES)
+            ),
+            research_concurrency=int(
+                os.getenv("RESEARCH_CONCURRENCY", constants.DEFAULT_RESEARCH_CONCURRENCY)
+            ),
+            research_min_new_sources=int(
+                os.getenv("RESEARCH_MIN_NEW_SOURCES", constants.DEFAULT_RESEARCH_MIN_NEW_SOURCES)
+            ),
+            evidence_pool_min_docs=int(
+                os.getenv("EVIDENCE_POOL_MIN_DOCS", constants.DEFAULT_EVIDENCE_POOL_MIN_DOCS)
+            ),
+            contents_max_docs=int(
+                os.getenv("CONTENTS_MAX_DOCS", constants.DEFAULT_CONTENTS_MAX_DOCS)
+            ),
+            contents_max_bytes=int(
+                os.getenv("CONTENTS_MAX_BYTES", constants.DEFAULT_CONTENTS_MAX_BYTES)
+            ),
+            contents_passages=int(
+                os.getenv("CONTENTS_PASSAGES", constants.DEFAULT_CONTENTS_PASSAGES)
+            ),
+            contents_cache_ttl_minutes=int(
+                os.getenv(
+                    "CONTENTS_CACHE_TTL_MINUTES", constants.DEFAULT_CONTENTS_CACHE_TTL_MINUTES
+                )
+            ),
+            http_mode=http_mode,
+            cassette_path=Path(cassette) if cassette else None,
+            replay_latency_ms=float(os.getenv("REPLAY_LATENCY_MS", "0")),
+            replay_error_rate=float(os.getenv("REPLAY_ERROR_RATE", "0")),
         )
 
     def preflight(self) -> tuple[bool, list[str]]:
+        if self.http_mode == "replay":
+            return (True, [])
         errors: list[str] = []
         if not self.exa_api_key:
             errors.append("EXA_API_KEY is required")
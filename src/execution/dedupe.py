@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import json
 from datetime import datetime, timedelta, timezone
 
 
@@ -9,11 +10,56 @@ def submission_hash(question_id: int, payload: dict, reasoning: str, model_versi
     return hashlib.sha256(raw).hexdigest()
 
 
+# Question fields that define what is being forecast; volatile fields such as community
+# aggregations or forecaster counts are deliberately left out.
+FINGERPRINT_FIELDS = (
+    "id",
+    "title",
+    "type",
+    "description",
+    "resolution_criteria",
+    "fine_print",
+    "options",
+    "scaling",
+    "open_time",
+    "close_time",
+    "scheduled_close_time",
+    "prediction_end_time",
+    "resolve_time",
+    "status",
+)
+
+
+def input_fingerprint(question: dict, evidence, model_version: str) -> str:
+    fields = {name: question.get(name) for name in FINGERPRINT_FIELDS}
+    sources = [(item.url, item.snippet) for item in evidence.items]
+    raw = json.dumps(
+        {"question": fields, "evidence": sources, "model_version": model_version},
+        sort_keys=True,
+        default=str,
+    ).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
 def should_submit(last: dict | None, new_hash: str, cooldown_minutes: int, now: datetime | None = None) -> bool:
     if not last:
         return True
     if last.get("hash") != new_hash:
         return True
+    return not within_cooldown(last, cooldown_minutes, now)
+
+
+def within_cooldown(last: dict | None, cooldown_minutes: int, now: datetime | None = None) -> bool:
+    """Whether ``last`` was recorded less than ``cooldown_minutes`` ago."""
+    if not last:
+        return False
     ts = datetime.fromisoformat(last.get("timestamp"))
     current = now or datetime.now(timezone.utc)
-    return current >= ts + timedelta(minutes=cooldown_minutes)
+    return current < ts + timedelta(minutes=cooldown_minutes)
+
+
+def inputs_changed(
+    last: dict | None, fingerprint: str, cooldown_minutes: int, now: datetime | None = None
+) -> bool:
+    """Whether a question has to go through the LLM and forecasting stages again."""
+    return should_submit(last, fingerprint, cooldown_minutes, now)
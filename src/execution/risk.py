@@ -1,8 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second.
+
+    Callers reserve a token under the lock and sleep outside it, so concurrent workers
+    queue up fairly instead of spinning.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # ``_updated`` lies in the future while a ``defer`` block is in force; no tokens
+        # accrue until it ends.
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            debt = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(0.0, self._updated - now) + debt
+
+    def acquire(self) -> float:
+        """Take one token, blocking as needed; returns the seconds spent waiting."""
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return max(wait, 0.0)
+
+    def defer(self, seconds: float) -> None:
+        """Block all callers for ``seconds``, e.g. after a 429 with Retry-After.
+
+        Callers queued behind the block resume one token interval apart rather than in a
+        burst when it ends.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            until = now + seconds
+            if until > self._updated:
+                self._updated = until
+                self._tokens = min(self._tokens, 1.0)
+
+
 class RateLimiter:
-    def __init__(self, max_submissions: int):
-        self.max_submissions = max_submissions
-        self.count = 0
+    """Per-host token buckets shared by every worker that uses the same transport.
+
+    Hosts without a configured rate are not throttled.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        self._buckets = {host: TokenBucket(rate) for host, rate in rates.items() if rate > 0}
+        self._requests: dict[str, int] = {}
+        self._throttled: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        waited = bucket.acquire() if bucket is not None else 0.0
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+            self._throttled[host] = self._throttled.get(host, 0.0) + waited
+
+    def defer(self, host: str, seconds: float) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets.setdefault(host, TokenBucket(rate=1e9))
+        bucket.defer(seconds)
 
-    def allow(self) -> bool:
-        self.count += 1
-        return self.count <= self.max_submissions
+    def stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                host: {
+                    "requests": count,
+                    "throttled_seconds": round(self._throttled.get(host, 0.0), 3),
+                }
+                for host, count in sorted(self._requests.items())
+            }
@@ -1,47 +1,44 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
+from src.config.constants import DEFAULT_CONTENTS_CACHE_MAX_ENTRIES, MODEL_VERSION
 from src.config.timezone import now_utc, to_us, utc_and_us_iso
+from src.execution.dedupe import input_fingerprint, inputs_changed, within_cooldown
 from src.execution.risk import RateLimiter
-from src.execution.submitter import maybe_submit
+from src.execution.submitter import SubmissionBatcher, maybe_submit
+from src.execution.timing import Profiler, timed
 from src.forecasting.baselines import baseline_forecast
 from src.forecasting.ensemble import combine
 from src.forecasting.features import extract_features
-from src.forecasting.stats.binary_models import forecast_binary
-from src.forecasting.stats.date_models import forecast_date
-from src.forecasting.stats.multiclass_models import dirichlet_update
-from src.forecasting.stats.numeric_models import forecast_numeric
+from src.forecasting.stats_forecast import stats_forecast
+from src.forecasting.weights import EnsembleWeights, load_weights
+from src.llm.fanout import ForecasterFanout
 from src.llm.openrouter_client import OpenRouterClient
 from src.llm.roles import run_roles
 from src.metaculus.client import MetaculusClient
 from src.metaculus.selection import select_questions
+from src.metaculus.snapshots import QuestionSnapshotStore
 from src.metaculus.state import StateStore
 from src.metaculus.windows import is_question_open_now, is_tournament_open_now
+from src.net.replay import open_transport
+from src.research.contents import ContentFetcher
+from src.research.evidence import EvidenceBundle
 from src.research.exa_client import ExaClient
+from src.research.planner import ResearchPlanner
+from src.research.pool import EvidencePool, PoolView
 from src.research.retrieval import retrieve_evidence
-from src.storage.csv_logger import append_forecast_row, append_run_row
-from src.storage.jsonl_logger import append_forecast_record
+from src.storage.csv_logger import FORECAST_FIELDS, RUN_FIELDS
+from src.storage.disk_cache import DiskCache
+from src.storage.history import ForecastHistory
 from src.storage.report import write_summary
+from src.storage.run_writer import RunLogWriter
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
-def _stats_forecast(question: dict, features: dict) -> dict:
-    qtype = question.get("type", "binary")
-    if qtype == "binary":
-        return forecast_binary(features)
-    if qtype in {"multiple_choice", "distribution"}:
-        return dirichlet_update(len(question.get("options", [])))
-    if qtype == "numeric":
-        return forecast_numeric()
-    if qtype == "date":
-        dateq = forecast_date()
-        return {"p10": 0.2, "p50": 0.5, "p90": 0.8, "date_quantiles": dateq}
-    return {"probability": 0.5}
-
-
 def _reasoning(question: dict, evidence) -> str:
     refs = [f"[{item.idx}] {item.title} ({item.url})" for item in evidence.items[:3]]
     citation_ids = " ".join(f"[{item.idx}]" for item in evidence.items[:3]) or "[1]"
@@ -52,6 +49,141 @@ def _reasoning(question: dict, evidence) -> str:
     )
 
 
+def _prepare_forecast(
+    question: dict,
+    settings,
+    exa_client,
+    llm_client,
+    previous_inputs: dict | None = None,
+    profiler: Profiler | None = None,
+    weights: EnsembleWeights | None = None,
+    role_clients: dict | None = None,
+    content_fetcher: ContentFetcher | None = None,
+    snapshots: QuestionSnapshotStore | None = None,
+) -> dict:
+    """Run retrieval, LLM roles, stats and ensemble for one question without side effects.
+
+    When the question's post is unchanged since its last recorded forecast within the
+    cooldown, every stage is skipped, retrieval included. Otherwise, when its input
+    fingerprint matches ``previous_inputs`` within the cooldown, the LLM and forecasting
+    stages are skipped and only the evidence is returned.
+    """
+    qid = question.get("id")
+    last = (previous_inputs or {}).get(str(qid))
+    post_digest = snapshots.digest(question.get("post_id")) if snapshots is not None else None
+    if (
+        post_digest is not None
+        and last
+        and last.get("post_digest") == post_digest
+        and within_cooldown(last, settings.cooldown_minutes)
+    ):
+        if isinstance(exa_client, PoolView):
+            exa_client.done()
+        return {
+            "skipped": True,
+            "evidence": EvidenceBundle(question_id=qid or 0, items=[]),
+            "fingerprint": last.get("hash"),
+            "post_digest": post_digest,
+        }
+    try:
+        evidence = retrieve_evidence(
+            question,
+            exa_client,
+            profiler=profiler,
+            planner=ResearchPlanner.from_settings(settings),
+            content_fetcher=content_fetcher,
+        )
+    finally:
+        if isinstance(exa_client, PoolView):
+            exa_client.done()
+    fingerprint = input_fingerprint(question, evidence, MODEL_VERSION)
+    if not inputs_changed(last, fingerprint, settings.cooldown_minutes):
+        return {
+            "skipped": True,
+            "evidence": evidence,
+            "fingerprint": fingerprint,
+            "post_digest": post_digest,
+        }
+    llm_outputs = run_roles(
+        question,
+        evidence,
+        llm_client,
+        profiler=profiler,
+        role_clients=role_clients,
+        evidence_tokens=settings.prompt_evidence_tokens,
+    )
+    with timed(profiler, "stats", qid):
+        baseline = baseline_forecast(question)
+        features = extract_features(question, evidence)
+        stats = stats_forecast(question, features)
+    llm_forecast = llm_outputs.get("forecaster", {})
+    with timed(profiler, "combine", qid):
+        final_forecast = combine(
+            question,
+            baseline,
+            stats,
+            llm_forecast,
+            min_prob=settings.min_prob,
+            max_prob=settings.max_prob,
+            weights=weights,
+        )
+    return {
+        "skipped": False,
+        "fingerprint": fingerprint,
+        "post_digest": post_digest,
+        "evidence": evidence,
+        "baseline": baseline,
+        "stats": stats,
+        "llm": llm_forecast,
+        "final_forecast": final_forecast,
+        "reasoning": _reasoning(question, evidence),
+    }
+
+
+def prepare_forecasts(
+    questions: list[dict],
+    settings,
+    exa_client,
+    llm_client,
+    previous_inputs: dict | None = None,
+    profiler: Profiler | None = None,
+    weights: EnsembleWeights | None = None,
+    role_clients: dict | None = None,
+    content_fetcher: ContentFetcher | None = None,
+    snapshots: QuestionSnapshotStore | None = None,
+) -> list[dict]:
+    """Prepare forecasts for ``questions`` on a pool of ``settings.workers`` threads.
+
+    Results are returned in the same order as ``questions``. With an ``EvidencePool`` each
+    question searches through its own view, created in question order.
+    """
+    if isinstance(exa_client, EvidencePool):
+        search_clients = [exa_client.view() for _ in questions]
+    else:
+        search_clients = [exa_client] * len(questions)
+    args = (
+        llm_client,
+        previous_inputs,
+        profiler,
+        weights,
+        role_clients,
+        content_fetcher,
+        snapshots,
+    )
+    workers = min(max(1, settings.workers), len(questions))
+    if workers <= 1:
+        return [
+            _prepare_forecast(q, settings, client, *args)
+            for q, client in zip(questions, search_clients)
+        ]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="metacbot-question") as pool:
+        futures = [
+            pool.submit(_prepare_forecast, q, settings, client, *args)
+            for q, client in zip(questions, search_clients)
+        ]
+        return [future.result() for future in futures]
+
+
 def run_once(settings) -> int:
     ok, errors = settings.preflight()
     if not ok:
@@ -62,43 +194,127 @@ def run_once(settings) -> int:
     now_us = to_us(now)
     utc_iso, us_iso = utc_and_us_iso(now)
     logger.info("Run start UTC=%s US=%s", utc_iso, us_iso)
+    profiler = Profiler()
 
     settings.data_dir.mkdir(parents=True, exist_ok=True)
     state_store = StateStore(settings.data_dir / "state.json")
+    weights = load_weights(settings.data_dir / "ensemble_weights.json")
+    if weights is not None:
+        logger.info("Using ensemble weights fitted at %s", weights.fitted_at)
     state = state_store.load()
 
-    meta_client = MetaculusClient(settings)
-    exa_client = ExaClient(settings)
-    llm_client = OpenRouterClient(settings)
+    # One pooled transport so all clients reuse keep-alive connections per host.
+    rate_limiter = RateLimiter(settings.rate_limits)
+    transport = open_transport(settings, rate_limiter=rate_limiter)
+    meta_client = MetaculusClient(settings, transport=transport)
+    exa_cache = None
+    if settings.exa_cache_ttl_minutes > 0:
+        exa_cache = DiskCache(
+            settings.data_dir / "cache" / "exa",
+            ttl_seconds=settings.exa_cache_ttl_minutes * 60,
+            max_entries=settings.exa_cache_max_entries,
+        )
+    exa_client = ExaClient(settings, transport=transport, cache=exa_cache)
+    # Questions share one evidence pool so overlapping topics reuse fetched documents.
+    evidence_pool = None
+    search_client = exa_client
+    if settings.evidence_pool_min_docs > 0:
+        evidence_pool = search_client = EvidencePool(exa_client, settings.evidence_pool_min_docs)
+    contents_cache = None
+    content_fetcher = None
+    if settings.contents_max_docs > 0:
+        if settings.contents_cache_ttl_minutes > 0:
+            contents_cache = DiskCache(
+                settings.data_dir / "cache" / "contents",
+                ttl_seconds=settings.contents_cache_ttl_minutes * 60,
+                max_entries=DEFAULT_CONTENTS_CACHE_MAX_ENTRIES,
+            )
+        content_fetcher = ContentFetcher(
+            transport,
+            cache=contents_cache,
+            max_docs=settings.contents_max_docs,
+            max_bytes=settings.contents_max_bytes,
+            max_passages=settings.contents_passages,
+        )
+    llm_cache = None
+    if settings.llm_cache_ttl_minutes > 0:
+        llm_cache = DiskCache(
+            settings.data_dir / "cache" / "llm",
+            ttl_seconds=settings.llm_cache_ttl_minutes * 60,
+            max_entries=settings.llm_cache_max_entries,
+        )
+    llm_client = OpenRouterClient(settings, transport=transport, cache=llm_cache)
+    role_clients = {}
+    if settings.forecaster_models:
+        role_clients["forecaster"] = ForecasterFanout(
+            [
+                OpenRouterClient(settings, model=model, transport=transport, cache=llm_cache)
+                for model in settings.forecaster_models
+            ],
+            quorum=settings.forecaster_quorum,
+            budget_seconds=settings.forecaster_budget_seconds,
+            aggregate=settings.forecaster_aggregate,
+        )
 
-    tournament = meta_client.tournament_meta()
+    with timed(profiler, "tournament_fetch"):
+        tournament = meta_client.tournament_meta()
     tournament_open, tournament_status = is_tournament_open_now(tournament, now_us)
 
-    questions = meta_client.questions()
+    snapshots = QuestionSnapshotStore(settings.data_dir / "question_snapshots.json")
+    with timed(profiler, "question_fetch"):
+        questions = meta_client.questions(snapshots)
+        snapshots.save()
+    logger.info(
+        "Fetched questions total=%d changed_since_last_run=%d",
+        len(questions),
+        len(snapshots.changed_post_ids),
+    )
     chosen = select_questions(questions, now=now, limit=settings.max_questions)
 
-    limiter = RateLimiter(settings.max_questions)
     records: list[dict] = []
 
-    for question in chosen:
+    # Research and forecasting run concurrently; submission, state and log writes stay serial
+    # and follow the selection order.
+    prepared_forecasts = prepare_forecasts(
+        chosen,
+        settings,
+        search_client,
+        llm_client,
+        previous_inputs=state.get("inputs", {}),
+        profiler=profiler,
+        weights=weights,
+        role_clients=role_clients,
+        content_fetcher=content_fetcher,
+        snapshots=snapshots,
+    )
+
+    batcher = SubmissionBatcher(
+        meta_client,
+        state,
+        settings.submit_batch_size,
+        settings.comment_workers,
+        profiler=profiler,
+        state_store=state_store,
+    )
+    skipped_count = 0
+    fingerprints: list[tuple[dict, dict, dict]] = []
+    for question, prepared in zip(chosen, prepared_forecasts):
+        if prepared["skipped"]:
+            skipped_count += 1
+            logger.info(
+                "inputs unchanged within cooldown question_id=%s; skipped LLM and forecasting",
+                question.get("id"),
+            )
+            continue
         q_open, q_status = is_question_open_now(question, now_us)
-        can_submit = tournament_open and q_open and limiter.allow()
+        can_submit = tournament_open and q_open
 
-        evidence = retrieve_evidence(question, exa_client)
-        llm_outputs = run_roles(question, evidence, llm_client)
-        baseline = baseline_forecast(question)
-        features = extract_features(question, evidence)
-        stats = _stats_forecast(question, features)
-        llm_forecast = llm_outputs.get("forecaster", {})
-        final_forecast = combine(
-            question,
-            baseline,
-            stats,
-            llm_forecast,
-            min_prob=settings.min_prob,
-            max_prob=settings.max_prob,
-        )
-        reasoning = _reasoning(question, evidence)
+        evidence = prepared["evidence"]
+        baseline = prepared["baseline"]
+        stats = prepared["stats"]
+        llm_forecast = prepared["llm"]
+        final_forecast = prepared["final_forecast"]
+        reasoning = prepared["reasoning"]
 
         submission = maybe_submit(
             meta_client,
@@ -108,9 +324,12 @@ def run_once(settings) -> int:
             final_forecast,
             reasoning,
             can_submit=can_submit,
+            batcher=batcher,
         )
         if not can_submit and submission["status"] == "SKIPPED_NOT_OPEN":
             logger.info("market closed/not open question_id=%s status=%s", question.get("id", "(missing)"), q_status)
+        else:
+            fingerprints.append((question, prepared, submission))
 
         record = {
             "run_time_utc": utc_iso,
@@ -129,22 +348,65 @@ def run_once(settings) -> int:
             "evidence": [item.__dict__ for item in evidence.items],
         }
         records.append(record)
-        append_forecast_row(settings.data_dir / "forecasts.csv", record)
-        append_forecast_record(settings.data_dir / "forecasts.jsonl", record)
-
-    state_store.save(state)
-
-    append_run_row(
-        settings.data_dir / "runs.csv",
-        {
-            "run_id": now_utc().strftime("%Y%m%d%H%M%S"),
-            "start_time_utc": utc_iso,
-            "start_time_us": us_iso,
-            "status": "SUCCESS",
-            "question_count": len(chosen),
-            "submitted_count": sum(1 for r in records if r["submission"].get("submitted")),
-        },
+
+    # Queued submissions are posted here and their record entries updated in place.
+    batcher.flush()
+    # Only fingerprint forecasts made for an open market and not rejected on submission, so
+    # a question that opens later or whose post failed is forecast again on the next run.
+    for question, prepared, submission in fingerprints:
+        if submission["status"] != "SUBMIT_FAILED":
+            state_store.record(
+                state,
+                "inputs",
+                str(question.get("id")),
+                {
+                    "hash": prepared["fingerprint"],
+                    "post_digest": prepared["post_digest"],
+                    "timestamp": now_utc().isoformat(),
+                },
+            )
+    run_id = now_utc().strftime("%Y%m%d%H%M%S")
+    with timed(profiler, "logging"), RunLogWriter() as log_writer:
+        for record in records:
+            log_writer.csv_row(settings.data_dir / "forecasts.csv", record, FORECAST_FIELDS)
+            log_writer.jsonl_record(settings.data_dir / "forecasts.jsonl", record)
+        history = ForecastHistory(settings.data_dir / "forecast_history.sqlite3")
+        history.append(records)
+        history.close()
+
+        # Questions missing from the open/upcoming listing have closed or resolved.
+        pruned = state_store.prune(state, {str(q.get("id")) for q in questions}) if questions else 0
+        if pruned:
+            logger.info("Pruned %d state entries for questions no longer listed", pruned)
+        state_store.save(state)
+
+        log_writer.csv_row(
+            settings.data_dir / "runs.csv",
+            {
+                "run_id": run_id,
+                "start_time_utc": utc_iso,
+                "start_time_us": us_iso,
+                "status": "SUCCESS",
+                "question_count": len(chosen),
+                "submitted_count": sum(1 for r in records if r["submission"].get("submitted")),
+                "skipped_count": skipped_count,
+            },
+            RUN_FIELDS,
+        )
+    caches = {"exa": exa_cache, "llm": llm_cache, "contents": contents_cache}
+    cache_stats = {name: cache.stats() for name, cache in caches.items() if cache is not None}
+    write_summary(
+        settings.data_dir / "latest_summary.md",
+        records,
+        utc_iso,
+        us_iso,
+        cache_stats=cache_stats,
+        skipped_count=skipped_count,
+        throttle_stats=rate_limiter.stats(),
+        timings=profiler.stage_summary(),
+        pool_stats=evidence_pool.stats() if evidence_pool is not None else None,
     )
-    write_summary(settings.data_dir / "latest_summary.md", records, utc_iso, us_iso)
+    profiler.write_jsonl(settings.data_dir / "timings.jsonl", run_id)
+    transport.close()
 
     return 0
@@ -1,15 +1,130 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from src.config.constants import MODEL_VERSION
 from src.execution.dedupe import should_submit, submission_hash
+from src.execution.timing import Profiler, timed
+from src.metaculus.client import MetaculusAPIError
 
 logger = logging.getLogger(__name__)
 
 
-def maybe_submit(client, settings, state: dict, question: dict, final_forecast: dict, reasoning: str, can_submit: bool):
+def _comment_post_id(question: dict):
+    # Post comment using post_id if available, otherwise use question_id with warning
+    post_id = question.get("post_id")
+    if post_id is None:
+        logger.warning(
+            "No post_id for question %s; using question_id for comment (may fail if IDs differ)",
+            question.get("id"),
+        )
+        post_id = question.get("id")
+    return post_id
+
+
+def _record_submission(state: dict, qid: str, digest: str, state_store=None) -> None:
+    entry = {"hash": digest, "timestamp": datetime.now(timezone.utc).isoformat()}
+    if state_store is not None:
+        state_store.record(state, "submissions", qid, entry)
+    else:
+        state.setdefault("submissions", {})[qid] = entry
+
+
+class SubmissionBatcher:
+    """Queue approved forecasts during a run and submit them in batches on ``flush``.
+
+    ``add`` returns the submission dict that ends up in the run record; ``flush`` updates
+    it in place once the batch containing it has been posted.
+    """
+
+    def __init__(
+        self,
+        client,
+        state: dict,
+        batch_size: int,
+        comment_workers: int,
+        profiler: Profiler | None = None,
+        state_store=None,
+    ):
+        self.client = client
+        self.profiler = profiler
+        self.state_store = state_store
+        self.state = state
+        self.batch_size = max(1, batch_size)
+        self.comment_workers = max(1, comment_workers)
+        self._pending: list[dict] = []
+
+    def add(self, question: dict, final_forecast: dict, reasoning: str, digest: str) -> dict:
+        submission = {"submitted": False, "status": "QUEUED", "hash": digest}
+        self._pending.append(
+            {
+                "question": question,
+                "forecast": final_forecast,
+                "reasoning": reasoning,
+                "submission": submission,
+            }
+        )
+        return submission
+
+    def _post(self, chunk: list[dict]) -> None:
+        try:
+            with timed(self.profiler, "submit"):
+                response = self.client.submit_batch([(i["question"], i["forecast"]) for i in chunk])
+        except MetaculusAPIError as err:
+            if len(chunk) > 1:
+                # One rejected forecast fails the whole batch; resubmit individually so the
+                # error is attributed to the right question.
+                logger.warning("Batch forecast submission failed, retrying per question: %s", err)
+                for item in chunk:
+                    self._post([item])
+                return
+            logger.error(
+                "Forecast submission failed question_id=%s: %s", chunk[0]["question"].get("id"), err
+            )
+            chunk[0]["submission"].update({"status": "SUBMIT_FAILED", "error": str(err)})
+            return
+
+        per_item = response if isinstance(response, list) and len(response) == len(chunk) else None
+        for index, item in enumerate(chunk):
+            item_response = per_item[index] if per_item is not None else response
+            item["submission"].update(
+                {"submitted": True, "status": "SUBMITTED", "response": item_response}
+            )
+            qid = str(item["question"].get("id"))
+            _record_submission(self.state, qid, item["submission"]["hash"], self.state_store)
+
+    def _comment(self, item: dict) -> None:
+        try:
+            with timed(self.profiler, "comment", item["question"].get("id")):
+                self.client.post_comment(_comment_post_id(item["question"]), item["reasoning"])
+        except MetaculusAPIError as err:
+            logger.warning("Comment failed question_id=%s: %s", item["question"].get("id"), err)
+            item["submission"]["comment_error"] = str(err)
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.batch_size):
+            self._post(pending[start : start + self.batch_size])
+        submitted = [item for item in pending if item["submission"]["submitted"]]
+        if not submitted:
+            return
+        workers = min(self.comment_workers, len(submitted))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="metacbot-comment") as pool:
+            list(pool.map(self._comment, submitted))
+
+
+def maybe_submit(
+    client,
+    settings,
+    state: dict,
+    question: dict,
+    final_forecast: dict,
+    reasoning: str,
+    can_submit: bool,
+    batcher: SubmissionBatcher | None = None,
+):
     question_id = question.get("id")
     if question_id is None:
         raise ValueError("Question must have an 'id' field")
@@ -23,20 +138,10 @@ def maybe_submit(client, settings, state: dict, question: dict, final_forecast:
     if not should_submit(last, digest, settings.cooldown_minutes):
         return {"submitted": False, "status": "SKIPPED_UNCHANGED", "hash": digest}
 
-    response = client.submit(question, final_forecast, reasoning)
-
-    # Post comment using post_id if available, otherwise use question_id with warning
-    post_id = question.get("post_id")
-    if post_id is None:
-        logger.warning(
-            "No post_id for question %s; using question_id for comment (may fail if IDs differ)",
-            question_id,
-        )
-        post_id = question_id
-    client.post_comment(post_id, reasoning)
+    if batcher is not None:
+        return batcher.add(question, final_forecast, reasoning, digest)
 
-    state.setdefault("submissions", {})[qid] = {
-        "hash": digest,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    response = client.submit(question, final_forecast, reasoning)
+    client.post_comment(_comment_post_id(question), reasoning)
+    _record_submission(state, qid, digest)
     return {"submitted": True, "status": "SUBMITTED", "hash": digest, "response": response}
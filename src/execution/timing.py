@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile of ``values`` for ``q`` in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class Profiler:
+    """Thread-safe collector of wall-clock spans per stage, optionally per question."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._started = clock()
+        self._spans: list[tuple[str, Any, float]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str, question_id: Any = None) -> Iterator[None]:
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(stage, self._clock() - start, question_id)
+
+    def record(self, stage: str, seconds: float, question_id: Any = None) -> None:
+        with self._lock:
+            self._spans.append((stage, question_id, seconds))
+
+    def stage_summary(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            spans = list(self._spans)
+        by_stage: dict[str, list[float]] = {}
+        for stage, _question_id, seconds in spans:
+            by_stage.setdefault(stage, []).append(seconds)
+        return {
+            stage: {
+                "count": len(values),
+                "total": round(sum(values), 4),
+                "p50": round(percentile(values, 50), 4),
+                "p95": round(percentile(values, 95), 4),
+                "max": round(max(values), 4),
+            }
+            for stage, values in by_stage.items()
+        }
+
+    def question_breakdown(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            spans = list(self._spans)
+        out: dict[str, dict[str, float]] = {}
+        for stage, question_id, seconds in spans:
+            if question_id is None:
+                continue
+            stages = out.setdefault(str(question_id), {})
+            stages[stage] = round(stages.get(stage, 0.0) + seconds, 4)
+        return out
+
+    def write_jsonl(self, path: Path, run_id: str) -> None:
+        """Append one line per question and one run-level line to ``path``."""
+        lines = [
+            {"kind": "question", "run_id": run_id, "question_id": qid, "stages": stages}
+            for qid, stages in self.question_breakdown().items()
+        ]
+        lines.append(
+            {
+                "kind": "run",
+                "run_id": run_id,
+                "wall_seconds": round(self._clock() - self._started, 4),
+                "stages": self.stage_summary(),
+            }
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(line) + "\n" for line in lines))
+
+
+def timed(profiler: Profiler | None, stage: str, question_id: Any = None):
+    """``profiler.span`` when a profiler is given, otherwise a no-op context."""
+    return profiler.span(stage, question_id) if profiler is not None else nullcontext()
@@ -0,0 +1,278 @@
+"""Offline backtest: replay resolved questions through the forecasting stack and score them.
+
+Usage::
+
+    python -m src.forecasting.backtest --cases tests/fixtures/resolved_questions.json
+    python -m src.forecasting.backtest --history data/forecast_history.sqlite3 \\
+        --resolutions data/resolutions.json --out data/backtest.json
+    python -m src.forecasting.backtest --cases resolved.json --fit data/ensemble_weights.json
+
+No network access is needed: LLM forecasts come from each case's recorded ``llm`` output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from src.config import constants
+from src.forecasting.baselines import baseline_forecast
+from src.forecasting.batch import MULTICLASS_TYPES, combine_batch
+from src.forecasting.stats.scoring import brier_all, calibration_curve, log_score_all
+from src.forecasting.stats_forecast import stats_forecast
+from src.forecasting.weights import (
+    EnsembleWeights,
+    fit_binary,
+    fit_multiclass,
+    fitted,
+    load_weights,
+    save_weights,
+)
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS = ("baseline", "stats", "llm", "ensemble")
+DEFAULT_CHUNK_SIZE = 500
+_YES = {"yes", "true", "1"}
+_NO = {"no", "false", "0"}
+
+
+def outcome_index(case: dict) -> int | None:
+    """Resolved outcome: 1/0 for binary, option index for multiple choice, else ``None``."""
+    resolution = case.get("resolution")
+    qtype = case.get("type", "binary")
+    if qtype == "binary":
+        if isinstance(resolution, bool) or resolution in (0, 1):
+            return int(resolution)
+        if isinstance(resolution, str):
+            value = resolution.strip().lower()
+            if value in _YES:
+                return 1
+            if value in _NO:
+                return 0
+        return None
+    if qtype in MULTICLASS_TYPES:
+        options = case.get("options", [])
+        if resolution in options:
+            return options.index(resolution)
+        if isinstance(resolution, int) and 0 <= resolution < len(options):
+            return resolution
+    return None
+
+
+def load_cases(path: Path) -> list[dict]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data.get("results", []) if isinstance(data, dict) else data
+
+
+def cases_from_history(history, resolutions: dict[str, Any]) -> list[dict]:
+    """Build cases from the latest stored forecast of each resolved question.
+
+    ``resolutions`` maps question id to ``yes``/``no`` (binary) or an option index.
+    """
+    cases = []
+    for row in history.latest_per_question():
+        qid = str(row["question_id"])
+        if qid not in resolutions:
+            continue
+        case = {
+            "id": row["question_id"],
+            "type": row["question_type"] or "binary",
+            "resolution": resolutions[qid],
+            "llm": row.get("llm") or {},
+        }
+        if case["type"] in MULTICLASS_TYPES:
+            case["options"] = list(range(len(row.get("distribution") or [])))
+        cases.append(case)
+    return cases
+
+
+def _replay_chunk(
+    cases: list[dict], min_prob: float, max_prob: float, weights: EnsembleWeights | None = None
+) -> list[dict]:
+    baselines = [baseline_forecast(case) for case in cases]
+    stats = [
+        stats_forecast(
+            case,
+            {
+                "evidence_count": int(case.get("evidence_count", 0)),
+                "has_close_time": bool(case.get("close_time") or case.get("prediction_end_time")),
+            },
+        )
+        for case in cases
+    ]
+    llms = [case.get("llm") or {} for case in cases]
+    finals = combine_batch(cases, baselines, stats, llms, min_prob, max_prob, weights)
+    return [
+        {"baseline": b, "stats": s, "llm": llm, "ensemble": f}
+        for b, s, llm, f in zip(baselines, stats, llms, finals)
+    ]
+
+
+def replay(
+    cases: list[dict],
+    min_prob: float = constants.DEFAULT_MIN_PROB,
+    max_prob: float = constants.DEFAULT_MAX_PROB,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    weights: EnsembleWeights | None = None,
+) -> list[dict]:
+    """Component and ensemble forecasts per case, computed in chunks across processes."""
+    chunks = [cases[i : i + chunk_size] for i in range(0, len(cases), chunk_size)]
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(chunks) <= 1:
+        results = [_replay_chunk(chunk, min_prob, max_prob, weights) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(
+                pool.map(
+                    _replay_chunk, chunks, repeat(min_prob), repeat(max_prob), repeat(weights)
+                )
+            )
+    return [forecast for chunk in results for forecast in chunk]
+
+
+def _events(case: dict, outcome: int, forecast: dict) -> list[tuple[float, int]]:
+    """One-vs-rest (probability, outcome) pairs; their Brier sum is the multiclass Brier."""
+    if case.get("type", "binary") == "binary":
+        return [(float(forecast.get("probability", 0.5)), outcome)]
+    dist = forecast.get("distribution") or []
+    k = len(case.get("options", []))
+    if len(dist) != k:
+        dist = [1.0 / k] * k
+    return [(float(p), 1 if j == outcome else 0) for j, p in enumerate(dist)]
+
+
+def score(cases: list[dict], forecasts: list[dict], bins: int = 10) -> dict:
+    scored = [(c, outcome_index(c), f) for c, f in zip(cases, forecasts)]
+    scored = [(c, o, f) for c, o, f in scored if o is not None]
+    report: dict[str, Any] = {
+        "cases": len(scored),
+        "unscored": len(cases) - len(scored),
+        "components": {},
+    }
+    for component in COMPONENTS:
+        case_briers: list[float] = []
+        realized: list[float] = []
+        all_events: list[tuple[float, int]] = []
+        for case, outcome, forecast in scored:
+            events = _events(case, outcome, forecast[component])
+            probs = [p for p, _ in events]
+            hits = [o for _, o in events]
+            case_briers.append(sum(brier_all(probs, hits)))
+            realized.append(next(p for p, o in events if o == 1) if 1 in hits else 1 - probs[0])
+            all_events.extend(events)
+        n = len(scored) or 1
+        report["components"][component] = {
+            "brier": sum(case_briers) / n,
+            "log_score": sum(log_score_all(realized, [1] * len(realized))) / n,
+        }
+        if component == "ensemble":
+            report["calibration"] = calibration_curve(
+                [p for p, _ in all_events], [o for _, o in all_events], bins=bins
+            )
+    return report
+
+
+def run_backtest(
+    cases: list[dict],
+    workers: int | None = None,
+    weights: EnsembleWeights | None = None,
+    **limits: float,
+) -> dict:
+    return score(cases, replay(cases, workers=workers, weights=weights, **limits))
+
+
+def fit_weights(
+    cases: list[dict],
+    min_prob: float = constants.DEFAULT_MIN_PROB,
+    max_prob: float = constants.DEFAULT_MAX_PROB,
+    workers: int | None = None,
+) -> EnsembleWeights:
+    """Fit per-type ensemble weights on the replayed components of resolved ``cases``."""
+    forecasts = replay(cases, min_prob, max_prob, workers=workers)
+    binary: list[tuple[dict, int]] = []
+    multiclass: list[tuple[dict, int]] = []
+    for case, forecast in zip(cases, forecasts):
+        outcome = outcome_index(case)
+        if outcome is None:
+            continue
+        if case.get("type", "binary") == "binary":
+            binary.append((forecast, outcome))
+        else:
+            multiclass.append((forecast, outcome))
+
+    def _prob(forecast: dict, component: str) -> float:
+        value = forecast[component].get("probability")
+        return 0.5 if value is None else float(value)
+
+    return fitted(
+        fit_binary(
+            [_prob(f, "baseline") for f, _ in binary],
+            [_prob(f, "stats") for f, _ in binary],
+            [_prob(f, "llm") for f, _ in binary],
+            [o for _, o in binary],
+            min_prob,
+            max_prob,
+        ),
+        fit_multiclass(
+            [
+                [f[component].get("distribution") for component in ("baseline", "stats", "llm")]
+                for f, _ in multiclass
+            ],
+            [o for _, o in multiclass],
+        ),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay resolved questions offline and score them."
+    )
+    parser.add_argument("--cases", type=Path, help="JSON file of resolved questions")
+    parser.add_argument("--history", type=Path, help="forecast_history.sqlite3 to replay")
+    parser.add_argument("--resolutions", type=Path, help="JSON map of question id to outcome")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", type=Path, help="write the report JSON here")
+    parser.add_argument("--weights", type=Path, help="score with this ensemble weights artifact")
+    parser.add_argument("--fit", type=Path, help="fit ensemble weights and write them here")
+    args = parser.parse_args(argv)
+
+    if args.history:
+        from src.storage.history import ForecastHistory
+
+        resolutions = (
+            json.loads(args.resolutions.read_text(encoding="utf-8")) if args.resolutions else {}
+        )
+        history = ForecastHistory(args.history)
+        cases = cases_from_history(history, resolutions)
+        history.close()
+    else:
+        root = Path(__file__).resolve().parents[2]
+        cases = load_cases(args.cases or root / "tests" / "fixtures" / "resolved_questions.json")
+
+    if args.fit:
+        weights = fit_weights(cases, workers=args.workers)
+        save_weights(weights, args.fit)
+        logger.info("Wrote ensemble weights to %s", args.fit)
+    else:
+        weights = load_weights(args.weights) if args.weights else None
+    report = run_backtest(cases, workers=args.workers, weights=weights)
+    if weights is not None:
+        report["weights"] = weights.to_dict()
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
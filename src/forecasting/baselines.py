@@ -8,6 +8,6 @@ def baseline_forecast(question: dict) -> dict:
             return {"distribution": [1.0]}
         p = 1.0 / len(options)
         return {"distribution": [p for _ in options]}
-    if qtype in {"numeric", "date"}:
+    if qtype in {"numeric", "discrete", "date"}:
         return {"p10": 0.1, "p50": 0.5, "p90": 0.9}
     return {"probability": 0.5}
@@ -0,0 +1,218 @@
+"""Columnar forecasting operations over many questions at once.
+
+Each function takes parallel sequences (one entry per question) and returns new lists, so
+a whole question type, or many weightings of the same questions, is handled in one pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from src.forecasting.stats.continuous import Scaling, cdf_quantiles, mixture_cdfs
+
+if TYPE_CHECKING:
+    from src.forecasting.weights import EnsembleWeights
+
+QUANTILE_KEYS = ("p10", "p50", "p90")
+DEFAULT_QUANTILES = (0.1, 0.5, 0.9)
+MULTICLASS_TYPES = {"multiple_choice", "distribution"}
+
+
+def clamp_all(values: Sequence[float], low: float, high: float) -> list[float]:
+    return [max(low, min(high, v)) for v in values]
+
+
+def normalize_rows(rows: Sequence[Sequence[float]]) -> list[list[float]]:
+    out = []
+    for row in rows:
+        positive = [max(0.0, float(v)) for v in row]
+        total = sum(positive) or 1.0
+        out.append([v / total for v in positive])
+    return out
+
+
+def order_quantiles(
+    p10: Sequence[float], p50: Sequence[float], p90: Sequence[float]
+) -> tuple[list[float], list[float], list[float]]:
+    lows, mids, highs = [], [], []
+    for triple in zip(p10, p50, p90):
+        low, mid, high = sorted(triple)
+        lows.append(low)
+        mids.append(mid)
+        highs.append(high)
+    return lows, mids, highs
+
+
+def beta_update_all(
+    prior_alpha: float, prior_beta: float, positives: Sequence[int], negatives: Sequence[int]
+) -> list[float]:
+    """Posterior Beta means for many (positive, negative) evidence counts."""
+    return [
+        (prior_alpha + pos) / (prior_alpha + prior_beta + pos + neg)
+        for pos, neg in zip(positives, negatives)
+    ]
+
+
+def dirichlet_all(ks: Sequence[int], evidence_weight: float = 1.0) -> list[list[float]]:
+    """Posterior Dirichlet means for symmetric priors over ``k`` options per question."""
+    return normalize_rows([[1.0 + evidence_weight] * max(k, 1) for k in ks])
+
+
+def weighted_mean(columns: Sequence[Sequence[float]], weights: Sequence[float]) -> list[float]:
+    """Row-wise weighted mean of equally long ``columns``."""
+    total = sum(weights) or 1.0
+    return [sum(w * v for w, v in zip(weights, row)) / total for row in zip(*columns)]
+
+
+def extremize_all(probs: Sequence[float], exponent: float) -> list[float]:
+    """Push probabilities away from 0.5: ``p**a / (p**a + (1 - p)**a)``; ``a == 1`` is a no-op."""
+    if exponent == 1.0:
+        return list(probs)
+    out = []
+    for p in probs:
+        p = max(1e-9, min(1 - 1e-9, p))
+        num = p**exponent
+        out.append(num / (num + (1 - p) ** exponent))
+    return out
+
+
+def mix_distributions(
+    components: Sequence[Sequence[Sequence[float] | None]], weights: Sequence[float]
+) -> list[list[float]]:
+    """Row-wise weighted mix of per-component distributions.
+
+    ``components`` holds one row per component for each question; a component whose row is
+    missing or has a different number of options than the first present row is left out. If
+    every remaining component has zero weight, the first present row is used as is.
+    """
+    out = []
+    for rows in components:
+        present = [(w, row) for w, row in zip(weights, rows) if row]
+        if not present:
+            out.append([1.0])
+            continue
+        k = len(present[0][1])
+        present = [(w, normalize_rows([row])[0]) for w, row in present if len(row) == k]
+        weighted = [(w, row) for w, row in present if w > 0] or [(1.0, present[0][1])]
+        total = sum(w for w, _ in weighted)
+        out.append([sum(w * row[j] for w, row in weighted) / total for j in range(k)])
+    return out
+
+
+def combine_binary(
+    baseline: Sequence[float],
+    stats: Sequence[float],
+    llm: Sequence[float],
+    min_prob: float,
+    max_prob: float,
+    weights: Sequence[float] = (1.0, 1.0, 1.0),
+) -> list[float]:
+    return clamp_all(weighted_mean((baseline, stats, llm), weights), min_prob, max_prob)
+
+
+def sweep_binary(
+    baseline: Sequence[float],
+    stats: Sequence[float],
+    llm: Sequence[float],
+    weight_grid: Sequence[Sequence[float]],
+    min_prob: float,
+    max_prob: float,
+) -> list[list[float]]:
+    """Combined probabilities for every weighting in ``weight_grid`` (one row per weighting)."""
+    return [combine_binary(baseline, stats, llm, min_prob, max_prob, w) for w in weight_grid]
+
+
+def _floats(value, default: float) -> float:
+    return default if value is None else float(value)
+
+
+def combine_batch(
+    questions: Sequence[dict],
+    baselines: Sequence[dict],
+    stats: Sequence[dict],
+    llms: Sequence[dict],
+    min_prob: float,
+    max_prob: float,
+    weights: EnsembleWeights | None = None,
+) -> list[dict]:
+    """Ensemble and validate forecasts for many questions, grouped by question type.
+
+    Without ``weights`` binary components are averaged equally and multiclass questions take
+    the stats distribution; fitted weights (see ``src.forecasting.weights``) replace both.
+    Numeric, discrete and date questions with a ``scaling`` range get a ``cdf`` mixing the
+    stats and LLM quantiles (see ``src.forecasting.stats.continuous``).
+    """
+    results: list[dict] = [{} for _ in questions]
+    groups: dict[str, list[int]] = {"binary": [], "multiclass": [], "quantile": []}
+    for i, question in enumerate(questions):
+        qtype = question.get("type", "binary")
+        if qtype == "binary":
+            groups["binary"].append(i)
+        elif qtype in MULTICLASS_TYPES:
+            groups["multiclass"].append(i)
+        else:
+            groups["quantile"].append(i)
+
+    idx = groups["binary"]
+    if idx:
+        columns = (
+            [_floats(baselines[i].get("probability"), 0.5) for i in idx],
+            [_floats(stats[i].get("probability"), 0.5) for i in idx],
+            [_floats(llms[i].get("probability"), 0.5) for i in idx],
+        )
+        if weights is None:
+            probs = combine_binary(*columns, min_prob, max_prob)
+        else:
+            probs = combine_binary(*columns, 0.0, 1.0, weights.binary.weights)
+            probs = clamp_all(extremize_all(probs, weights.binary.extremize), min_prob, max_prob)
+        for i, p in zip(idx, probs):
+            results[i] = {"probability": p}
+
+    idx = groups["multiclass"]
+    if idx and weights is not None and weights.multiclass.count:
+        rows = mix_distributions(
+            [
+                [
+                    baselines[i].get("distribution"),
+                    stats[i].get("distribution"),
+                    llms[i].get("distribution"),
+                ]
+                for i in idx
+            ],
+            weights.multiclass.weights,
+        )
+        for i, row in zip(idx, rows):
+            results[i] = {"distribution": row}
+    elif idx:
+        rows = normalize_rows(
+            [stats[i].get("distribution") or baselines[i].get("distribution", [1.0]) for i in idx]
+        )
+        for i, row in zip(idx, rows):
+            results[i] = {"distribution": row}
+
+    # Questions with a range on the question's scale get a full CDF; the rest keep the
+    # ordered p10/p50/p90 triple.
+    scalings = {i: Scaling.from_question(questions[i]) for i in groups["quantile"]}
+    idx = [i for i, scaling in scalings.items() if scaling is not None]
+    if idx:
+        cdfs = mixture_cdfs([scalings[i] for i in idx], [[stats[i], llms[i]] for i in idx])
+        for i, cdf in zip(idx, cdfs):
+            if cdf is None:
+                scalings[i] = None
+                continue
+            quantiles = cdf_quantiles(cdf, scalings[i])
+            results[i] = {**dict(zip(QUANTILE_KEYS, quantiles)), "cdf": cdf}
+
+    idx = [i for i, scaling in scalings.items() if scaling is None]
+    if idx:
+        columns = [
+            [
+                _floats(llms[i].get(k, stats[i].get(k, baselines[i].get(k))), default)
+                for i in idx
+            ]
+            for k, default in zip(QUANTILE_KEYS, DEFAULT_QUANTILES)
+        ]
+        for i, triple in zip(idx, zip(*order_quantiles(*columns))):
+            results[i] = dict(zip(QUANTILE_KEYS, triple))
+    return results
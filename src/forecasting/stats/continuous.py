@@ -0,0 +1,221 @@
+"""Continuous (numeric, discrete and date) forecast distributions on the question's scale.
+
+Metaculus describes a continuous question by its ``scaling``: ``range_min``/``range_max``
+(Unix timestamps for dates), an optional ``zero_point`` that makes the axis logarithmic,
+and whether values may fall outside either bound. Forecasts are submitted as a CDF
+evaluated at evenly spaced points of the (possibly log) axis, 201 points by default.
+
+Each component forecast (stats model, LLM) gives p10/p50/p90 in question units. Quantiles
+are mapped onto the unit axis and turned into a split-normal CDF, components are averaged,
+and the mixture is adjusted to the API's constraints: zero/one at closed bounds, at least
+``OPEN_BOUND_MASS`` outside open bounds and a strictly increasing CDF. The batch functions
+take one entry per question, like ``src.forecasting.batch``, and share grids between
+questions with the same number of points.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cache
+
+CDF_POINTS = 201
+# Smallest increase between neighbouring CDF points the API accepts.
+MIN_CDF_STEP = 5e-5
+# Relative headroom over MIN_CDF_STEP so rounding cannot leave a flat step just below it.
+CDF_STEP_MARGIN = 1e-6
+# Probability mass kept below/above an open lower/upper bound.
+OPEN_BOUND_MASS = 0.001
+# Smallest mass kept inside the range when both tails are heavy.
+MIN_INBOUND_MASS = 0.1
+# Share of the in-range mass spread uniformly, so the CDF is strictly increasing.
+UNIFORM_WEIGHT = 0.01
+QUANTILE_LEVELS = (0.1, 0.5, 0.9)
+# Components whose median lies further than this (in range widths) outside the axis are
+# taken to be on the wrong scale and left out of the mixture.
+MAX_MEDIAN_OFFSET = 1.0
+# Standard normal z-score of the 90th percentile.
+Z90 = 1.2815515655446004
+
+
+def as_number(value) -> float | None:
+    """A float from a number, numeric string or ISO date (as a Unix timestamp)."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        moment = value
+    else:
+        text = str(value).strip()
+        try:
+            return float(text)
+        except ValueError:
+            pass
+        try:
+            moment = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.timestamp()
+
+
+@dataclass(frozen=True)
+class Scaling:
+    """A question's axis; ``points`` is the CDF length (outcome count + 1 for discrete)."""
+
+    range_min: float
+    range_max: float
+    zero_point: float | None = None
+    open_lower: bool = False
+    open_upper: bool = False
+    points: int = CDF_POINTS
+
+    @classmethod
+    def from_question(cls, question: dict) -> Scaling | None:
+        """The question's scaling, or ``None`` when its range is missing or empty."""
+        scaling = question.get("scaling") or {}
+
+        def field(name: str):
+            return scaling.get(name, question.get(name))
+
+        low = as_number(field("range_min"))
+        high = as_number(field("range_max"))
+        if low is None or high is None or high <= low:
+            return None
+        zero_point = as_number(field("zero_point"))
+        if zero_point is not None and low <= zero_point <= high:
+            zero_point = None
+        outcomes = field("inbound_outcome_count")
+        return cls(
+            range_min=low,
+            range_max=high,
+            zero_point=zero_point,
+            open_lower=bool(field("open_lower_bound")),
+            open_upper=bool(field("open_upper_bound")),
+            points=int(outcomes) + 1 if outcomes else CDF_POINTS,
+        )
+
+    @property
+    def _ratio(self) -> float | None:
+        if self.zero_point is None:
+            return None
+        return (self.range_max - self.zero_point) / (self.range_min - self.zero_point)
+
+    def to_unit(self, value: float) -> float:
+        """Position of ``value`` on the axis: 0 at ``range_min``, 1 at ``range_max``."""
+        share = (value - self.range_min) / (self.range_max - self.range_min)
+        ratio = self._ratio
+        if ratio is None:
+            return share
+        return math.log(max(1e-12, 1 + share * (ratio - 1))) / math.log(ratio)
+
+    def from_unit(self, x: float) -> float:
+        ratio = self._ratio
+        share = x if ratio is None else (ratio**x - 1) / (ratio - 1)
+        return self.range_min + (self.range_max - self.range_min) * share
+
+
+@cache
+def unit_grid(points: int) -> tuple[float, ...]:
+    return tuple(i / (points - 1) for i in range(points))
+
+
+def _normal_cdf(z: float) -> float:
+    return 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
+
+
+def split_normal_cdf(grid: Sequence[float], q10: float, q50: float, q90: float) -> list[float]:
+    """CDF on ``grid`` of the split normal matching three quantiles on the unit axis.
+
+    Each side of the median gets its own spread, so skewed p10/p90 intervals are kept;
+    spreads are floored at one grid step.
+    """
+    floor = 1.0 / (len(grid) - 1)
+    left = max((q50 - q10) / Z90, floor)
+    right = max((q90 - q50) / Z90, floor)
+    return [_normal_cdf((x - q50) / (left if x < q50 else right)) for x in grid]
+
+
+def _unit_quantiles(scaling: Scaling, forecast: dict) -> tuple[float, float, float] | None:
+    quantiles = forecast.get("date_quantiles") or forecast
+    values = [as_number(quantiles.get(key)) for key in ("p10", "p50", "p90")]
+    if any(v is None for v in values):
+        return None
+    low, mid, high = sorted(scaling.to_unit(v) for v in values)
+    if not -MAX_MEDIAN_OFFSET <= mid <= 1 + MAX_MEDIAN_OFFSET:
+        return None
+    return low, mid, high
+
+
+def standardize_cdf(cdf: Sequence[float], scaling: Scaling) -> list[float]:
+    """Fit ``cdf`` to the API's bound and monotonicity constraints."""
+    n = len(cdf)
+    lo = min(max(cdf[0], OPEN_BOUND_MASS), 1 - OPEN_BOUND_MASS - MIN_INBOUND_MASS)
+    lo = lo if scaling.open_lower else 0.0
+    hi = max(min(cdf[-1], 1 - OPEN_BOUND_MASS), lo + MIN_INBOUND_MASS)
+    hi = hi if scaling.open_upper else 1.0
+    span = cdf[-1] - cdf[0]
+    grid = unit_grid(n)
+    shape = [(c - cdf[0]) / span for c in cdf] if span > 1e-9 else list(grid)
+    min_step = MIN_CDF_STEP * (1 + CDF_STEP_MARGIN)
+    uniform = min(1.0, max(UNIFORM_WEIGHT, min_step * (n - 1) / (hi - lo)))
+    return [lo + (hi - lo) * ((1 - uniform) * s + uniform * x) for s, x in zip(shape, grid)]
+
+
+def mixture_cdfs(
+    scalings: Sequence[Scaling],
+    components: Sequence[Sequence[dict | None]],
+    weights: Sequence[float] | None = None,
+) -> list[list[float] | None]:
+    """Standardized mixture CDFs, one per question.
+
+    ``components`` holds each question's component forecasts (dicts with p10/p50/p90 or
+    ``date_quantiles``) in the order of ``weights``; components without usable quantiles
+    or off the question's scale are left out, and a question with none gets ``None``.
+    """
+    out: list[list[float] | None] = []
+    for scaling, forecasts in zip(scalings, components):
+        grid = unit_grid(scaling.points)
+        mixed = [0.0] * len(grid)
+        total = 0.0
+        for weight, forecast in zip(weights or [1.0] * len(forecasts), forecasts):
+            quantiles = _unit_quantiles(scaling, forecast) if forecast and weight > 0 else None
+            if quantiles is None:
+                continue
+            total += weight
+            for j, c in enumerate(split_normal_cdf(grid, *quantiles)):
+                mixed[j] += weight * c
+        if not total:
+            out.append(None)
+            continue
+        out.append(standardize_cdf([c / total for c in mixed], scaling))
+    return out
+
+
+def cdf_quantiles(
+    cdf: Sequence[float], scaling: Scaling, levels: Sequence[float] = QUANTILE_LEVELS
+) -> list[float]:
+    """Values in question units at which ``cdf`` reaches each level, clipped to the range."""
+    grid = unit_grid(len(cdf))
+    values = []
+    for level in levels:
+        j = bisect_left(cdf, level)
+        if j == 0:
+            x = 0.0
+        elif j >= len(cdf):
+            x = 1.0
+        else:
+            c0, c1 = cdf[j - 1], cdf[j]
+            x = grid[j - 1] + (grid[j] - grid[j - 1]) * (level - c0) / ((c1 - c0) or 1.0)
+        values.append(scaling.from_unit(x))
+    return values
+
+
+def prior_quantiles(scaling: Scaling) -> dict:
+    """A wide prior spanning the range: p10/p50/p90 at 10%, 50% and 90% of the axis."""
+    return dict(zip(("p10", "p50", "p90"), (scaling.from_unit(x) for x in QUANTILE_LEVELS)))
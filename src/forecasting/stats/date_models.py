@@ -1,8 +1,22 @@
-from datetime import datetime, timedelta, timezone
+from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 
-def forecast_date(days_out: int = 30) -> dict:
-    center = datetime.now(timezone.utc) + timedelta(days=days_out)
+from src.forecasting.stats.continuous import QUANTILE_LEVELS, Scaling
+
+
+def forecast_date(days_out: int = 30, scaling: Scaling | None = None) -> dict:
+    now = datetime.now(UTC)
+    if scaling is not None:
+        # Spread the quantiles over the part of the range that is still in the future.
+        start = min(max(scaling.to_unit(now.timestamp()), 0.0), 1.0)
+        return {
+            key: datetime.fromtimestamp(
+                scaling.from_unit(start + (1 - start) * level), UTC
+            ).isoformat()
+            for key, level in zip(("p10", "p50", "p90"), QUANTILE_LEVELS)
+        }
+    center = now + timedelta(days=days_out)
     return {
         "p10": (center - timedelta(days=10)).isoformat(),
         "p50": center.isoformat(),
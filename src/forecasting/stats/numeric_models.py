@@ -1,4 +1,11 @@
-def forecast_numeric(values: list[float] | None = None) -> dict:
+from __future__ import annotations
+
+from src.forecasting.stats.continuous import Scaling, prior_quantiles
+
+
+def forecast_numeric(values: list[float] | None = None, scaling: Scaling | None = None) -> dict:
+    if not values and scaling is not None:
+        return prior_quantiles(scaling)
     values = values or [0.2, 0.5, 0.8]
     values = sorted(values)
     return {"p10": values[0], "p50": values[len(values)//2], "p90": values[-1]}
@@ -8,3 +8,34 @@ def brier(prob: float, outcome: int) -> float:
 def log_score(prob: float, outcome: int) -> float:
     p = max(1e-9, min(1 - 1e-9, prob))
     return -math.log(p if outcome else 1 - p)
+
+
+def brier_all(probs: list[float], outcomes: list[int]) -> list[float]:
+    return [(p - o) ** 2 for p, o in zip(probs, outcomes)]
+
+
+def log_score_all(probs: list[float], outcomes: list[int]) -> list[float]:
+    return [log_score(p, o) for p, o in zip(probs, outcomes)]
+
+
+def calibration_curve(probs: list[float], outcomes: list[int], bins: int = 10) -> list[dict]:
+    """Reliability table: mean forecast vs observed frequency per equal-width bin."""
+    counts = [0] * bins
+    forecast_sums = [0.0] * bins
+    hit_sums = [0] * bins
+    for p, o in zip(probs, outcomes):
+        b = min(int(p * bins), bins - 1)
+        counts[b] += 1
+        forecast_sums[b] += p
+        hit_sums[b] += o
+    return [
+        {
+            "bin_low": b / bins,
+            "bin_high": (b + 1) / bins,
+            "count": counts[b],
+            "mean_forecast": forecast_sums[b] / counts[b],
+            "observed_rate": hit_sums[b] / counts[b],
+        }
+        for b in range(bins)
+        if counts[b]
+    ]
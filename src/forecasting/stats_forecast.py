@@ -0,0 +1,19 @@
+from src.forecasting.stats.binary_models import forecast_binary
+from src.forecasting.stats.continuous import Scaling
+from src.forecasting.stats.date_models import forecast_date
+from src.forecasting.stats.multiclass_models import dirichlet_update
+from src.forecasting.stats.numeric_models import forecast_numeric
+
+
+def stats_forecast(question: dict, features: dict) -> dict:
+    qtype = question.get("type", "binary")
+    if qtype == "binary":
+        return forecast_binary(features)
+    if qtype in {"multiple_choice", "distribution"}:
+        return dirichlet_update(len(question.get("options", [])))
+    if qtype in {"numeric", "discrete"}:
+        return forecast_numeric(scaling=Scaling.from_question(question))
+    if qtype == "date":
+        dateq = forecast_date(scaling=Scaling.from_question(question))
+        return {"p10": 0.2, "p50": 0.5, "p90": 0.8, "date_quantiles": dateq}
+    return {"probability": 0.5}
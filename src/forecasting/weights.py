@@ -0,0 +1,179 @@
+"""Per-question-type ensemble weights fitted on resolved forecasts.
+
+Weights are searched on a grid over the (baseline, stats, llm) simplex, with an optional
+extremizing exponent for binary questions, minimizing mean Brier score. The result is stored
+as a versioned JSON artifact that ``run_once`` loads at startup; with no artifact (or one
+from an older version) ``combine`` keeps its equal-weight defaults.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from src.config.timezone import now_utc
+from src.forecasting.batch import clamp_all, extremize_all, mix_distributions, sweep_binary
+from src.forecasting.stats.scoring import brier_all, log_score_all
+
+logger = logging.getLogger(__name__)
+
+WEIGHTS_VERSION = 1
+DEFAULT_WEIGHTS_PATH = Path("data/ensemble_weights.json")
+COMPONENTS = ("baseline", "stats", "llm")
+DEFAULT_GRID_STEP = 0.1
+DEFAULT_EXPONENTS = (1.0, 1.25, 1.5, 2.0)
+
+
+@dataclass(frozen=True)
+class TypeWeights:
+    weights: tuple[float, float, float] = (1.0, 1.0, 1.0)
+    extremize: float = 1.0
+    count: int = 0
+    brier: float | None = None
+    log_score: float | None = None
+
+
+@dataclass(frozen=True)
+class EnsembleWeights:
+    binary: TypeWeights = field(default_factory=TypeWeights)
+    multiclass: TypeWeights = field(default_factory=TypeWeights)
+    version: int = WEIGHTS_VERSION
+    fitted_at: str = ""
+
+    def to_dict(self) -> dict:
+        return {"components": list(COMPONENTS), **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> EnsembleWeights:
+        def _type(raw: dict | None) -> TypeWeights:
+            raw = raw or {}
+            return TypeWeights(
+                weights=tuple(float(w) for w in raw.get("weights", (1.0, 1.0, 1.0))),
+                extremize=float(raw.get("extremize", 1.0)),
+                count=int(raw.get("count", 0)),
+                brier=raw.get("brier"),
+                log_score=raw.get("log_score"),
+            )
+
+        return cls(
+            binary=_type(data.get("binary")),
+            multiclass=_type(data.get("multiclass")),
+            version=int(data.get("version", 0)),
+            fitted_at=str(data.get("fitted_at", "")),
+        )
+
+
+def simplex_grid(step: float = DEFAULT_GRID_STEP) -> list[tuple[float, float, float]]:
+    """All (baseline, stats, llm) weightings on a ``step`` grid that sum to one."""
+    n = round(1 / step)
+    return [(i / n, j / n, (n - i - j) / n) for i in range(n + 1) for j in range(n + 1 - i)]
+
+
+def _mean(values: Sequence[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def fit_binary(
+    baseline: Sequence[float],
+    stats: Sequence[float],
+    llm: Sequence[float],
+    outcomes: Sequence[int],
+    min_prob: float,
+    max_prob: float,
+    step: float = DEFAULT_GRID_STEP,
+    exponents: Sequence[float] = DEFAULT_EXPONENTS,
+) -> TypeWeights:
+    """Weights and extremizing exponent with the lowest mean Brier score.
+
+    Ties keep the earlier candidate, and the equal-weight default is scored first, so it is
+    only replaced by a strictly better fit.
+    """
+    if not outcomes:
+        return TypeWeights()
+    grid = [(1.0, 1.0, 1.0), *simplex_grid(step)]
+    mixed = sweep_binary(baseline, stats, llm, grid, 0.0, 1.0)
+    best: tuple[float, tuple[float, float, float], float, list[float]] | None = None
+    for exponent in (1.0, *[e for e in exponents if e != 1.0]):
+        for weights, probs in zip(grid, mixed):
+            final = clamp_all(extremize_all(probs, exponent), min_prob, max_prob)
+            score = _mean(brier_all(final, outcomes))
+            if best is None or score < best[0] - 1e-12:
+                best = (score, weights, exponent, final)
+    score, weights, exponent, final = best
+    return TypeWeights(
+        weights=weights,
+        extremize=exponent,
+        count=len(outcomes),
+        brier=score,
+        log_score=_mean(log_score_all(final, outcomes)),
+    )
+
+
+def fit_multiclass(
+    rows: Sequence[Sequence[Sequence[float] | None]],
+    outcomes: Sequence[int],
+    step: float = DEFAULT_GRID_STEP,
+) -> TypeWeights:
+    """Mixing weights for (baseline, stats, llm) distributions by mean multiclass Brier.
+
+    ``rows`` holds the three component distributions per question and ``outcomes`` the index
+    of the option that resolved.
+    """
+    if not outcomes:
+        return TypeWeights()
+    best: tuple[float, tuple[float, float, float], list[list[float]]] | None = None
+    for weights in [(0.0, 1.0, 0.0), *simplex_grid(step)]:
+        mixed = mix_distributions(rows, weights)
+        score = _mean(
+            [
+                sum(brier_all(dist, [int(j == o) for j in range(len(dist))]))
+                for dist, o in zip(mixed, outcomes)
+            ]
+        )
+        if best is None or score < best[0] - 1e-12:
+            best = (score, weights, mixed)
+    score, weights, mixed = best
+    realized = [dist[o] if o < len(dist) else 0.0 for dist, o in zip(mixed, outcomes)]
+    return TypeWeights(
+        weights=weights,
+        count=len(outcomes),
+        brier=score,
+        log_score=_mean(log_score_all(realized, [1] * len(realized))),
+    )
+
+
+def load_weights(path: Path = DEFAULT_WEIGHTS_PATH) -> EnsembleWeights | None:
+    """The stored artifact, or ``None`` when it is missing, unreadable or of another version."""
+    if not path.exists():
+        return None
+    try:
+        weights = EnsembleWeights.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        logger.warning("Ignoring unreadable ensemble weights %s: %s", path, e)
+        return None
+    if weights.version != WEIGHTS_VERSION:
+        logger.warning(
+            "Ignoring ensemble weights %s: version %s, expected %s",
+            path,
+            weights.version,
+            WEIGHTS_VERSION,
+        )
+        return None
+    return weights
+
+
+def save_weights(weights: EnsembleWeights, path: Path = DEFAULT_WEIGHTS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(weights.to_dict(), indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def fitted(binary: TypeWeights, multiclass: TypeWeights) -> EnsembleWeights:
+    return EnsembleWeights(
+        binary=binary, multiclass=multiclass, fitted_at=now_utc().isoformat(timespec="seconds")
+    )
@@ -0,0 +1,138 @@
+"""Concurrent multi-model fan-out for a single LLM role.
+
+``ForecasterFanout`` exposes the same ``chat_json`` call as ``OpenRouterClient`` so it can be
+handed to ``run_roles`` for the forecaster role. Every configured model is asked at once and
+the call waits at most ``budget_seconds``: it returns as soon as every model has answered,
+or at the deadline with the answers in hand, provided at least ``quorum`` models answered.
+Requests still in flight are then cancelled through the clients' ``cancel`` event, so
+streamed completions stop instead of running on in the background.
+"""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from src.llm.structured import parse_strict_json
+
+logger = logging.getLogger(__name__)
+
+AGGREGATES = ("median", "trimmed_mean")
+NUMERIC_KEYS = ("probability", "p10", "p50", "p90")
+
+
+def trimmed_mean(values: Sequence[float], trim: float = 0.2) -> float:
+    """Mean after dropping ``trim`` of the values from each end (at least one value is kept)."""
+    ordered = sorted(values)
+    cut = min(int(len(ordered) * trim), (len(ordered) - 1) // 2)
+    kept = ordered[cut : len(ordered) - cut]
+    return sum(kept) / len(kept)
+
+
+def aggregate_outputs(
+    outputs: Sequence[dict], method: str = "median", trim: float = 0.2
+) -> dict:
+    """Combine per-model forecaster outputs key by key.
+
+    Probabilities and quantiles are reduced with ``method``; distributions are reduced
+    option by option (only those matching the most common length) and renormalized. Other
+    fields are taken from the first output.
+    """
+    if method not in AGGREGATES:
+        raise ValueError(f"Unknown aggregate {method!r}; expected one of {AGGREGATES}")
+
+    def reduce(values: list[float]) -> float:
+        return statistics.median(values) if method == "median" else trimmed_mean(values, trim)
+
+    merged = dict(outputs[0]) if outputs else {}
+    for key in NUMERIC_KEYS:
+        values = []
+        for output in outputs:
+            try:
+                values.append(float(output[key]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        if values:
+            merged[key] = reduce(values)
+
+    rows = [o["distribution"] for o in outputs if isinstance(o.get("distribution"), list)]
+    if rows:
+        k = statistics.mode(len(row) for row in rows)
+        rows = [row for row in rows if len(row) == k]
+        column = [reduce([float(row[j]) for row in rows]) for j in range(k)]
+        total = sum(column) or 1.0
+        merged["distribution"] = [v / total for v in column]
+    return merged
+
+
+class ForecasterFanout:
+    """Ask several LLM clients the same question and aggregate their JSON answers."""
+
+    def __init__(
+        self,
+        clients: Sequence,
+        quorum: int,
+        budget_seconds: float,
+        aggregate: str = "median",
+        trim: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate {aggregate!r}; expected one of {AGGREGATES}")
+        self.clients = list(clients)
+        self.quorum = max(1, min(quorum, len(self.clients)))
+        self.budget_seconds = budget_seconds
+        self.aggregate = aggregate
+        self.trim = trim
+        self._clock = clock
+
+    def chat_json(self, prompt: str, system_prompt: str | None = None) -> dict:
+        deadline = self._clock() + self.budget_seconds
+        cancel = threading.Event()
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.clients)), thread_name_prefix="metacbot-fanout"
+        )
+        running: dict[Future, str] = {
+            pool.submit(client.chat_json, prompt, system_prompt, cancel=cancel): getattr(
+                client, "model", "?"
+            )
+            for client in self.clients
+        }
+        answers: list[tuple[str, dict]] = []
+        try:
+            while running:
+                timeout = max(0.0, deadline - self._clock())
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    model = running.pop(future)
+                    try:
+                        answers.append((model, parse_strict_json(future.result())))
+                    except (RuntimeError, ValueError) as exc:
+                        logger.warning("Forecaster model %s failed: %s", model, exc)
+        finally:
+            cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if running:
+            logger.info(
+                "Forecaster fan-out returned with %d/%d models; cancelled %s",
+                len(answers),
+                len(self.clients),
+                sorted(running.values()),
+            )
+        if not answers:
+            raise RuntimeError("All forecaster models failed")
+        if len(answers) < self.quorum:
+            raise RuntimeError(
+                f"Only {len(answers)}/{self.quorum} forecaster models answered within "
+                f"{self.budget_seconds:g}s"
+            )
+        merged = aggregate_outputs([a for _, a in answers], self.aggregate, self.trim)
+        merged["models"] = [model for model, _ in answers]
+        return merged
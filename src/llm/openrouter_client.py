@@ -1,28 +1,68 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import threading
 import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Any
-from urllib import request
 from urllib.error import HTTPError, URLError
 
 from src.config.settings import Settings
+from src.execution.timing import percentile
+from src.llm.structured import IncrementalJSONParser
+from src.net.transport import HTTPTransport, iter_sse_data
+from src.storage.disk_cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
 # Default model - OpenRouter free tier
 DEFAULT_MODEL = "openrouter/auto"
+# Hedge after the observed p95 latency once this many calls have completed.
+HEDGE_MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+
+class AbandonedRequest(Exception):
+    """Raised inside a hedged attempt whose sibling has already answered."""
+
+
+class MalformedResponse(RuntimeError):
+    """The provider answered, but its reply could not be parsed."""
+
+
+def _json_content(content: str):
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        raise MalformedResponse(f"OpenRouter API request failed: invalid JSON content: {e}") from e
 
 
 class OpenRouterClient:
     """Client for OpenRouter API following official Metaculus template patterns."""
 
-    def __init__(self, settings: Settings, model: str | None = None, temperature: float = 0.3):
+    def __init__(
+        self,
+        settings: Settings,
+        model: str | None = None,
+        temperature: float = 0.3,
+        transport: HTTPTransport | None = None,
+        cache: DiskCache | None = None,
+    ):
         self.settings = settings
+        self.transport = transport or HTTPTransport.from_settings(settings)
+        self.cache = cache
         self.model = model or DEFAULT_MODEL
         self.temperature = temperature
+        self.stream = settings.llm_stream
+        self.deadline_seconds = settings.llm_deadline_seconds
+        self.hedge_after_seconds = settings.llm_hedge_after_seconds
         self._base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._latency_lock = threading.Lock()
 
     def _build_headers(self) -> dict[str, str]:
         """Build request headers for OpenRouter API."""
@@ -53,6 +93,8 @@ class OpenRouterClient:
         }
         if response_format:
             body["response_format"] = response_format
+        if self.stream:
+            body["stream"] = True
 
         return json.dumps(body).encode("utf-8")
 
@@ -63,6 +105,156 @@ class OpenRouterClient:
         except (KeyError, IndexError, TypeError) as e:
             raise ValueError(f"Unexpected response format: {e}") from e
 
+    def _complete(
+        self, body: bytes, json_mode: bool = False, abandon: threading.Event | None = None
+    ) -> str:
+        """POST a completion request and return the message content.
+
+        The whole call, hedged attempts and transport retries included, is bounded by
+        ``deadline_seconds``. Once ``abandon`` is set, attempts stop at the next streamed
+        chunk and no new attempt is started.
+        """
+        deadline = time.monotonic() + self.deadline_seconds if self.deadline_seconds > 0 else None
+        try:
+            return self._hedged(
+                lambda cancel: self._attempt(body, json_mode, deadline, cancel, abandon)
+            )
+        except ValueError as e:
+            raise MalformedResponse(f"OpenRouter API request failed: {e}") from e
+        except (HTTPError, URLError, TimeoutError) as e:
+            raise RuntimeError(f"OpenRouter API request failed: {e}") from e
+
+    def _complete_parsed(
+        self,
+        body: bytes,
+        parse: Callable[[str], Any],
+        json_mode: bool = False,
+        abandon: threading.Event | None = None,
+    ):
+        """``parse`` the completion of ``body``, asking again when the reply is malformed.
+
+        Up to ``settings.retries`` replies are requested. Transport failures are retried by
+        the transport's own policy and are not repeated here.
+        """
+        attempts = max(1, self.settings.retries)
+        for attempt in range(1, attempts + 1):
+            try:
+                return parse(self._complete(body, json_mode, abandon))
+            except MalformedResponse as e:
+                if attempt == attempts:
+                    raise
+                logger.debug("Malformed OpenRouter reply on attempt %d: %s", attempt, e)
+
+    def _attempt(
+        self,
+        body: bytes,
+        json_mode: bool,
+        deadline: float | None,
+        cancel: threading.Event,
+        abandon: threading.Event | None = None,
+    ) -> str:
+        if abandon is not None and abandon.is_set():
+            raise AbandonedRequest("abandoned by the caller")
+        started = time.monotonic()
+        if self.stream:
+            content = self._stream_content(body, json_mode, deadline, cancel, abandon)
+        else:
+            response = self.transport.request(
+                "POST", self._base_url, headers=self._build_headers(), body=body, deadline=deadline
+            )
+            content = self._parse_response(response.json())
+        with self._latency_lock:
+            self._latencies.append(time.monotonic() - started)
+        return content
+
+    def _stream_content(
+        self,
+        body: bytes,
+        json_mode: bool,
+        deadline: float | None,
+        cancel: threading.Event,
+        abandon: threading.Event | None = None,
+    ) -> str:
+        """Read an SSE completion; in JSON mode stop as soon as the object is complete."""
+        parser = IncrementalJSONParser() if json_mode else None
+        parts: list[str] = []
+        with self.transport.stream(
+            "POST", self._base_url, headers=self._build_headers(), body=body, deadline=deadline
+        ) as response:
+            for data in iter_sse_data(response.lines()):
+                if cancel.is_set():
+                    raise AbandonedRequest("superseded by a hedged request")
+                if abandon is not None and abandon.is_set():
+                    raise AbandonedRequest("abandoned by the caller")
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError("OpenRouter deadline exceeded while streaming")
+                if data == "[DONE]":
+                    break
+                chunk = json.loads(data)
+                if "error" in chunk:
+                    raise ValueError(f"stream error: {chunk['error']}")
+                try:
+                    delta = chunk["choices"][0].get("delta", {}).get("content") or ""
+                except (KeyError, IndexError, TypeError, AttributeError) as e:
+                    raise ValueError(f"Unexpected stream chunk: {e}") from e
+                parts.append(delta)
+                if parser is not None:
+                    complete = parser.feed(delta)
+                    if complete is not None:
+                        return complete
+        return "".join(parts)
+
+    def _hedge_delay(self) -> float | None:
+        if self.hedge_after_seconds <= 0:
+            return None
+        with self._latency_lock:
+            samples = list(self._latencies)
+        if len(samples) >= HEDGE_MIN_SAMPLES:
+            return percentile(samples, 95)
+        return self.hedge_after_seconds
+
+    def _hedged(self, attempt: Callable[[threading.Event], str]) -> str:
+        """Run ``attempt``; if it is still pending after the hedge delay, start a second one
+        and return whichever succeeds first."""
+        cancel = threading.Event()
+        delay = self._hedge_delay()
+        if delay is None:
+            return attempt(cancel)
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="metacbot-hedge")
+        try:
+            pending = {pool.submit(attempt, cancel)}
+            done, pending = wait(pending, timeout=delay)
+            if not done:
+                logger.debug("Hedging OpenRouter request after %.2fs", delay)
+                pending.add(pool.submit(attempt, cancel))
+            error: Exception | None = None
+            while done or pending:
+                for future in done:
+                    try:
+                        return future.result()
+                    except (HTTPError, URLError, ValueError, TimeoutError) as exc:
+                        error = exc
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            raise error
+        finally:
+            cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _cache_key(self, kind: str, prompt: str, system_prompt: str | None) -> str:
+        prompt_digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return DiskCache.key_for(
+            kind, self.model, repr(self.temperature), system_prompt or "", prompt_digest
+        )
+
+    def _cached(self, key: str):
+        return None if self.cache is None else self.cache.get(key)
+
+    def _store(self, key: str, value) -> None:
+        if self.cache is not None:
+            self.cache.put(key, value)
+
     def chat(
         self,
         prompt: str,
@@ -72,58 +264,36 @@ class OpenRouterClient:
         if not self.settings.openrouter_api_key:
             raise RuntimeError("OPENROUTER_API_KEY is required for OpenRouter API requests")
 
-        body = self._build_request_body(prompt, system_prompt)
-        req = request.Request(
-            self._base_url,
-            method="POST",
-            data=body,
-            headers=self._build_headers(),
-        )
+        key = self._cache_key("text", prompt, system_prompt)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        content = self._complete_parsed(self._build_request_body(prompt, system_prompt), str)
+        self._store(key, content)
+        return content
 
-        last_error: Exception | None = None
-        for attempt in range(self.settings.retries):
-            try:
-                with request.urlopen(req, timeout=self.settings.timeout_seconds) as resp:
-                    data = json.loads(resp.read().decode("utf-8"))
-                    return self._parse_response(data)
-            except (HTTPError, URLError, TimeoutError, json.JSONDecodeError, ValueError) as e:
-                last_error = e
-                logger.debug("OpenRouter attempt %d failed: %s", attempt + 1, e)
-                if attempt < self.settings.retries - 1:
-                    time.sleep(2**attempt)
-
-        # All retries failed
-        raise RuntimeError(f"OpenRouter API request failed after {self.settings.retries} attempts") from last_error
-
-    def chat_json(self, prompt: str, system_prompt: str | None = None) -> dict:
-        """Make a chat completion request and return parsed JSON."""
+    def chat_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        cancel: threading.Event | None = None,
+    ) -> dict:
+        """Make a chat completion request and return parsed JSON.
+
+        Setting ``cancel`` abandons the request; streamed responses stop at the next chunk.
+        """
         if not self.settings.openrouter_api_key:
             raise RuntimeError("OPENROUTER_API_KEY is required for OpenRouter API requests")
 
+        key = self._cache_key("json", prompt, system_prompt)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         body = self._build_request_body(
             prompt,
             system_prompt,
             response_format={"type": "json_object"},
         )
-        req = request.Request(
-            self._base_url,
-            method="POST",
-            data=body,
-            headers=self._build_headers(),
-        )
-
-        last_error: Exception | None = None
-        for attempt in range(self.settings.retries):
-            try:
-                with request.urlopen(req, timeout=self.settings.timeout_seconds) as resp:
-                    data = json.loads(resp.read().decode("utf-8"))
-                    content = self._parse_response(data)
-                    return json.loads(content)
-            except (HTTPError, URLError, TimeoutError, json.JSONDecodeError, ValueError) as e:
-                last_error = e
-                logger.debug("OpenRouter attempt %d failed: %s", attempt + 1, e)
-                if attempt < self.settings.retries - 1:
-                    time.sleep(2**attempt)
-
-        # All retries failed
-        raise RuntimeError(f"OpenRouter API request failed after {self.settings.retries} attempts") from last_error
+        parsed = self._complete_parsed(body, _json_content, json_mode=True, abandon=cancel)
+        self._store(key, parsed)
+        return parsed
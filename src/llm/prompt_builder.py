@@ -0,0 +1,89 @@
+"""Prompt assembly for the LLM roles.
+
+Every role prompt starts with the same question-and-evidence prefix, followed by the role's
+template and any dependency outputs, so providers that cache prompt prefixes can reuse the
+shared part across the roles of one question. Evidence snippets are packed in rank order
+under a token budget estimated locally.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import cache
+from pathlib import Path
+
+from src.config.constants import DEFAULT_PROMPT_EVIDENCE_TOKENS
+from src.research.evidence import EvidenceBundle, EvidenceItem
+
+PROMPT_DIR = Path(__file__).parent / "prompts"
+# Below this many tokens a truncated snippet carries too little to be worth including.
+MIN_SNIPPET_TOKENS = 16
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English prose)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@cache
+def load_template(name: str) -> str:
+    """Role template text, read from disk once per process."""
+    path = PROMPT_DIR / f"{name}.md"
+    if not path.exists():
+        path = PROMPT_DIR / "default.md"
+    return path.read_text(encoding="utf-8").strip()
+
+
+def _render_item(item: EvidenceItem, snippet: str) -> str:
+    return f"[{item.idx}] {item.title} ({item.url})\n{snippet}".rstrip()
+
+
+def pack_evidence(items: list[EvidenceItem], budget_tokens: int) -> list[str]:
+    """Render items best-first until ``budget_tokens`` is used up.
+
+    An item that does not fit whole is included with a truncated snippet when enough
+    budget remains, and packing stops there.
+    """
+    packed: list[str] = []
+    remaining = budget_tokens
+    for item in sorted(items, key=lambda i: i.score, reverse=True):
+        block = _render_item(item, item.snippet)
+        cost = estimate_tokens(block) + 1
+        if cost <= remaining:
+            packed.append(block)
+            remaining -= cost
+            continue
+        header = _render_item(item, "")
+        room = (remaining - 1) * CHARS_PER_TOKEN - len(header) - 1
+        if room >= MIN_SNIPPET_TOKENS * CHARS_PER_TOKEN:
+            packed.append(_render_item(item, item.snippet[: room - 3] + "..."))
+        break
+    return packed
+
+
+def shared_prefix(
+    question: dict,
+    evidence: EvidenceBundle,
+    budget_tokens: int = DEFAULT_PROMPT_EVIDENCE_TOKENS,
+) -> str:
+    lines = [
+        f"Question: {question.get('title')}",
+        f"Type: {question.get('type', 'binary')}",
+    ]
+    if question.get("options"):
+        lines.append(f"Options: {json.dumps(question['options'], ensure_ascii=False)}")
+    lines.append(f"Evidence count: {len(evidence.items)}")
+    packed = pack_evidence(evidence.items, budget_tokens)
+    if packed:
+        lines.append("Evidence:")
+        lines.extend(packed)
+    return "\n".join(lines)
+
+
+def role_prompt(name: str, prefix: str, inputs: dict[str, dict]) -> str:
+    parts = [prefix, "", load_template(name)]
+    for dependency, output in inputs.items():
+        if output:
+            parts.append(f"{dependency.capitalize()} output: {json.dumps(output, sort_keys=True)}")
+    return "\n".join(parts)
@@ -1,23 +1,48 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
+from src.config.constants import DEFAULT_PROMPT_EVIDENCE_TOKENS
+from src.execution.timing import Profiler, timed
+from src.llm.prompt_builder import role_prompt, shared_prefix
 from src.llm.structured import parse_strict_json
 
-PROMPT_DIR = Path(__file__).parent / "prompts"
 logger = logging.getLogger(__name__)
 
+# Each role lists the roles whose outputs it consumes. Roles without pending dependencies
+# run concurrently; a dependent role starts as soon as all of its inputs are available.
+ROLE_GRAPH: dict[str, tuple[str, ...]] = {
+    "researcher": (),
+    "parser": (),
+    "summarizer": (),
+    "forecaster": ("summarizer",),
+}
 
-def _prompt(name: str) -> str:
-    return (PROMPT_DIR / f"{name}.md").read_text(encoding="utf-8")
 
+def run_roles(
+    question: dict,
+    evidence,
+    llm_client,
+    graph: dict[str, tuple[str, ...]] = ROLE_GRAPH,
+    profiler: Profiler | None = None,
+    role_clients: dict | None = None,
+    evidence_tokens: int = DEFAULT_PROMPT_EVIDENCE_TOKENS,
+) -> dict:
+    """Run every role in ``graph`` and return their parsed outputs keyed by role name.
 
-def run_roles(question: dict, evidence, llm_client) -> dict:
-    base = f"Question: {question.get('title')}\nEvidence count: {len(evidence.items)}"
-    def _safe_role(name: str) -> dict:
+    ``role_clients`` overrides ``llm_client`` for individual roles (for example a
+    multi-model fan-out for the forecaster). Every prompt starts with the same question and
+    evidence prefix, holding at most ``evidence_tokens`` of evidence snippets.
+    """
+    role_clients = role_clients or {}
+    prefix = shared_prefix(question, evidence, evidence_tokens)
+
+    def _safe_role(name: str, inputs: dict[str, dict]) -> dict:
         try:
-            return parse_strict_json(llm_client.chat_json(_prompt(name) + "\n" + base))
+            with timed(profiler, f"llm.{name}", question.get("id")):
+                client = role_clients.get(name, llm_client)
+                return parse_strict_json(client.chat_json(role_prompt(name, prefix, inputs)))
         except Exception as exc:
             logger.warning(
                 "Failed to execute LLM role \"%s\" for question_id=%s: %s",
@@ -27,13 +52,26 @@ def run_roles(question: dict, evidence, llm_client) -> dict:
             )
             return {}
 
-    researcher = _safe_role("researcher")
-    parser = _safe_role("parser")
-    summarizer = _safe_role("summarizer")
-    forecaster = _safe_role("forecaster")
-    return {
-        "researcher": researcher,
-        "parser": parser,
-        "summarizer": summarizer,
-        "forecaster": forecaster,
-    }
+    outputs: dict[str, dict] = {}
+    remaining = dict(graph)
+    running: dict[Future, str] = {}
+    workers = max(1, len(graph))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="metacbot-role") as pool:
+
+        def _launch_ready() -> None:
+            for name, dependencies in list(remaining.items()):
+                if all(dep in outputs for dep in dependencies):
+                    del remaining[name]
+                    inputs = {dep: outputs[dep] for dep in dependencies}
+                    running[pool.submit(_safe_role, name, inputs)] = name
+
+        _launch_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                outputs[running.pop(future)] = future.result()
+            _launch_ready()
+
+    if remaining:
+        raise ValueError(f"Unresolvable LLM role dependencies: {sorted(remaining)}")
+    return {name: outputs[name] for name in graph}
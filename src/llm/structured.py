@@ -17,3 +17,43 @@ def parse_strict_json(raw: str | dict, retries: int = 2) -> dict:
                 continue
             candidate = match.group(0)
     raise ValueError("Could not parse strict JSON")
+
+
+class IncrementalJSONParser:
+    """Find the first complete top-level JSON object in text that arrives in pieces.
+
+    ``feed`` returns the object's text once its closing brace has been seen, so a streamed
+    completion can be cut off without waiting for whatever the model sends afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: list[str] = []
+        self._start: int | None = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._seen = 0
+
+    def feed(self, chunk: str) -> str | None:
+        self._buffer.append(chunk)
+        for offset, char in enumerate(chunk):
+            position = self._seen + offset
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"' and self._start is not None:
+                self._in_string = True
+            elif char == "{":
+                if self._start is None:
+                    self._start = position
+                self._depth += 1
+            elif char == "}" and self._start is not None:
+                self._depth -= 1
+                if self._depth == 0:
+                    return "".join(self._buffer)[self._start : position + 1]
+        self._seen += len(chunk)
+        return None
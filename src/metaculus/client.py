@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import json
 import logging
-import time
+from collections.abc import Iterator
 from typing import Any
-from urllib import request
 from urllib.error import HTTPError, URLError
 
 from src.config.settings import Settings
+from src.metaculus.snapshots import QuestionSnapshotStore
+from src.net.transport import HTTPTransport, Response
 
 BASE_URL = "https://www.metaculus.com/api"
 BASE_URL_V2 = "https://www.metaculus.com/api2"
@@ -40,6 +41,9 @@ def _format_payload_for_api(question: dict, forecast: dict) -> dict:
         dist = forecast.get("distribution", [])
         return {"probability_yes_per_category": dist}
 
+    if qtype in {"numeric", "discrete", "date"} and forecast.get("cdf"):
+        return {"continuous_cdf": forecast["cdf"]}
+
     if qtype in {"numeric", "discrete"}:
         p10 = forecast.get("p10", DEFAULT_P10)
         p50 = forecast.get("p50", DEFAULT_P50)
@@ -58,8 +62,9 @@ def _format_payload_for_api(question: dict, forecast: dict) -> dict:
 
 
 class MetaculusClient:
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, transport: HTTPTransport | None = None):
         self.settings = settings
+        self.transport = transport or HTTPTransport.from_settings(settings)
 
     def _headers(self) -> dict[str, str]:
         headers = {
@@ -121,22 +126,24 @@ class MetaculusClient:
             url=url,
         ) from err
 
-    def _request_json(self, url: str, method: str = "GET", body: dict[str, Any] | list[dict[str, Any]] | None = None) -> dict:
+    def _request(
+        self,
+        url: str,
+        method: str = "GET",
+        body: dict[str, Any] | list[dict[str, Any]] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> Response:
         payload = None if body is None else json.dumps(body).encode("utf-8")
-        req = request.Request(url=url, method=method, headers=self._headers(), data=payload)
-        for attempt in range(self.settings.retries):
-            try:
-                with request.urlopen(req, timeout=self.settings.timeout_seconds) as resp:
-                    return json.loads(resp.read().decode("utf-8"))
-            except HTTPError as err:
-                if err.code in {401, 403, 429} or attempt == self.settings.retries - 1:
-                    self._raise_actionable_http_error(err, url)
-                time.sleep(2**attempt)
-            except URLError as err:
-                if attempt == self.settings.retries - 1:
-                    raise MetaculusAPIError(f"Metaculus API request failed for {url}: {err}") from err
-                time.sleep(2**attempt)
-        raise MetaculusAPIError(f"Metaculus API request exhausted retries for {url}")
+        headers = {**self._headers(), **(extra_headers or {})}
+        try:
+            return self.transport.request(method, url, headers=headers, body=payload)
+        except HTTPError as err:
+            self._raise_actionable_http_error(err, url)
+        except URLError as err:
+            raise MetaculusAPIError(f"Metaculus API request failed for {url}: {err}") from err
+
+    def _request_json(self, url: str, method: str = "GET", body: dict[str, Any] | list[dict[str, Any]] | None = None) -> dict:
+        return self._request(url, method=method, body=body).json()
 
     def _load_fixture(self, filename: str) -> dict:
         path = self.settings.fixtures_dir / filename
@@ -191,8 +198,8 @@ class MetaculusClient:
             f"tournament_id={self.settings.tournament_id} tried_endpoints={tried_urls}"
         )
 
-    def questions(self) -> list[dict]:
-        url = (
+    def _questions_url(self) -> str:
+        return (
             f"{BASE_URL}/posts/"
             f"?tournaments={self.settings.tournament_id}"
             f"&has_group=false"
@@ -203,21 +210,61 @@ class MetaculusClient:
             f"&include_description=true"
             f"&limit=100"
         )
-        data = self._request_json(url)
-        results = data.get("results", [])
-        questions = []
-        for post in results:
-            question = post.get("question")
-            if question:
+
+    def _fetch_page(self, url: str, snapshots: QuestionSnapshotStore | None) -> dict:
+        """Fetch one listing page, revalidating against the snapshot with ETag/Last-Modified."""
+        cached = snapshots.page(url) if snapshots is not None else None
+        extra_headers: dict[str, str] = {}
+        if cached:
+            if cached.get("etag"):
+                extra_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                extra_headers["If-Modified-Since"] = cached["last_modified"]
+        response = self._request(url, extra_headers=extra_headers)
+        if response.status == 304 and cached:
+            page = cached
+        else:
+            data = response.json()
+            page = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "results": data.get("results", []),
+                "next": data.get("next"),
+            }
+        if snapshots is not None:
+            snapshots.store_page(url, page)
+        return page
+
+    def iter_questions(self, snapshots: QuestionSnapshotStore | None = None) -> Iterator[dict]:
+        """Yield every open/upcoming question in the tournament, following ``next`` pages."""
+        url: str | None = self._questions_url()
+        visited: set[str] = set()
+        while url and url not in visited:
+            visited.add(url)
+            page = self._fetch_page(url, snapshots)
+            for post in page.get("results", []):
+                if not post.get("question"):
+                    continue
+                if snapshots is not None:
+                    snapshots.observe(post)
+                question = dict(post["question"])
                 question["post_id"] = post.get("id")
-                questions.append(question)
-        return questions
+                yield question
+            url = page.get("next")
+
+    def questions(self, snapshots: QuestionSnapshotStore | None = None) -> list[dict]:
+        return list(self.iter_questions(snapshots))
 
     def submit(self, question: dict, forecast: dict, reasoning: str) -> dict:
         """Submit a forecast using the official Metaculus API endpoint."""
-        question_id = question.get("id")
-        formatted_payload = _format_payload_for_api(question, forecast)
-        body = [{"question": question_id, **formatted_payload}]
+        return self.submit_batch([(question, forecast)])
+
+    def submit_batch(self, items: list[tuple[dict, dict]]) -> dict | list:
+        """Submit several forecasts in one request to the forecast endpoint."""
+        body = [
+            {"question": question.get("id"), **_format_payload_for_api(question, forecast)}
+            for question, forecast in items
+        ]
         return self._request_json(f"{BASE_URL}/questions/forecast/", method="POST", body=body)
 
     def post_comment(self, post_id: int, comment_text: str) -> dict:
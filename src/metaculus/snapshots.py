@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+class QuestionSnapshotStore:
+    """Last-seen question listing: HTTP validators per page and a digest per post.
+
+    Only pages and posts seen during the current fetch are written back by ``save``, so
+    entries for posts that left the open/upcoming listing are dropped automatically.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._previous: dict[str, Any] = {"pages": {}, "posts": {}}
+        if path.exists():
+            try:
+                self._previous = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                pass
+        self._pages: dict[str, dict] = {}
+        self._posts: dict[str, str] = {}
+        self.changed_post_ids: list[int] = []
+
+    def page(self, url: str) -> dict | None:
+        return self._previous.get("pages", {}).get(url)
+
+    def store_page(self, url: str, page: dict) -> None:
+        self._pages[url] = page
+
+    @staticmethod
+    def post_digest(post: dict) -> str:
+        raw = json.dumps(post, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def observe(self, post: dict) -> bool:
+        """Record ``post`` for this fetch and return whether it changed since the last one."""
+        post_id = str(post.get("id"))
+        digest = self.post_digest(post)
+        self._posts[post_id] = digest
+        changed = self._previous.get("posts", {}).get(post_id) != digest
+        if changed:
+            self.changed_post_ids.append(post.get("id"))
+        return changed
+
+    def digest(self, post_id) -> str | None:
+        """Digest of ``post_id`` as seen by this fetch, or ``None`` when it was not seen."""
+        return self._posts.get(str(post_id))
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"pages": self._pages, "posts": self._posts}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
@@ -1,19 +1,96 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
+# Sections keyed by question id; entries for questions that left the tournament listing
+# are pruned before compaction.
+QUESTION_SECTIONS = ("submissions", "inputs")
+DEFAULT_COMPACT_EVERY = 200
+
 
 class StateStore:
-    def __init__(self, path: Path):
+    """Snapshot plus append-only delta log for the bot's persistent state.
+
+    ``record`` applies a change to the in-memory state and appends it to
+    ``<name>.log.jsonl`` as a single line, so a killed run keeps every change made before
+    it died. ``save`` compacts: the full state is written to a temporary snapshot, fsynced,
+    renamed over ``path``, and the delta log is truncated.
+    """
+
+    def __init__(self, path: Path, compact_every: int = DEFAULT_COMPACT_EVERY):
         self.path = path
+        self.log_path = path.with_name(f"{path.stem}.log.jsonl")
+        self.compact_every = compact_every
+        self._pending_deltas = 0
+        self._lock = threading.Lock()
 
     def load(self) -> dict[str, Any]:
-        if not self.path.exists():
-            return {"submissions": {}}
-        return json.loads(self.path.read_text(encoding="utf-8"))
+        state: dict[str, Any] = {"submissions": {}}
+        if self.path.exists():
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+        if self.log_path.exists():
+            intact = 0
+            with self.log_path.open("rb+") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated delta")
+                        delta = json.loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted write. Everything before it
+                        # is intact; cut it off so later deltas start on a fresh line.
+                        f.truncate(intact)
+                        break
+                    self._apply(state, delta["section"], delta["key"], delta.get("value"))
+                    self._pending_deltas += 1
+                    intact += len(line)
+        return state
 
-    def save(self, state: dict[str, Any]) -> None:
+    @staticmethod
+    def _apply(state: dict[str, Any], section: str, key: str, value: Any) -> None:
+        entries = state.setdefault(section, {})
+        if value is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = value
+
+    def record(self, state: dict[str, Any], section: str, key: str, value: Any) -> None:
+        """Set ``state[section][key] = value`` (``None`` deletes) and log the delta."""
+        line = json.dumps({"section": section, "key": key, "value": value}, sort_keys=True)
+        with self._lock:
+            self._apply(state, section, key, value)
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._pending_deltas += 1
+            if self._pending_deltas >= self.compact_every:
+                self._compact(state)
+
+    def prune(self, state: dict[str, Any], active_ids: set[str]) -> int:
+        """Drop per-question entries whose id is not in ``active_ids``; returns the count."""
+        removed = 0
+        for section in QUESTION_SECTIONS:
+            entries = state.get(section, {})
+            for key in [k for k in entries if k not in active_ids]:
+                del entries[key]
+                removed += 1
+        return removed
+
+    def _compact(self, state: dict[str, Any]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(json.dumps(state, sort_keys=True, separators=(",", ":")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.log_path.unlink(missing_ok=True)
+        self._pending_deltas = 0
+
+    def save(self, state: dict[str, Any]) -> None:
+        with self._lock:
+            self._compact(state)
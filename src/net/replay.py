@@ -0,0 +1,344 @@
+"""Record/replay HTTP for offline end-to-end runs and benchmarks.
+
+``HTTP_MODE=record`` wraps the live transport and writes every request/response pair to a
+cassette (``CASSETTE``). ``HTTP_MODE=replay`` starts a local stand-in server that answers
+from the cassette, with optional injected latency (``REPLAY_LATENCY_MS``) and transient
+503s (``REPLAY_ERROR_RATE``), and points the transport at it. Requests still go through
+the real pool, retry policy and rate limiter, so replayed runs exercise the same
+concurrency as live ones. Without a cassette file, replay serves ``tests/fixtures``.
+
+Build the fixture cassette explicitly with::
+
+    python -m src.net.replay --out data/cassettes/fixtures.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.net.transport import HostLimiter, HTTPTransport, Response
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+HTTP_MODES = ("live", "record", "replay")
+REPLAY_URL_HEADER = "X-Replay-Url"
+# Headers describing the original wire encoding; the stand-in server sets its own.
+_HOP_HEADERS = {"connection", "content-encoding", "content-length", "transfer-encoding"}
+_PRIVATE_HEADERS = {"set-cookie"}
+
+
+def body_digest(body: bytes | None) -> str:
+    return hashlib.sha256(body or b"").hexdigest()
+
+
+class Cassette:
+    """Recorded interactions, matched on method, URL and (when recorded) body digest.
+
+    Identical requests recorded several times are replayed in recording order; once the
+    recordings run out the last one keeps being served.
+    """
+
+    def __init__(self, path: Path | None = None, interactions: list[dict] | None = None):
+        self.path = path
+        self.interactions: list[dict] = interactions or []
+        self._served: dict[tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')} in {path}")
+        return cls(path, data.get("interactions", []))
+
+    def save(self, path: Path | None = None) -> None:
+        path = path or self.path
+        if path is None:
+            raise ValueError("Cassette has no path to save to")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with self._lock:
+            payload = {"version": CASSETTE_VERSION, "interactions": list(self.interactions)}
+        tmp.write_text(json.dumps(payload, indent=1, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def add(self, method: str, url: str, body: bytes | None, response: Response) -> None:
+        try:
+            encoded = {"body": response.body.decode("utf-8")}
+        except UnicodeDecodeError:
+            encoded = {"body_base64": base64.b64encode(response.body).decode("ascii")}
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in _HOP_HEADERS | _PRIVATE_HEADERS
+        }
+        interaction = {
+            "request": {"method": method, "url": url, "body_sha256": body_digest(body)},
+            "response": {"status": response.status, "headers": headers, **encoded},
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def match(self, method: str, url: str, body: bytes | None) -> dict | None:
+        digest = body_digest(body)
+        candidates = [
+            item["response"]
+            for item in self.interactions
+            if item["request"]["method"] == method
+            and item["request"]["url"] == url
+            and item["request"].get("body_sha256") in (None, digest)
+        ]
+        if not candidates:
+            return None
+        key = (method, url, digest)
+        with self._lock:
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        return candidates[min(served, len(candidates) - 1)]
+
+
+def response_body(recorded: dict) -> bytes:
+    if "body_base64" in recorded:
+        return base64.b64decode(recorded["body_base64"])
+    return recorded.get("body", "").encode("utf-8")
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: ReplayServer
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        # Requests sent straight to the stand-in (without a replay header) match on its own URL.
+        url = self.headers.get(REPLAY_URL_HEADER) or f"http://{self.headers['Host']}{self.path}"
+        self.server.answer(self, self.command, url, body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Local HTTP server answering from a cassette, with injected latency and errors."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = 0,
+    ):
+        super().__init__(("127.0.0.1", 0), _ReplayHandler)
+        self.cassette = cassette
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "injected_errors": 0, "unmatched": 0}
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def start(self) -> ReplayServer:
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="metacbot-replay", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def answer(self, handler: BaseHTTPRequestHandler, method: str, url: str, body) -> None:
+        self._count("requests")
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        with self._lock:
+            inject = self.error_rate > 0 and self._random.random() < self.error_rate
+        if inject:
+            self._count("injected_errors")
+            status, headers, payload = 503, {}, b'{"detail": "injected error"}'
+        else:
+            recorded = self.cassette.match(method, url, body)
+            if recorded is None:
+                self._count("unmatched")
+                logger.warning("No recorded interaction for %s %s", method, url)
+                status, headers = 404, {}
+                payload = json.dumps({"detail": f"no recorded interaction for {url}"}).encode()
+            else:
+                status, headers = recorded["status"], recorded.get("headers", {})
+                payload = response_body(recorded)
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+class RecordingTransport(HTTPTransport):
+    """Live transport that appends every completed exchange to a cassette.
+
+    Streamed responses are not recorded; record with ``LLM_STREAM`` off.
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def _send_once(self, method, url, headers, body, timeout) -> Response:
+        response = super()._send_once(method, url, headers, body, timeout)
+        self.cassette.add(method, url, body, response)
+        return response
+
+    def close(self) -> None:
+        super().close()
+        self.cassette.save()
+
+
+class ReplayTransport(HTTPTransport):
+    """Transport that sends every request to a ``ReplayServer`` instead of the real host.
+
+    Rate limiting and retries still key on the original URL's host; connections are
+    pooled to the local server, which every request then shares.
+    """
+
+    def __init__(self, server: ReplayServer, **kwargs):
+        super().__init__(**kwargs)
+        self.server = server
+
+    def _exchange(self, method, url, headers, body, timeout):
+        headers = {**headers, REPLAY_URL_HEADER: url}
+        return super()._exchange(method, self.server.url, headers, body, timeout)
+
+    def close(self) -> None:
+        super().close()
+        stats = self.server.stats()
+        logger.info(
+            "Replay server handled %d requests (%d injected errors, %d unmatched)",
+            stats["requests"],
+            stats["injected_errors"],
+            stats["unmatched"],
+        )
+        self.server.stop()
+
+
+def fixture_cassette(settings) -> Cassette:
+    """A cassette serving ``tests/fixtures`` at the URLs ``run_once`` requests.
+
+    Exa searches return the fixture results for any query, and every OpenRouter
+    completion returns a neutral forecast so the LLM roles parse cleanly.
+    """
+    from src.metaculus.client import BASE_URL, MetaculusClient
+
+    fixtures = settings.fixtures_dir
+    client = MetaculusClient(settings, transport=HTTPTransport())
+    questions = json.loads((fixtures / "metaculus_questions.json").read_text(encoding="utf-8"))
+    posts = [
+        {"id": question["id"], "question": question}
+        for question in questions.get("results", [])
+    ]
+    forecast = {"probability": 0.5, "p10": 0.2, "p50": 0.5, "p90": 0.8}
+    completion = {"choices": [{"message": {"content": json.dumps(forecast)}}]}
+
+    def interaction(method: str, url: str, payload) -> dict:
+        return {
+            "request": {"method": method, "url": url},
+            "response": {
+                "status": 200,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps(payload),
+            },
+        }
+
+    tournament_file = fixtures / f"metaculus_tournament_{settings.tournament_id}.json"
+    if not tournament_file.exists():
+        tournament_file = fixtures / "metaculus_tournament_32916.json"
+    return Cassette(
+        interactions=[
+            interaction(
+                "GET",
+                client._tournament_meta_urls()[0],
+                json.loads(tournament_file.read_text(encoding="utf-8")),
+            ),
+            interaction("GET", client._questions_url(), {"results": posts, "next": None}),
+            interaction(
+                "POST",
+                "https://api.exa.ai/search",
+                json.loads((fixtures / "exa_results.json").read_text(encoding="utf-8")),
+            ),
+            interaction("POST", "https://openrouter.ai/api/v1/chat/completions", completion),
+            interaction("POST", f"{BASE_URL}/questions/forecast/", []),
+            interaction("POST", f"{BASE_URL}/comments/create/", {}),
+        ]
+    )
+
+
+def open_transport(settings, rate_limiter: HostLimiter | None = None) -> HTTPTransport:
+    """The transport for ``settings.http_mode``: live, recording or replaying."""
+    mode = settings.http_mode
+    if mode not in HTTP_MODES:
+        raise ValueError(f"Unknown HTTP_MODE {mode!r}; expected one of {HTTP_MODES}")
+    live = HTTPTransport.from_settings(settings, rate_limiter=rate_limiter)
+    if mode == "live":
+        return live
+    options = {"retry": live.retry, "timeout": live.timeout, "rate_limiter": rate_limiter}
+    path = settings.cassette_path or settings.data_dir / "cassettes" / "run.json"
+    if mode == "record":
+        logger.info("Recording HTTP interactions to %s", path)
+        return RecordingTransport(Cassette(path), **options)
+    if path.exists():
+        cassette = Cassette.load(path)
+    else:
+        logger.info("Cassette %s not found; replaying tests/fixtures", path)
+        cassette = fixture_cassette(settings)
+    server = ReplayServer(
+        cassette,
+        latency_seconds=settings.replay_latency_ms / 1000,
+        error_rate=settings.replay_error_rate,
+    ).start()
+    return ReplayTransport(server, **options)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from src.config.settings import Settings
+
+    parser = argparse.ArgumentParser(description="Write a cassette built from tests/fixtures.")
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args(argv)
+    fixture_cassette(Settings.from_env()).save(args.out)
+    print(args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Any, Protocol, Self, TypeVar
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth another attempt: timeouts, throttling and transient server errors.
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+DEFAULT_MAX_IDLE_PER_HOST = 8
+
+
+class HostLimiter(Protocol):
+    def acquire(self, host: str) -> None: ...
+
+    def defer(self, host: str, seconds: float) -> None: ...
+
+
+def retry_after_seconds(headers, now: float | None = None) -> float | None:
+    """Parse a Retry-After header given either as delta-seconds or as an HTTP date."""
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    current = time.time() if now is None else now
+    return max(0.0, when.timestamp() - current)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry/backoff policy shared by every HTTP client."""
+
+    attempts: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, HTTPError):
+            return error.code in self.retry_statuses
+        return isinstance(error, URLError)
+
+    def delay(self, attempt: int) -> float:
+        return min(self.backoff_max, self.backoff_base * 2**attempt)
+
+
+@dataclass
+class Response:
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+    url: str
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+_PoolKey = tuple[str, str, int]
+_R = TypeVar("_R", "Response", "StreamResponse")
+
+
+def iter_sse_data(lines: Iterable[bytes]) -> Iterator[str]:
+    """Yield the ``data`` payload of each server-sent event; comments and other fields are
+    skipped and multi-line data is joined with newlines."""
+    data: list[str] = []
+    for raw in lines:
+        line = raw.decode("utf-8")
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value.removeprefix(" "))
+    if data:
+        yield "\n".join(data)
+
+
+class StreamResponse:
+    """A successful response whose body is read incrementally.
+
+    Iterate ``lines()`` or ``chunks()`` and call ``close()`` (or use ``with``) when done. A fully read body
+    returns its connection to the pool; closing early drops the connection.
+    """
+
+    def __init__(
+        self,
+        transport: HTTPTransport,
+        key: _PoolKey,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+        url: str,
+    ):
+        self._transport = transport
+        self._key = key
+        self._conn: http.client.HTTPConnection | None = conn
+        self._resp = resp
+        self.status = resp.status
+        self.headers = resp.msg
+        self.url = url
+
+    def lines(self) -> Iterator[bytes]:
+        """Body lines without their line endings, as they arrive."""
+        while True:
+            line = self._resp.readline()
+            if not line:
+                break
+            yield line.rstrip(b"\r\n")
+
+    def chunks(self, size: int = 65536) -> Iterator[bytes]:
+        """Body chunks of at most ``size`` bytes, as they arrive."""
+        while True:
+            chunk = self._resp.read1(size)
+            if not chunk:
+                break
+            yield chunk
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if self._resp.isclosed():
+            self._transport._release(self._key, conn, self._resp)
+        else:
+            conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class HTTPTransport:
+    """Blocking HTTP/1.1 transport with keep-alive connections pooled per host.
+
+    Non-2xx responses are raised as ``urllib.error.HTTPError`` and connection failures as
+    ``urllib.error.URLError`` so callers keep their existing error handling.
+    """
+
+    def __init__(
+        self,
+        retry: RetryPolicy | None = None,
+        timeout: float = 20.0,
+        max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST,
+        rate_limiter: HostLimiter | None = None,
+    ):
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings, rate_limiter: HostLimiter | None = None) -> HTTPTransport:
+        return cls(
+            retry=RetryPolicy(attempts=max(1, settings.retries)),
+            timeout=settings.timeout_seconds,
+            rate_limiter=rate_limiter,
+        )
+
+    @staticmethod
+    def _pool_key(url: str) -> tuple[_PoolKey, str]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return (scheme, parts.hostname or "", port), path
+
+    def _checkout(self, key: _PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = key
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_cls(host, port, timeout=timeout), False
+
+    def _checkin(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _release(
+        self, key: _PoolKey, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse
+    ) -> None:
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+
+    def _exchange(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+    ) -> tuple[_PoolKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send the request and read the status line and headers, leaving the body unread."""
+        key, path = self._pool_key(url)
+        while True:
+            conn, reused = self._checkout(key, timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                return key, conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                conn.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection; retry on a fresh one.
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+    def _read_body(
+        self,
+        key: _PoolKey,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+        url: str,
+    ) -> Response:
+        try:
+            data = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+        self._release(key, conn, resp)
+        return Response(status=resp.status, headers=resp.msg, body=data, url=url)
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+    ) -> Response:
+        return self._read_body(*self._exchange(method, url, headers, body, timeout), url)
+
+    def _open_stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+    ) -> Response | StreamResponse:
+        key, conn, resp = self._exchange(method, url, headers, body, timeout)
+        if resp.status >= 400:
+            return self._read_body(key, conn, resp, url)
+        return StreamResponse(self, key, conn, resp, url)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> Response:
+        """Send a request, retrying transient failures according to ``self.retry``.
+
+        ``deadline`` is a ``time.monotonic()`` instant bounding every attempt and backoff
+        sleep together; socket timeouts are shortened to fit and a retry that would not
+        start before it is not made.
+        """
+        return self._retrying(
+            method,
+            url,
+            timeout,
+            deadline,
+            lambda t: self._send_once(method, url, headers or {}, body, t),
+        )
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> StreamResponse:
+        """Like ``request`` but returns once the headers arrive, with the body unread.
+
+        Retries cover connecting and error statuses only; once a stream is returned the
+        caller owns it and must close it.
+        """
+        return self._retrying(
+            method,
+            url,
+            timeout,
+            deadline,
+            lambda t: self._open_stream(method, url, headers or {}, body, t),
+        )
+
+    def _retrying(
+        self,
+        method: str,
+        url: str,
+        timeout: float | None,
+        deadline: float | None,
+        send: Callable[[float], _R],
+    ) -> _R:
+        timeout = self.timeout if timeout is None else timeout
+        attempts = max(1, self.retry.attempts)
+        host = urlsplit(url).hostname or ""
+        for attempt in range(attempts):
+            attempt_timeout = timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise URLError(TimeoutError(f"deadline exceeded for {method} {url}"))
+                attempt_timeout = min(timeout, remaining)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(host)
+            try:
+                try:
+                    response = send(attempt_timeout)
+                except (OSError, http.client.HTTPException) as exc:
+                    raise URLError(exc) from exc
+                if response.status >= 400:
+                    raise HTTPError(
+                        url,
+                        response.status,
+                        http.client.responses.get(response.status, ""),
+                        response.headers,
+                        BytesIO(response.body),
+                    )
+                return response
+            except (HTTPError, URLError) as err:
+                if attempt == attempts - 1 or not self.retry.is_retryable(err):
+                    raise
+                delay = self.retry.delay(attempt)
+                if isinstance(err, HTTPError):
+                    retry_after = retry_after_seconds(err.headers)
+                    if retry_after is not None:
+                        if retry_after > self.retry.backoff_max:
+                            raise
+                        delay = retry_after
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise
+                logger.debug("HTTP %s %s attempt %d failed: %s", method, url, attempt + 1, err)
+                if self.rate_limiter is not None and isinstance(err, HTTPError) and err.code == 429:
+                    # Pause every worker talking to this host; the next acquire() waits it out.
+                    self.rate_limiter.defer(host, delay)
+                else:
+                    time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle.clear()
+        for idle in pools:
+            for conn in idle:
+                conn.close()
+
+
+class AsyncHTTPTransport:
+    """Asyncio front-end over ``HTTPTransport`` sharing its connection pool and retry policy."""
+
+    def __init__(self, transport: HTTPTransport | None = None):
+        self.transport = transport or HTTPTransport()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        return await asyncio.to_thread(self.transport.request, method, url, headers, body, timeout)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.transport.close)
@@ -0,0 +1,272 @@
+"""Full-text fetch for top-ranked search results.
+
+Search rows carry at most a short text excerpt. ``ContentFetcher`` downloads the pages
+themselves through the shared transport, following redirects, strips markup incrementally
+while the body streams in, and keeps only the ``max_passages`` passages that best match
+the question.
+Memory stays bounded by the passage heap and the parser buffer, and a body is cut off
+after ``max_bytes``. Extracted passages are cached on disk under the page's content hash,
+with a per-URL entry pointing at the latest hash, so a page is not refetched within the
+cache TTL and identical copies of a page share one extraction.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import heapq
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin
+
+from src.config import constants
+from src.net.transport import StreamResponse
+from src.research.pool import keywords
+from src.research.source_ranker import tokenize
+from src.storage.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BYTES = 16384
+MAX_REDIRECTS = 5
+PASSAGE_CHARS = 600
+# Shorter fragments are navigation, bylines and captions rather than prose.
+MIN_PASSAGE_CHARS = 80
+TEXT_TYPES = ("text/html", "text/plain", "application/xhtml+xml")
+_SKIPPED_TAGS = {"script", "style", "noscript", "svg", "nav", "footer", "header", "form"}
+_BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "section", "article", "blockquote", "h1", "h2", "h3",
+    "h4", "h5", "h6", "tr", "table", "pre",
+}
+_SPACE = re.compile(r"\s+")
+_SENTENCE_END = re.compile(r"[.!?]\s")
+
+
+class PassageExtractor:
+    """Split streamed text into passages and keep the ``max_passages`` most relevant.
+
+    A passage is scored by the distinct query keywords it contains plus a small bonus per
+    repeated hit; ties keep the earlier passage. ``passages()`` returns the kept passages
+    in document order.
+    """
+
+    def __init__(self, query: str, max_passages: int, passage_chars: int = PASSAGE_CHARS):
+        self.terms = keywords(query)
+        self.max_passages = max(1, max_passages)
+        self.passage_chars = passage_chars
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._seen = 0
+        self._heap: list[tuple[float, int, str]] = []
+
+    def feed(self, text: str) -> None:
+        text = _SPACE.sub(" ", text)
+        if not text.strip():
+            return
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.passage_chars:
+            self._split_long()
+
+    def _split_long(self) -> None:
+        text = "".join(self._buffer)
+        while len(text) >= self.passage_chars:
+            # Cut at the last sentence end inside the window when there is one.
+            window = text[: self.passage_chars]
+            ends = [m.end() for m in _SENTENCE_END.finditer(window)]
+            cut = ends[-1] if ends and ends[-1] >= MIN_PASSAGE_CHARS else self.passage_chars
+            self._emit(text[:cut])
+            text = text[cut:]
+        self._buffer = [text]
+        self._buffered = len(text)
+
+    def paragraph_break(self) -> None:
+        if self._buffer:
+            self._emit("".join(self._buffer))
+        self._buffer = []
+        self._buffered = 0
+
+    def _emit(self, passage: str) -> None:
+        passage = passage.strip()
+        if len(passage) < MIN_PASSAGE_CHARS:
+            return
+        order = self._seen
+        self._seen += 1
+        tokens = tokenize(passage)
+        hits = sum(1 for token in tokens if token in self.terms)
+        score = len(self.terms.intersection(tokens)) + 0.1 * hits
+        entry = (score, -order, passage)
+        if len(self._heap) < self.max_passages:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def passages(self) -> list[str]:
+        self.paragraph_break()
+        return [passage for _score, _order, passage in sorted(self._heap, key=lambda e: -e[1])]
+
+
+class _TextParser(HTMLParser):
+    """Streaming HTML-to-text that forwards visible text to a ``PassageExtractor``."""
+
+    def __init__(self, extractor: PassageExtractor):
+        super().__init__(convert_charrefs=True)
+        self.extractor = extractor
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag in _BLOCK_TAGS:
+            self.extractor.paragraph_break()
+
+    def handle_endtag(self, tag) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag in _BLOCK_TAGS:
+            self.extractor.paragraph_break()
+
+    def handle_data(self, data) -> None:
+        if not self._skipping:
+            self.extractor.feed(data)
+
+
+class _PlainParser:
+    def __init__(self, extractor: PassageExtractor):
+        self.extractor = extractor
+
+    def feed(self, text: str) -> None:
+        paragraphs = text.split("\n\n")
+        for i, paragraph in enumerate(paragraphs):
+            if i:
+                self.extractor.paragraph_break()
+            self.extractor.feed(paragraph)
+
+    def close(self) -> None:
+        pass
+
+
+def extract_passages(
+    chunks, query: str, max_passages: int, content_type: str = "text/html", charset: str = "utf-8"
+) -> tuple[list[str], str]:
+    """Passages and SHA-256 digest of a body given as an iterable of byte chunks."""
+    extractor = PassageExtractor(query, max_passages)
+    parser = _PlainParser(extractor) if content_type == "text/plain" else _TextParser(extractor)
+    try:
+        decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+        parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return extractor.passages(), digest.hexdigest()
+
+
+def _capped(chunks, max_bytes: int):
+    received = 0
+    for chunk in chunks:
+        if received + len(chunk) >= max_bytes:
+            yield chunk[: max_bytes - received]
+            return
+        received += len(chunk)
+        yield chunk
+
+
+class ContentFetcher:
+    """Fetch and extract full-text passages for the top search rows of a question."""
+
+    def __init__(
+        self,
+        transport,
+        cache: DiskCache | None = None,
+        max_docs: int = constants.DEFAULT_CONTENTS_MAX_DOCS,
+        max_bytes: int = constants.DEFAULT_CONTENTS_MAX_BYTES,
+        max_passages: int = constants.DEFAULT_CONTENTS_PASSAGES,
+        timeout: float | None = None,
+    ):
+        self.transport = transport
+        self.cache = cache
+        self.max_docs = max_docs
+        self.max_bytes = max_bytes
+        self.max_passages = max_passages
+        self.timeout = timeout
+
+    def _cached(self, url: str, query: str) -> list[str] | None:
+        if self.cache is None:
+            return None
+        pointer = self.cache.get(DiskCache.key_for("contents-url", url))
+        if not pointer:
+            return None
+        return self.cache.get(DiskCache.key_for("contents", pointer["sha256"], query))
+
+    def _store(self, url: str, query: str, digest: str, passages: list[str]) -> None:
+        if self.cache is None:
+            return
+        self.cache.put(DiskCache.key_for("contents", digest, query), passages)
+        self.cache.put(DiskCache.key_for("contents-url", url), {"sha256": digest})
+
+    def _open(self, url: str) -> StreamResponse:
+        """Stream ``url``, following up to ``MAX_REDIRECTS`` redirects."""
+        for _hop in range(MAX_REDIRECTS + 1):
+            response = self.transport.stream(
+                "GET",
+                url,
+                headers={"Accept": ", ".join(TEXT_TYPES)},
+                timeout=self.timeout,
+            )
+            if not 300 <= response.status < 400:
+                return response
+            location = response.headers.get("Location")
+            response.close()
+            if not location:
+                raise ValueError(f"HTTP {response.status} without Location")
+            url = urljoin(url, location)
+        raise ValueError(f"more than {MAX_REDIRECTS} redirects")
+
+    def fetch(self, url: str, query: str) -> list[str]:
+        """Most relevant passages of the page at ``url``; empty when it cannot be read."""
+        if not url:
+            return []
+        cached = self._cached(url, query)
+        if cached is not None:
+            return cached
+        try:
+            with self._open(url) as response:
+                content_type = response.headers.get_content_type()
+                if content_type not in TEXT_TYPES:
+                    logger.debug("Skipping %s body for %s", content_type, url)
+                    return []
+                charset = response.headers.get_content_charset() or "utf-8"
+                passages, digest = extract_passages(
+                    _capped(response.chunks(CHUNK_BYTES), self.max_bytes),
+                    query,
+                    self.max_passages,
+                    content_type,
+                    charset,
+                )
+        except (HTTPError, URLError, OSError, ValueError) as exc:
+            logger.info("Failed to fetch contents of %s: %s", url, exc)
+            return []
+        self._store(url, query, digest, passages)
+        return passages
+
+    def enrich(self, rows: list[dict], query: str) -> list[dict]:
+        """Copies of ``rows`` where the first ``max_docs`` gain a ``passages`` list."""
+        head = rows[: self.max_docs]
+        if not head:
+            return list(rows)
+        with ThreadPoolExecutor(
+            max_workers=len(head), thread_name_prefix="metacbot-contents"
+        ) as pool:
+            fetched = list(pool.map(lambda row: self.fetch(row.get("url", ""), query), head))
+        enriched = [
+            {**row, "passages": passages} if passages else row
+            for row, passages in zip(head, fetched)
+        ]
+        return enriched + rows[self.max_docs :]
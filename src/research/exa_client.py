@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import json
 import logging
-import time
 from typing import Any
-from urllib import request
 from urllib.error import HTTPError, URLError
 
 from src.config.settings import Settings
+from src.net.transport import HTTPTransport
+from src.storage.disk_cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +19,15 @@ DEFAULT_SEARCH_TYPE = "neural"
 class ExaClient:
     """Client for Exa AI search API following official Metaculus template patterns."""
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        transport: HTTPTransport | None = None,
+        cache: DiskCache | None = None,
+    ):
         self.settings = settings
+        self.transport = transport or HTTPTransport.from_settings(settings)
+        self.cache = cache
         self._base_url = "https://api.exa.ai/search"
 
     def _load_fixture(self) -> list[dict]:
@@ -104,27 +111,22 @@ class ExaClient:
             raise RuntimeError("EXA_API_KEY is required for Exa API requests")
 
         body = self._build_request_body(query, num_results, search_type)
-        req = request.Request(
-            self._base_url,
-            method="POST",
-            data=body,
-            headers=self._build_headers(),
-        )
-
-        last_error: Exception | None = None
-        for attempt in range(self.settings.retries):
-            try:
-                with request.urlopen(req, timeout=self.settings.timeout_seconds) as resp:
-                    data = json.loads(resp.read().decode("utf-8"))
-                    return self._parse_results(data)
-            except (HTTPError, URLError, TimeoutError, json.JSONDecodeError) as e:
-                last_error = e
-                logger.debug("Exa search attempt %d failed: %s", attempt + 1, e)
-                if attempt < self.settings.retries - 1:
-                    time.sleep(2**attempt)
-
-        # All retries failed
-        raise RuntimeError(f"Exa API request failed after {self.settings.retries} attempts") from last_error
+        # The request body carries query, numResults, type and contents options.
+        cache_key = DiskCache.key_for(self._base_url, body)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        try:
+            response = self.transport.request(
+                "POST", self._base_url, headers=self._build_headers(), body=body
+            )
+            results = self._parse_results(response.json())
+        except (HTTPError, URLError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"Exa API request failed: {e}") from e
+        if self.cache is not None:
+            self.cache.put(cache_key, results)
+        return results
 
     def search_with_highlights(self, query: str, num_results: int = DEFAULT_NUM_RESULTS) -> list[dict]:
         """
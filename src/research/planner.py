@@ -0,0 +1,147 @@
+"""Research planning: diverse sub-queries per question, issued in concurrent waves.
+
+Queries come from the title, named entities in it, and the description and resolution
+criteria. They are sent ``concurrency`` at a time up to ``max_queries`` per question, and
+planning stops early when a wave adds fewer than ``min_new_sources`` unseen URLs.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+
+from src.config import constants
+from src.execution.timing import Profiler, timed
+
+logger = logging.getLogger(__name__)
+
+# Queries whose word sets overlap more than this are treated as the same query.
+MAX_QUERY_OVERLAP = 0.8
+MAX_QUERY_WORDS = 14
+_WORD = re.compile(r"[\w'-]+")
+_ENTITY = re.compile(r"\b(?:[A-Z][\w&.-]*)(?:\s+[A-Z][\w&.-]*)*")
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "before", "by", "does", "for", "from", "has",
+    "have", "how", "if", "in", "is", "it", "of", "on", "or", "than", "that", "the", "this",
+    "to", "what", "when", "which", "who", "will", "with", "would",
+}
+
+
+def _words(text: str) -> list[str]:
+    return _WORD.findall(text)
+
+
+def _keywords(text: str, limit: int = MAX_QUERY_WORDS) -> str:
+    return " ".join([w for w in _words(text) if w.lower() not in STOPWORDS][:limit])
+
+
+def _first_sentence(text: str) -> str:
+    text = re.sub(r"\s+", " ", text or "").strip()
+    return _SENTENCE.split(text, maxsplit=1)[0] if text else ""
+
+
+def _overlap(a: str, b: str) -> float:
+    left = {w.lower() for w in _words(a)}
+    right = {w.lower() for w in _words(b)}
+    if not left or not right:
+        return 0.0
+    return len(left & right) / min(len(left), len(right))
+
+
+def plan_queries(
+    question: dict, max_queries: int = constants.DEFAULT_RESEARCH_MAX_QUERIES
+) -> list[str]:
+    """Up to ``max_queries`` distinct search queries, most important first."""
+    title = (question.get("title") or "").strip()
+    candidates = [title]
+    entities = [e for e in _ENTITY.findall(title) if e.lower() not in STOPWORDS and len(e) > 2]
+    if entities:
+        candidates.append(f"{' '.join(dict.fromkeys(entities))} latest news")
+    for key in ("resolution_criteria", "description", "fine_print"):
+        sentence = _first_sentence(question.get(key) or "")
+        if sentence:
+            candidates.append(_keywords(sentence))
+    candidates.append(f"{_keywords(title)} forecast analysis")
+
+    queries: list[str] = []
+    for candidate in candidates:
+        if not candidate:
+            continue
+        if any(_overlap(candidate, q) > MAX_QUERY_OVERLAP for q in queries):
+            continue
+        queries.append(candidate)
+        if len(queries) >= max_queries:
+            break
+    return queries
+
+
+class ResearchPlanner:
+    """Run a question's planned queries against a search client in concurrent waves."""
+
+    def __init__(
+        self,
+        max_queries: int = constants.DEFAULT_RESEARCH_MAX_QUERIES,
+        concurrency: int = constants.DEFAULT_RESEARCH_CONCURRENCY,
+        min_new_sources: int = constants.DEFAULT_RESEARCH_MIN_NEW_SOURCES,
+    ):
+        self.max_queries = max(1, max_queries)
+        self.concurrency = max(1, concurrency)
+        self.min_new_sources = min_new_sources
+
+    @classmethod
+    def from_settings(cls, settings) -> ResearchPlanner:
+        return cls(
+            max_queries=settings.research_max_queries,
+            concurrency=settings.research_concurrency,
+            min_new_sources=settings.research_min_new_sources,
+        )
+
+    def _search(self, search_client, question: dict, query: str, profiler) -> list[dict]:
+        try:
+            with timed(profiler, "retrieval.query", question.get("id")):
+                return search_client.search(query)
+        except (RuntimeError, URLError, HTTPError, ValueError) as exc:
+            logger.warning(
+                "Failed to search evidence for question_id=%s with query=\"%s\": %s",
+                question.get("id"),
+                query,
+                exc,
+            )
+            return []
+
+    def research(
+        self, question: dict, search_client, profiler: Profiler | None = None
+    ) -> list[dict]:
+        """Search rows from every query issued, in query order."""
+        queries = plan_queries(question, self.max_queries)
+        rows: list[dict] = []
+        seen: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="metacbot-research"
+        ) as pool:
+            for start in range(0, len(queries), self.concurrency):
+                wave = queries[start : start + self.concurrency]
+                results = pool.map(
+                    lambda q: self._search(search_client, question, q, profiler), wave
+                )
+                new_sources = 0
+                for batch in results:
+                    for row in batch:
+                        url = row.get("url", "")
+                        if url and url not in seen:
+                            seen.add(url)
+                            new_sources += 1
+                        rows.append(row)
+                remaining = len(queries) - start - len(wave)
+                if remaining and new_sources < self.min_new_sources:
+                    logger.debug(
+                        "Stopping research for question_id=%s: %d new sources, %d queries left",
+                        question.get("id"),
+                        new_sources,
+                        remaining,
+                    )
+                    break
+        return rows
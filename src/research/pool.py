@@ -0,0 +1,238 @@
+"""Run-scoped evidence pool shared by every question in a run.
+
+``EvidencePool`` wraps a search client and indexes every document it returns by URL and
+by keyword (lowercased title and leading text words, so capitalized entities are included).
+A query whose keywords are already covered by at least ``min_docs`` pooled documents is
+answered from the pool without calling the search API; otherwise the search runs and its
+results are merged with any pooled matches.
+
+Questions prepared concurrently search through a ``PoolView`` each, created in selection
+order. Views never wait on each other while searching: a query already sent by any
+question is answered by that search instead of a new one, and every other query goes to
+the search API. Once a question's searches are over, ``PoolView.resolve`` waits for the
+earlier views to finish theirs and adds their pooled documents matching the question's
+queries, so what a question is served depends only on selection order and its evidence
+fingerprint stays stable between runs.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import Counter
+from concurrent.futures import Future
+
+from src.research.planner import STOPWORDS
+from src.research.source_ranker import tokenize
+
+# A pooled document matches a query when it contains this share of the query's keywords.
+MIN_TERM_COVERAGE = 0.75
+# Only the start of a document's text is indexed; titles and ledes carry the entities.
+INDEXED_TEXT_CHARS = 1000
+MAX_POOLED_RESULTS = 10
+# Rank of documents indexed by unscoped searches; every view can see them.
+_UNSCOPED = -1
+
+
+def keywords(text: str) -> set[str]:
+    return {t for t in tokenize(text) if len(t) > 2 and t not in STOPWORDS}
+
+
+def _preference(row: dict, rank: int) -> tuple:
+    """Sort key choosing between rows for one URL: lowest rank, then best score."""
+    return (rank, -float(row.get("score") or 0), row.get("title") or "", row.get("text") or "")
+
+
+class PoolView:
+    """One question's access to an ``EvidencePool``.
+
+    ``search`` returns the search API's rows without waiting for other views; ``resolve``
+    adds pooled documents from earlier views once the question's searches are over. Call
+    ``done`` if the research fails before ``resolve``.
+    """
+
+    def __init__(self, pool: EvidencePool, rank: int):
+        self.pool = pool
+        self.rank = rank
+        self._queries: set[str] = set()
+        self._done = False
+
+    def search(self, query: str) -> list[dict]:
+        self._queries.add(query)
+        return self.pool._shared_search(query, self.rank)
+
+    def done(self) -> None:
+        if not self._done:
+            self._done = True
+            self.pool._finish(self.rank)
+
+    def resolve(self, rows: list[dict]) -> list[dict]:
+        """``rows`` plus pooled documents from earlier views matching this view's queries."""
+        self.done()
+        return self.pool._merge_earlier(rows, sorted(self._queries), self.rank)
+
+
+class EvidencePool:
+    """Search client wrapper that answers from documents already retrieved this run."""
+
+    def __init__(self, search_client, min_docs: int):
+        self._client = search_client
+        self.min_docs = max(1, min_docs)
+        self._docs: dict[str, dict] = {}
+        self._ranks: dict[str, int] = {}
+        self._terms: dict[str, set[str]] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._searches: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)
+        self._next_rank = 0
+        self._frontier = 0
+        self._done: set[int] = set()
+        self._stats = Counter(
+            queries=0, pool_answers=0, searches=0, documents_served=0, documents_reused=0
+        )
+
+    def view(self) -> PoolView:
+        """A view ranked after every view created before it."""
+        with self._lock:
+            rank = self._next_rank
+            self._next_rank += 1
+        return PoolView(self, rank)
+
+    def _finish(self, rank: int) -> None:
+        with self._finished:
+            self._done.add(rank)
+            while self._frontier in self._done:
+                self._done.discard(self._frontier)
+                self._frontier += 1
+            self._finished.notify_all()
+
+    def _wait_for_earlier(self, rank: int) -> None:
+        with self._finished:
+            self._finished.wait_for(lambda: self._frontier >= rank)
+
+    def _index(self, rows: list[dict], rank: int) -> set[str]:
+        """Add ``rows`` to the pool; returns the URLs that were already pooled.
+
+        A URL found by several views keeps the row of the lowest-ranked one (the best-scored
+        row among that view's), so the stored row does not depend on arrival order.
+        """
+        known: set[str] = set()
+        with self._lock:
+            for row in rows:
+                url = row.get("url", "")
+                if not url:
+                    continue
+                if url in self._docs:
+                    known.add(url)
+                    if _preference(row, rank) >= _preference(self._docs[url], self._ranks[url]):
+                        continue
+                    for term in self._terms.pop(url):
+                        self._postings[term].discard(url)
+                self._docs[url] = row
+                self._ranks[url] = rank
+                text = f"{row.get('title', '')} {(row.get('text') or '')[:INDEXED_TEXT_CHARS]}"
+                self._terms[url] = keywords(text)
+                for term in self._terms[url]:
+                    self._postings.setdefault(term, set()).add(url)
+        return known
+
+    def lookup(self, query: str, before: int | None = None) -> list[dict]:
+        """Pooled documents covering at least ``MIN_TERM_COVERAGE`` of the query keywords.
+
+        With ``before`` only documents indexed by views ranked lower are considered.
+        """
+        terms = keywords(query)
+        if not terms:
+            return []
+        needed = math.ceil(len(terms) * MIN_TERM_COVERAGE)
+        with self._lock:
+            hits = Counter(url for term in terms for url in self._postings.get(term, ()))
+            matched = [
+                url
+                for url, count in hits.items()
+                if count >= needed and (before is None or self._ranks[url] < before)
+            ]
+            matched.sort(key=lambda url: (-hits[url], self._ranks[url], url))
+            return [self._docs[url] for url in matched[:MAX_POOLED_RESULTS]]
+
+    def search(self, query: str) -> list[dict]:
+        pooled = self.lookup(query)
+        if len(pooled) >= self.min_docs:
+            self._count(
+                queries=1,
+                pool_answers=1,
+                documents_served=len(pooled),
+                documents_reused=len(pooled),
+            )
+            return pooled
+        rows = self._client.search(query)
+        known = self._index(rows, _UNSCOPED)
+        fetched = {row.get("url") for row in rows}
+        extra = [row for row in pooled if row.get("url") not in fetched]
+        self._count(
+            queries=1,
+            searches=1,
+            documents_served=len(rows) + len(extra),
+            documents_reused=len(known) + len(extra),
+        )
+        return rows + extra
+
+    def _shared_search(self, query: str, rank: int) -> list[dict]:
+        """Search API rows for ``query``; a query already sent by any view reuses that call."""
+        with self._lock:
+            pending = self._searches.get(query)
+            owner = pending is None
+            if owner:
+                pending = self._searches[query] = Future()
+        if owner:
+            try:
+                rows = self._client.search(query)
+            except BaseException as exc:
+                with self._lock:
+                    del self._searches[query]
+                pending.set_exception(exc)
+                raise
+            pending.set_result(rows)
+        else:
+            rows = pending.result()
+        self._index(rows, rank)
+        self._count(
+            queries=1,
+            searches=int(owner),
+            pool_answers=int(not owner),
+            documents_served=len(rows),
+            documents_reused=0 if owner else len(rows),
+        )
+        return rows
+
+    def _merge_earlier(self, rows: list[dict], queries: list[str], rank: int) -> list[dict]:
+        """``rows`` plus documents of views ranked before ``rank`` matching ``queries``.
+
+        A query contributes only when at least ``min_docs`` earlier documents match it.
+        """
+        self._wait_for_earlier(rank)
+        fetched = {row.get("url") for row in rows}
+        extra: list[dict] = []
+        for query in queries:
+            pooled = self.lookup(query, before=rank)
+            if len(pooled) < self.min_docs:
+                continue
+            for row in pooled:
+                if row.get("url") not in fetched:
+                    fetched.add(row.get("url"))
+                    extra.append(row)
+        self._count(documents_served=len(extra), documents_reused=len(extra))
+        return rows + extra
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            self._stats.update(deltas)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            stats = {key: int(value) for key, value in self._stats.items()}
+            stats["documents"] = len(self._docs)
+        served = stats["documents_served"]
+        stats["reuse_ratio"] = stats["documents_reused"] / served if served else 0.0
+        return stats
@@ -1,31 +1,38 @@
 from __future__ import annotations
 
-import logging
-
+from src.execution.timing import Profiler, timed
+from src.research.contents import ContentFetcher
 from src.research.evidence import EvidenceBundle, EvidenceItem
+from src.research.planner import ResearchPlanner
+from src.research.pool import PoolView
 from src.research.source_ranker import deduplicate_and_rank
 
-logger = logging.getLogger(__name__)
+SNIPPET_CHARS = 400
 
 
-def build_queries(question: dict) -> list[str]:
-    title = question.get("title", "")
-    return [title, f"{title} latest evidence"]
+def _snippet(row: dict) -> str:
+    """Extracted full-text passages when fetched, else the start of the search excerpt."""
+    if row.get("passages"):
+        return "\n".join(row["passages"])
+    return (row.get("text") or "")[:SNIPPET_CHARS]
 
 
-def retrieve_evidence(question: dict, exa_client) -> EvidenceBundle:
-    rows: list[dict] = []
-    for query in build_queries(question):
-        try:
-            rows.extend(exa_client.search(query))
-        except Exception as exc:
-            logger.warning(
-                "Failed to search evidence for question_id=%s with query=\"%s\": %s",
-                question.get("id"),
-                query,
-                exc,
-            )
-    ranked = deduplicate_and_rank(rows)
+def retrieve_evidence(
+    question: dict,
+    exa_client,
+    profiler: Profiler | None = None,
+    planner: ResearchPlanner | None = None,
+    content_fetcher: ContentFetcher | None = None,
+) -> EvidenceBundle:
+    rows = (planner or ResearchPlanner()).research(question, exa_client, profiler)
+    if isinstance(exa_client, PoolView):
+        # Release later questions before the page downloads below.
+        rows = exa_client.resolve(rows)
+    title = question.get("title") or ""
+    ranked = deduplicate_and_rank(rows, title)
+    if content_fetcher is not None:
+        with timed(profiler, "retrieval.contents", question.get("id")):
+            ranked = content_fetcher.enrich(ranked, title)
     try:
         question_id = int(question.get("id", 0))
     except (TypeError, ValueError):
@@ -35,8 +42,8 @@ def retrieve_evidence(question: dict, exa_client) -> EvidenceBundle:
             idx=i + 1,
             title=row.get("title", "Untitled"),
             url=row.get("url", ""),
-            snippet=row.get("text", "")[:400],
-            score=float(row.get("score", 0.0)),
+            snippet=_snippet(row),
+            score=float(row.get("rank_score", row.get("score", 0.0))),
         )
         for i, row in enumerate(ranked)
     ]
@@ -1,10 +1,164 @@
-def deduplicate_and_rank(rows: list[dict]) -> list[dict]:
+"""Deduplicate and rank search results before they become evidence.
+
+Beyond exact URLs, near-duplicate texts (syndicated copies of one story) are detected with
+64-bit SimHash fingerprints over word shingles, looked up through a banded in-memory index,
+and the higher-scored copy is kept. Survivors are reranked by blending the search score
+with BM25 relevance to the question text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from collections import Counter
+
+DEFAULT_LIMIT = 6
+SIMHASH_BITS = 64
+# Fingerprints within this Hamming distance are treated as the same story.
+NEAR_DUPLICATE_DISTANCE = 3
+SHINGLE_SIZE = 3
+# Shorter texts give unstable fingerprints and are only deduplicated by URL.
+MIN_FINGERPRINT_TOKENS = 8
+RELEVANCE_WEIGHT = 0.5
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD = re.compile(r"\w+")
+_LANE_PAD = "0" * 7
+
+
+def tokenize(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(tokens: list[str], shingle_size: int = SHINGLE_SIZE) -> int:
+    """64-bit SimHash of the word shingles in ``tokens``, weighted by frequency.
+
+    Per-bit counts are accumulated in one big integer with a 32-bit lane per hash bit (each
+    binary digit spread out as a hex digit padded with zeros), avoiding a Python loop over
+    the 64 bits of every shingle.
+    """
+    if len(tokens) < shingle_size:
+        shingles = Counter([" ".join(tokens)])
+    else:
+        shingles = Counter(
+            " ".join(tokens[i : i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)
+        )
+    lanes = 0
+    for shingle, count in shingles.items():
+        lanes += count * int(_LANE_PAD.join(f"{_hash64(shingle):064b}"), 16)
+    total = sum(shingles.values())
+    counts = lanes.to_bytes(SIMHASH_BITS * 4, "big")
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        offset = (SIMHASH_BITS - 1 - bit) * 4
+        if 2 * int.from_bytes(counts[offset : offset + 4], "big") > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """In-memory near-duplicate index over 64-bit fingerprints.
+
+    Fingerprints are split into ``max_distance + 1`` bands; two fingerprints within
+    ``max_distance`` bits must agree on at least one band, so only same-band candidates are
+    compared.
+    """
+
+    def __init__(self, max_distance: int = NEAR_DUPLICATE_DISTANCE):
+        self.max_distance = max_distance
+        self._bands = max_distance + 1
+        self._width = SIMHASH_BITS // self._bands
+        self._buckets: dict[tuple[int, int], list[tuple[int, object]]] = {}
+
+    def _keys(self, fingerprint: int) -> list[tuple[int, int]]:
+        mask = (1 << self._width) - 1
+        return [(band, (fingerprint >> (band * self._width)) & mask) for band in range(self._bands)]
+
+    def find(self, fingerprint: int) -> object | None:
+        """Key of an indexed fingerprint within ``max_distance`` bits, if any."""
+        for bucket in self._keys(fingerprint):
+            for other, key in self._buckets.get(bucket, ()):
+                if hamming(fingerprint, other) <= self.max_distance:
+                    return key
+        return None
+
+    def add(self, fingerprint: int, key: object) -> None:
+        for bucket in self._keys(fingerprint):
+            self._buckets.setdefault(bucket, []).append((fingerprint, key))
+
+
+def bm25_scores(query: list[str], documents: list[list[str]]) -> list[float]:
+    """BM25 of ``query`` against each document, with IDF taken over ``documents``."""
+    if not documents:
+        return []
+    avg_len = sum(len(doc) for doc in documents) / len(documents) or 1.0
+    doc_freq = Counter(term for doc in documents for term in set(doc))
+    n = len(documents)
+    terms = set(query)
+    scores = []
+    for doc in documents:
+        tf = Counter(doc)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / avg_len)
+        score = 0.0
+        for term in terms:
+            if tf[term]:
+                idf = math.log(1 + (n - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                score += idf * tf[term] * (BM25_K1 + 1) / (tf[term] + norm)
+        scores.append(score)
+    return scores
+
+
+def _normalized(values: list[float]) -> list[float]:
+    top = max(values, default=0.0)
+    return [v / top if top > 0 else 0.0 for v in values]
+
+
+def deduplicate_and_rank(
+    rows: list[dict],
+    query: str | None = None,
+    limit: int = DEFAULT_LIMIT,
+    max_distance: int = NEAR_DUPLICATE_DISTANCE,
+) -> list[dict]:
+    """Drop exact-URL and near-duplicate rows, then keep the best ``limit``.
+
+    Without ``query`` rows are ordered by search score; with it each kept row gets a
+    ``rank_score`` blending the normalized search score and BM25 relevance to ``query``.
+    """
     seen: set[str] = set()
-    out: list[dict] = []
+    index = SimHashIndex(max_distance)
+    kept: list[dict] = []
+    tokens: list[list[str]] = []
     for row in sorted(rows, key=lambda x: x.get("score", 0), reverse=True):
         url = row.get("url", "")
         if not url or url in seen:
             continue
         seen.add(url)
-        out.append(row)
-    return out[:6]
+        words = tokenize(f"{row.get('title', '')} {row.get('text', '')}")
+        if len(words) >= MIN_FINGERPRINT_TOKENS:
+            fingerprint = simhash(words)
+            if index.find(fingerprint) is not None:
+                continue
+            index.add(fingerprint, url)
+        kept.append(row)
+        tokens.append(words)
+
+    if not query:
+        return kept[:limit]
+    search = _normalized([float(row.get("score", 0) or 0) for row in kept])
+    relevance = _normalized(bm25_scores(tokenize(query), tokens))
+    ranked = [
+        {**row, "rank_score": (1 - RELEVANCE_WEIGHT) * s + RELEVANCE_WEIGHT * r}
+        for row, s, r in zip(kept, search, relevance)
+    ]
+    ranked.sort(key=lambda row: row["rank_score"], reverse=True)
+    return ranked[:limit]
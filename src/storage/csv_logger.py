@@ -1,26 +1,47 @@
 from __future__ import annotations
 
 import csv
+import os
 from pathlib import Path
 
-
-def _append(path: Path, row: dict, fieldnames: list[str]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    exists = path.exists()
-    with path.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if not exists:
-            writer.writeheader()
-        writer.writerow({k: row.get(k, "") for k in fieldnames})
+RUN_FIELDS = [
+    "run_id",
+    "start_time_utc",
+    "start_time_us",
+    "status",
+    "question_count",
+    "submitted_count",
+    "skipped_count",
+]
+FORECAST_FIELDS = [
+    "run_time_utc",
+    "run_time_us",
+    "question_id",
+    "question_title",
+    "question_type",
+    "open_status",
+    "tournament_status",
+    "submission",
+]
 
 
-def append_run_row(path: Path, row: dict) -> None:
-    _append(path, row, ["run_id", "start_time_utc", "start_time_us", "status", "question_count", "submitted_count"])
+def migrate_header(path: Path, fieldnames: list[str]) -> None:
+    """Rewrite ``path`` under ``fieldnames`` when its header predates a column change.
 
-
-def append_forecast_row(path: Path, row: dict) -> None:
-    _append(
-        path,
-        row,
-        ["run_time_utc", "run_time_us", "question_id", "question_title", "question_type", "open_status", "tournament_status", "submission"],
-    )
+    The rewrite goes to a temporary file that replaces ``path`` only once complete, so a
+    crash mid-migration leaves the old log intact.
+    """
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames == fieldnames:
+            return
+        rows = list(reader)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for old in rows:
+            writer.writerow({k: old.get(k, "") for k in fieldnames})
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Share of max_entries kept after an eviction pass.
+EVICT_TO_SHARE = 0.9
+
+
+class DiskCache:
+    """Content-addressed JSON cache on disk with a per-entry TTL and LRU eviction.
+
+    Entries are sharded by the first two hex digits of their key. Recency is tracked with
+    the file mtime, which is refreshed on every hit, so eviction drops least recently used
+    entries first once ``max_entries`` is exceeded. Eviction trims the cache to
+    ``EVICT_TO_SHARE`` of ``max_entries`` in one pass, so the directory scan it needs runs
+    once per batch of writes rather than on every write at capacity.
+    """
+
+    def __init__(self, root: Path, ttl_seconds: float, max_entries: int):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entry_count: int | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(*parts: str | bytes) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8") if isinstance(part, str) else part)
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[Path]:
+        return list(self.root.glob("*/*.json")) if self.root.exists() else []
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        if time.time() - float(entry.get("stored_at", 0)) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+                if self._entry_count is not None:
+                    self._entry_count -= 1
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry.get("value")
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not path.exists()
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({"stored_at": time.time(), "value": value}), encoding="utf-8")
+        os.replace(tmp, path)
+        with self._lock:
+            if self._entry_count is None:
+                self._entry_count = len(self._entries())
+            elif is_new:
+                self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    @staticmethod
+    def _mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=self._mtime)
+        keep = max(1, min(self.max_entries, math.ceil(self.max_entries * EVICT_TO_SHARE)))
+        excess = len(entries) - keep
+        for path in entries[: max(excess, 0)]:
+            path.unlink(missing_ok=True)
+            self.evictions += 1
+        self._entry_count = min(len(entries), keep)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
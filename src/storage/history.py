@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecasts (
+    run_time_utc TEXT NOT NULL,
+    question_id INTEGER NOT NULL,
+    question_type TEXT,
+    probability REAL,
+    p10 REAL,
+    p50 REAL,
+    p90 REAL,
+    distribution TEXT,
+    baseline TEXT,
+    stats TEXT,
+    llm TEXT,
+    submission_status TEXT,
+    submitted INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (question_id, run_time_utc)
+);
+CREATE INDEX IF NOT EXISTS forecasts_run_time ON forecasts (run_time_utc);
+"""
+
+COLUMNS = (
+    "run_time_utc",
+    "question_id",
+    "question_type",
+    "probability",
+    "p10",
+    "p50",
+    "p90",
+    "distribution",
+    "baseline",
+    "stats",
+    "llm",
+    "submission_status",
+    "submitted",
+)
+
+
+def _as_float(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _row(record: dict) -> tuple:
+    final = record.get("final_forecast") or {}
+    submission = record.get("submission") or {}
+    distribution = final.get("distribution")
+    return (
+        record.get("run_time_utc"),
+        record.get("question_id"),
+        record.get("question_type"),
+        _as_float(final.get("probability")),
+        _as_float(final.get("p10")),
+        _as_float(final.get("p50")),
+        _as_float(final.get("p90")),
+        json.dumps(distribution) if distribution is not None else None,
+        json.dumps(record.get("baseline") or {}),
+        json.dumps(record.get("stats") or {}),
+        json.dumps(record.get("llm") or {}),
+        submission.get("status"),
+        1 if submission.get("submitted") else 0,
+    )
+
+
+def _decode(row: sqlite3.Row) -> dict:
+    out = dict(row)
+    for key in ("distribution", "baseline", "stats", "llm"):
+        if out.get(key) is not None:
+            out[key] = json.loads(out[key])
+    out["submitted"] = bool(out["submitted"])
+    return out
+
+
+class ForecastHistory:
+    """Compact SQLite history of forecasts, indexed by question and run time.
+
+    Holds the numeric forecast and its ensemble components but not evidence or reasoning,
+    which stay in ``forecasts.jsonl``.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+
+    def append(self, records: list[dict]) -> None:
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO forecasts ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                [_row(record) for record in records if record.get("question_id") is not None],
+            )
+
+    def import_jsonl(self, path: Path) -> int:
+        """Backfill from an existing ``forecasts.jsonl``; returns the number of records read."""
+        records = []
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    records.append(json.loads(line))
+        self.append(records)
+        return len(records)
+
+    def latest_per_question(self) -> list[dict]:
+        rows = self._conn.execute(
+            """
+            SELECT f.* FROM forecasts f
+            JOIN (
+                SELECT question_id, MAX(run_time_utc) AS run_time_utc
+                FROM forecasts GROUP BY question_id
+            ) latest USING (question_id, run_time_utc)
+            ORDER BY f.question_id
+            """
+        ).fetchall()
+        return [_decode(row) for row in rows]
+
+    def trajectory(self, question_id: int) -> list[dict]:
+        rows = self._conn.execute(
+            "SELECT * FROM forecasts WHERE question_id = ? ORDER BY run_time_utc",
+            (question_id,),
+        ).fetchall()
+        return [_decode(row) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,8 +0,0 @@
-import json
-from pathlib import Path
-
-
-def append_forecast_record(path: Path, record: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
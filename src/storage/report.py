@@ -1,7 +1,17 @@
 from pathlib import Path
 
 
-def write_summary(path: Path, records: list[dict], utc_iso: str, us_iso: str) -> None:
+def write_summary(
+    path: Path,
+    records: list[dict],
+    utc_iso: str,
+    us_iso: str,
+    cache_stats: dict[str, dict] | None = None,
+    skipped_count: int = 0,
+    throttle_stats: dict[str, dict] | None = None,
+    timings: dict[str, dict] | None = None,
+    pool_stats: dict[str, float] | None = None,
+) -> None:
     submitted = sum(1 for r in records if r["submission"].get("submitted"))
     lines = [
         "# Metacbot Latest Summary",
@@ -10,6 +20,7 @@ def write_summary(path: Path, records: list[dict], utc_iso: str, us_iso: str) ->
         f"- Run America/New_York: {us_iso}",
         f"- Questions processed: {len(records)}",
         f"- Submissions made: {submitted}",
+        f"- Skipped with unchanged inputs: {skipped_count}",
         "",
         "## Questions",
     ]
@@ -17,5 +28,54 @@ def write_summary(path: Path, records: list[dict], utc_iso: str, us_iso: str) ->
         lines.append(
             f"- Q{row['question_id']}: {row['open_status']} | submission={row['submission'].get('status')}"
         )
+    if cache_stats:
+        lines.extend(["", "## Caches"])
+        for name, stats in cache_stats.items():
+            lookups = stats.get("hits", 0) + stats.get("misses", 0)
+            hit_rate = stats.get("hits", 0) / lookups if lookups else 0.0
+            lines.append(
+                f"- {name}: hits={stats.get('hits', 0)} misses={stats.get('misses', 0)} "
+                f"evictions={stats.get('evictions', 0)} hit_rate={hit_rate:.0%}"
+            )
+    if pool_stats:
+        lines.extend(
+            [
+                "",
+                "## Evidence pool",
+                f"- Documents pooled: {pool_stats.get('documents', 0)}",
+                (
+                    f"- Queries: {pool_stats.get('queries', 0)} "
+                    f"(answered from pool: {pool_stats.get('pool_answers', 0)}, "
+                    f"searched: {pool_stats.get('searches', 0)})"
+                ),
+                (
+                    f"- Documents served: {pool_stats.get('documents_served', 0)} "
+                    f"(reused: {pool_stats.get('documents_reused', 0)}, "
+                    f"reuse_ratio={pool_stats.get('reuse_ratio', 0.0):.0%})"
+                ),
+            ]
+        )
+    if throttle_stats:
+        lines.extend(["", "## Rate limiting"])
+        for host, stats in throttle_stats.items():
+            lines.append(
+                f"- {host}: requests={stats.get('requests', 0)} "
+                f"throttled={stats.get('throttled_seconds', 0.0):.1f}s"
+            )
+    if timings:
+        lines.extend(
+            [
+                "",
+                "## Timings",
+                "",
+                "| Stage | Count | Total (s) | p50 (s) | p95 (s) |",
+                "| --- | --- | --- | --- | --- |",
+            ]
+        )
+        for stage, stats in sorted(timings.items(), key=lambda kv: -kv[1].get("total", 0.0)):
+            lines.append(
+                f"| {stage} | {stats.get('count', 0)} | {stats.get('total', 0.0):.2f} | "
+                f"{stats.get('p50', 0.0):.2f} | {stats.get('p95', 0.0):.2f} |"
+            )
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
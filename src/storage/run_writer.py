@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Self
+
+from src.storage.csv_logger import migrate_header
+
+TAIL_CHUNK = 4096
+
+
+def _drop_torn_line(path: Path) -> None:
+    """Cut off a last line left unterminated by a write that was killed mid-way."""
+    with path.open("rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        intact = end
+        while intact > 0:
+            start = max(0, intact - TAIL_CHUNK)
+            f.seek(start)
+            newline = f.read(intact - start).rfind(b"\n")
+            if newline >= 0:
+                intact = start + newline + 1
+                break
+            intact = start
+        if intact < end:
+            f.truncate(intact)
+
+
+class RunLogWriter:
+    """Buffers CSV and JSONL rows for one run and writes each sink once on ``flush``.
+
+    Each sink gets its buffered rows in one append that is fsynced; if the write fails the
+    file is truncated back to its previous size. A process killed mid-write can still leave
+    a torn last line, which the next flush cuts off before appending. Producers may add rows
+    from several threads; rows keep their arrival order per sink.
+    """
+
+    def __init__(self):
+        self._csv: dict[Path, tuple[list[str], list[dict]]] = {}
+        self._jsonl: dict[Path, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.flush()
+
+    def csv_row(self, path: Path, row: dict, fieldnames: list[str]) -> None:
+        with self._lock:
+            _fields, rows = self._csv.setdefault(path, (fieldnames, []))
+            rows.append({k: row.get(k, "") for k in fieldnames})
+
+    def jsonl_record(self, path: Path, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._jsonl.setdefault(path, []).append(line)
+
+    @staticmethod
+    def _commit(path: Path, payload: str, fieldnames: list[str] | None = None) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            _drop_torn_line(path)
+            if fieldnames is not None:
+                migrate_header(path, fieldnames)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            offset = os.lseek(fd, 0, os.SEEK_END)
+            if fieldnames is not None and offset == 0:
+                header = io.StringIO(newline="")
+                csv.DictWriter(header, fieldnames=fieldnames).writeheader()
+                payload = header.getvalue() + payload
+            data = memoryview(payload.encode("utf-8"))
+            try:
+                while data:
+                    data = data[os.write(fd, data) :]
+                os.fsync(fd)
+            except BaseException:
+                os.ftruncate(fd, offset)
+                raise
+        finally:
+            os.close(fd)
+
+    def flush(self) -> None:
+        with self._lock:
+            csv_sinks, self._csv = self._csv, {}
+            jsonl_sinks, self._jsonl = self._jsonl, {}
+        for path, (fieldnames, rows) in csv_sinks.items():
+            buffer = io.StringIO(newline="")
+            csv.DictWriter(buffer, fieldnames=fieldnames).writerows(rows)
+            self._commit(path, buffer.getvalue(), fieldnames)
+        for path, lines in jsonl_sinks.items():
+            self._commit(path, "".join(lines))
@@ -50,3 +50,11 @@ def test_date_format_defaults():
     forecast = {"date_quantiles": {}}
     result = _format_payload_for_api(question, forecast)
     assert result == {"p10": 0.1, "p50": 0.5, "p90": 0.9}
+
+
+def test_numeric_cdf_format():
+    question = {"id": 6, "type": "numeric"}
+    cdf = [i / 200 for i in range(201)]
+    forecast = {"p10": 20.0, "p50": 50.0, "p90": 80.0, "cdf": cdf}
+    result = _format_payload_for_api(question, forecast)
+    assert result == {"continuous_cdf": cdf}
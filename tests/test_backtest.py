@@ -0,0 +1,73 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from src.forecasting.backtest import (
+    cases_from_history,
+    load_cases,
+    outcome_index,
+    replay,
+    run_backtest,
+)
+from src.storage.history import ForecastHistory
+
+FIXTURE = Path(__file__).parent / "fixtures" / "resolved_questions.json"
+
+
+def test_outcome_index_handles_binary_multiclass_and_unscorable():
+    assert outcome_index({"type": "binary", "resolution": "Yes"}) == 1
+    assert outcome_index({"type": "binary", "resolution": "no"}) == 0
+    assert outcome_index({"type": "binary", "resolution": "annulled"}) is None
+    mc = {"type": "multiple_choice", "options": ["A", "B"], "resolution": "B"}
+    assert outcome_index(mc) == 1
+    assert outcome_index({"type": "numeric", "resolution": 1.2}) is None
+
+
+def test_backtest_scores_fixture_per_component():
+    cases = load_cases(FIXTURE)
+    report = run_backtest(cases, workers=1)
+    assert report["cases"] + report["unscored"] == len(cases)
+    assert report["unscored"] == 1
+    assert set(report["components"]) == {"baseline", "stats", "llm", "ensemble"}
+    for scores in report["components"].values():
+        assert 0.0 <= scores["brier"] <= 2.0
+        assert scores["log_score"] > 0.0
+    assert sum(row["count"] for row in report["calibration"]) > 0
+
+
+def test_parallel_replay_matches_serial():
+    cases = load_cases(FIXTURE)
+    serial = replay(cases, workers=1, chunk_size=3)
+    parallel = replay(cases, workers=2, chunk_size=3)
+    assert parallel == serial
+
+
+def test_cases_from_history_keeps_only_resolved(tmp_path):
+    history = ForecastHistory(tmp_path / "history.sqlite3")
+    history.append(
+        [
+            {
+                "run_time_utc": "2026-01-01T00:00:00+00:00",
+                "question_id": qid,
+                "question_type": "binary",
+                "llm": {"probability": 0.8},
+                "final_forecast": {"probability": 0.7},
+            }
+            for qid in (1, 2)
+        ]
+    )
+    cases = cases_from_history(history, {"1": "yes"})
+    history.close()
+    assert [case["id"] for case in cases] == [1]
+    report = run_backtest(cases, workers=1)
+    assert report["cases"] == 1
+    assert report["components"]["llm"]["brier"] < report["components"]["baseline"]["brier"]
+
+
+def test_backtest_does_not_import_the_network_stack():
+    code = (
+        "import sys, src.forecasting.backtest; "
+        "print(sorted(m for m in sys.modules if m.startswith(('src.execution', 'src.net'))))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,65 @@
+import pytest
+
+from src.forecasting.batch import (
+    beta_update_all,
+    combine_batch,
+    dirichlet_all,
+    sweep_binary,
+)
+from src.forecasting.stats.binary_models import beta_update
+from src.forecasting.stats.multiclass_models import dirichlet_update
+from src.forecasting.validators import validate_forecast
+
+
+def test_combine_batch_matches_per_question_validation():
+    questions = [
+        {"type": "binary"},
+        {"type": "multiple_choice"},
+        {"type": "numeric"},
+        {"type": "binary"},
+    ]
+    baselines = [
+        {"probability": 0.5},
+        {"distribution": [0.5, 0.5]},
+        {"p10": 0.1, "p50": 0.5, "p90": 0.9},
+        {"probability": 0.5},
+    ]
+    stats = [{"probability": 0.2}, {"distribution": [1, 3]}, {}, {"probability": 2.0}]
+    llms = [{"probability": 0.8}, {}, {"p10": 9, "p50": 3, "p90": 5}, {"probability": 2.0}]
+    out = combine_batch(questions, baselines, stats, llms, 0.01, 0.99)
+    assert out[0] == {"probability": pytest.approx(0.5)}
+    assert out[1] == validate_forecast("multiple_choice", {"distribution": [1, 3]})
+    assert out[2] == {"p10": 3.0, "p50": 5.0, "p90": 9.0}
+    assert out[3] == {"probability": 0.99}
+
+
+def test_sweep_binary_returns_one_row_per_weighting():
+    rows = sweep_binary([0.5, 0.5], [0.2, 0.4], [0.8, 0.6], [(1, 1, 1), (0, 0, 1)], 0.01, 0.99)
+    assert rows[0] == pytest.approx([0.5, 0.5])
+    assert rows[1] == pytest.approx([0.8, 0.6])
+
+
+def test_stats_updates_match_scalar_models():
+    assert beta_update_all(1.0, 1.0, [3, 0], [1, 2]) == [
+        beta_update(1.0, 1.0, 3, 1)["probability"],
+        beta_update(1.0, 1.0, 0, 2)["probability"],
+    ]
+    assert dirichlet_all([3, 0]) == [
+        dirichlet_update(3)["distribution"],
+        dirichlet_update(0)["distribution"],
+    ]
+
+
+def test_combine_batch_builds_cdfs_for_scaled_questions():
+    questions = [
+        {"type": "numeric", "scaling": {"range_min": 0, "range_max": 100}},
+        {"type": "numeric"},
+    ]
+    baselines = [{"p10": 0.1, "p50": 0.5, "p90": 0.9}] * 2
+    stats = [{"p10": 10, "p50": 50, "p90": 90}, {}]
+    llms = [{"p10": 30, "p50": 40, "p90": 60}, {"p10": 1, "p50": 2, "p90": 3}]
+    scaled, unscaled = combine_batch(questions, baselines, stats, llms, 0.01, 0.99)
+    assert len(scaled["cdf"]) == 201
+    assert scaled["p10"] < scaled["p50"] < scaled["p90"]
+    assert 30 < scaled["p50"] < 50
+    assert unscaled == {"p10": 1.0, "p50": 2.0, "p90": 3.0}
@@ -1,11 +1,11 @@
-from io import BytesIO
-from unittest.mock import MagicMock, patch
-from urllib.error import HTTPError
+from http.client import HTTPMessage
+from unittest.mock import patch
 
 import pytest
 
 from src.config.settings import Settings
 from src.metaculus.client import MetaculusAPIError, MetaculusClient
+from src.net.transport import HTTPTransport, Response
 
 
 def _settings_with_token(metaculus_token: str | None = "fake-token") -> Settings:
@@ -26,20 +26,15 @@ def _settings_with_token(metaculus_token: str | None = "fake-token") -> Settings
     )
 
 
-def _mock_urlopen():
-    response = MagicMock()
-    response.read.return_value = b"{}"
-    urlopen_mock = MagicMock()
-    urlopen_mock.return_value.__enter__.return_value = response
-    return urlopen_mock
+def _response(status: int = 200, body: bytes = b"{}") -> Response:
+    return Response(status=status, headers=HTTPMessage(), body=body, url="http://example.com")
 
 
 def test_request_includes_standard_headers():
     settings = _settings_with_token("abc123")
     client = MetaculusClient(settings)
-    with patch("src.metaculus.client.request.Request") as request_mock:
-        with patch("src.metaculus.client.request.urlopen", _mock_urlopen()):
-            client._request_json("http://example.com")
+    with patch.object(client.transport, "request", return_value=_response()) as request_mock:
+        client._request_json("http://example.com")
     headers = request_mock.call_args.kwargs["headers"]
     assert headers["Accept"] == "application/json"
     assert headers["User-Agent"].startswith("metacbot/")
@@ -48,9 +43,8 @@ def test_request_includes_standard_headers():
 def test_request_includes_authorization_token_header():
     settings = _settings_with_token("abc123")
     client = MetaculusClient(settings)
-    with patch("src.metaculus.client.request.Request") as request_mock:
-        with patch("src.metaculus.client.request.urlopen", _mock_urlopen()):
-            client._request_json("http://example.com")
+    with patch.object(client.transport, "request", return_value=_response()) as request_mock:
+        client._request_json("http://example.com")
     headers = request_mock.call_args.kwargs["headers"]
     assert headers["Authorization"] == "Token abc123"
 
@@ -58,9 +52,8 @@ def test_request_includes_authorization_token_header():
 def test_request_preserves_prefixed_authorization_token():
     settings = _settings_with_token("Token abc123")
     client = MetaculusClient(settings)
-    with patch("src.metaculus.client.request.Request") as request_mock:
-        with patch("src.metaculus.client.request.urlopen", _mock_urlopen()):
-            client._request_json("http://example.com")
+    with patch.object(client.transport, "request", return_value=_response()) as request_mock:
+        client._request_json("http://example.com")
     headers = request_mock.call_args.kwargs["headers"]
     assert headers["Authorization"] == "Token abc123"
 
@@ -78,15 +71,9 @@ def test_403_raises_actionable_error_with_token_and_visibility_hints():
     settings = _settings_with_token(metaculus_token=None)
     client = MetaculusClient(settings)
 
-    error = HTTPError(
-        "http://example.com",
-        403,
-        "Forbidden",
-        hdrs={},
-        fp=BytesIO(b'{"detail":"Auth required"}'),
-    )
+    response = _response(403, b'{"detail":"Auth required"}')
 
-    with patch("src.metaculus.client.request.urlopen", side_effect=error):
+    with patch.object(HTTPTransport, "_send_once", return_value=response):
         with pytest.raises(MetaculusAPIError) as exc:
             client._request_json("http://example.com")
 
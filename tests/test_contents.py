@@ -0,0 +1,163 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.net.transport import HTTPTransport, RetryPolicy
+from src.research.contents import ContentFetcher, PassageExtractor, extract_passages
+from src.research.retrieval import retrieve_evidence
+from src.storage.disk_cache import DiskCache
+
+QUERY = "Will the central bank cut interest rates in March?"
+FILLER = "Unrelated commentary about weather and sports fills this paragraph today. " * 3
+RELEVANT = (
+    "The central bank signalled it may cut interest rates in March after inflation slowed "
+    "for a third month, according to minutes of the latest policy meeting."
+)
+PAGE = (
+    "<html><head><style>p { color: red }</style><script>var rates = 'cut';</script></head>"
+    f"<body><nav>Home | Markets | Rates</nav><p>{FILLER}</p><p>{RELEVANT}</p>"
+    f"<p>{FILLER}</p></body></html>"
+).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.hits += 1
+        if self.path in server.redirects:
+            self.send_response(301)
+            self.send_header("Location", server.redirects[self.path])
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", "9")
+            self.end_headers()
+            self.wfile.write(b"<a>x</a> ")
+            return
+        body, content_type = server.pages.get(self.path, (b"", "text/html"))
+        status = 200 if self.path in server.pages else 404
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.hits = 0
+    httpd.redirects = {"/old": "/article", "/loop": "/loop"}
+    httpd.pages = {
+        "/article": (PAGE, "text/html; charset=utf-8"),
+        "/report.pdf": (b"%PDF-1.7", "application/pdf"),
+    }
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(httpd, path: str) -> str:
+    return f"http://127.0.0.1:{httpd.server_address[1]}{path}"
+
+
+def _fetcher(tmp_path, **kwargs) -> ContentFetcher:
+    cache = DiskCache(tmp_path / "contents", ttl_seconds=3600, max_entries=100)
+    transport = HTTPTransport(retry=RetryPolicy(attempts=1))
+    return ContentFetcher(transport, cache=cache, **kwargs)
+
+
+def test_extractor_keeps_most_relevant_passages_in_document_order():
+    extractor = PassageExtractor(QUERY, max_passages=2)
+    for text in (FILLER, RELEVANT, FILLER, "Rates: the bank may cut rates again. " * 3):
+        extractor.feed(text)
+        extractor.paragraph_break()
+
+    passages = extractor.passages()
+
+    assert passages[0] == RELEVANT
+    assert len(passages) == 2
+    assert all(FILLER.strip() != passage for passage in passages)
+
+
+def test_extraction_streams_chunks_and_skips_markup():
+    chunks = [PAGE[i : i + 7] for i in range(0, len(PAGE), 7)]
+    passages, digest = extract_passages(chunks, QUERY, max_passages=1)
+
+    assert passages == [RELEVANT]
+    assert len(digest) == 64
+    assert extract_passages([PAGE], QUERY, max_passages=1)[1] == digest
+
+
+def test_long_text_is_split_into_bounded_passages():
+    extractor = PassageExtractor(QUERY, max_passages=50, passage_chars=200)
+    extractor.feed(RELEVANT * 10)
+
+    passages = extractor.passages()
+
+    assert len(passages) > 1
+    assert all(len(passage) <= 200 for passage in passages)
+
+
+def test_fetch_extracts_and_caches_passages(server, tmp_path):
+    fetcher = _fetcher(tmp_path)
+    url = _url(server, "/article")
+
+    passages = fetcher.fetch(url, QUERY)
+
+    assert RELEVANT in passages
+    assert fetcher.fetch(url, QUERY) == passages
+    assert server.hits == 1
+    assert fetcher.cache.stats()["hits"] == 2
+
+
+def test_fetch_follows_redirects(server, tmp_path):
+    fetcher = _fetcher(tmp_path)
+
+    assert RELEVANT in fetcher.fetch(_url(server, "/old"), QUERY)
+    assert server.hits == 2
+    assert fetcher.fetch(_url(server, "/loop"), QUERY) == []
+    assert fetcher._cached(_url(server, "/loop"), QUERY) is None
+
+
+def test_fetch_caps_body_size(server, tmp_path):
+    fetcher = _fetcher(tmp_path, max_bytes=PAGE.index(RELEVANT.encode()))
+
+    assert fetcher.fetch(_url(server, "/article"), QUERY) == [FILLER.strip()]
+
+
+def test_fetch_skips_binary_and_missing_pages(server, tmp_path):
+    fetcher = _fetcher(tmp_path)
+
+    assert fetcher.fetch(_url(server, "/report.pdf"), QUERY) == []
+    assert fetcher.fetch(_url(server, "/missing"), QUERY) == []
+
+
+class _StaticSearch:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def search(self, _query):
+        return self.rows
+
+
+def test_retrieval_uses_fetched_passages_as_snippets(server, tmp_path):
+    rows = [
+        {"url": _url(server, "/article"), "title": "Rates", "text": "short", "score": 0.9},
+        {"url": _url(server, "/missing"), "title": "Other", "text": "excerpt", "score": 0.5},
+    ]
+    question = {"id": 3, "title": QUERY}
+
+    bundle = retrieve_evidence(
+        question, _StaticSearch(rows), content_fetcher=_fetcher(tmp_path, max_docs=2)
+    )
+
+    snippets = {item.url: item.snippet for item in bundle.items}
+    assert RELEVANT in snippets[rows[0]["url"]].split("\n")
+    assert snippets[rows[1]["url"]] == "excerpt"
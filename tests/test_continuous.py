@@ -0,0 +1,97 @@
+from itertools import pairwise
+
+import pytest
+
+from src.forecasting.stats.continuous import (
+    CDF_POINTS,
+    MIN_CDF_STEP,
+    OPEN_BOUND_MASS,
+    Scaling,
+    as_number,
+    cdf_quantiles,
+    mixture_cdfs,
+    prior_quantiles,
+)
+from src.forecasting.stats.date_models import forecast_date
+
+
+def _steps(cdf):
+    return [b - a for a, b in pairwise(cdf)]
+
+
+def test_scaling_reads_metaculus_question_payload():
+    question = {
+        "type": "numeric",
+        "open_upper_bound": True,
+        "scaling": {"range_min": 1, "range_max": 1000, "zero_point": 0},
+    }
+    scaling = Scaling.from_question(question)
+    assert scaling == Scaling(1.0, 1000.0, zero_point=0.0, open_upper=True)
+    assert scaling.from_unit(0.5) == pytest.approx(31.6227766)
+    assert scaling.to_unit(scaling.from_unit(0.3)) == pytest.approx(0.3)
+    assert Scaling.from_question({"type": "numeric"}) is None
+    assert Scaling.from_question({"scaling": {"range_min": 5, "range_max": 5}}) is None
+
+
+def test_discrete_questions_use_outcome_count_for_cdf_length():
+    scaling = Scaling.from_question(
+        {"scaling": {"range_min": -0.5, "range_max": 10.5, "inbound_outcome_count": 11}}
+    )
+    cdf = mixture_cdfs([scaling], [[{"p10": 2, "p50": 4, "p90": 7}]])[0]
+    assert len(cdf) == 12
+
+
+def test_closed_bounds_pin_cdf_ends_and_keep_it_increasing():
+    scaling = Scaling(0, 100)
+    cdf = mixture_cdfs([scaling], [[{"p10": 20, "p50": 40, "p90": 70}]])[0]
+    assert len(cdf) == CDF_POINTS
+    assert cdf[0] == 0.0
+    assert cdf[-1] == pytest.approx(1.0)
+    assert min(_steps(cdf)) >= MIN_CDF_STEP
+    assert cdf_quantiles(cdf, scaling) == pytest.approx([20, 40, 70], abs=1.5)
+
+
+@pytest.mark.parametrize("quantiles", [(45, 50, 55), (50, 50, 50)])
+def test_narrow_forecasts_keep_every_step_above_the_minimum(quantiles):
+    scaling = Scaling(0, 100)
+    forecast = dict(zip(("p10", "p50", "p90"), quantiles))
+    cdf = mixture_cdfs([scaling], [[forecast]])[0]
+    assert min(_steps(cdf)) >= MIN_CDF_STEP
+
+
+def test_open_bounds_keep_tail_mass_outside_the_range():
+    scaling = Scaling(0, 100, open_lower=True, open_upper=True)
+    cdf = mixture_cdfs([scaling], [[{"p10": -50, "p50": 10, "p90": 200}]])[0]
+    assert OPEN_BOUND_MASS <= cdf[0] < 0.5
+    assert 0.5 < cdf[-1] <= 1 - OPEN_BOUND_MASS
+    assert min(_steps(cdf)) >= MIN_CDF_STEP
+
+
+def test_mixture_averages_components_and_skips_unusable_ones():
+    scaling = Scaling(0, 100)
+    low = {"p10": 10, "p50": 20, "p90": 30}
+    high = {"p10": 70, "p50": 80, "p90": 90}
+    mixed, single, empty = mixture_cdfs(
+        [scaling] * 3,
+        [[low, high], [low, {"p50": 50}, {"p10": 1e9, "p50": 2e9, "p90": 3e9}], [None, {}]],
+    )
+    assert cdf_quantiles(mixed, scaling, [0.5])[0] == pytest.approx(50, abs=2)
+    assert single == mixture_cdfs([scaling], [[low]])[0]
+    assert empty is None
+
+
+def test_date_quantiles_are_read_from_iso_strings():
+    scaling = Scaling(as_number("2027-01-01T00:00:00Z"), as_number("2029-01-01T00:00:00Z"))
+    forecast = {"date_quantiles": {"p10": "2027-06-01", "p50": "2028-01-01", "p90": "2028-06-01"}}
+    cdf = mixture_cdfs([scaling], [[forecast]])[0]
+    median = cdf_quantiles(cdf, scaling, [0.5])[0]
+    assert median == pytest.approx(as_number("2028-01-01"), abs=86400 * 10)
+
+
+def test_priors_span_the_question_range():
+    scaling = Scaling(1, 10000, zero_point=0)
+    assert prior_quantiles(scaling)["p50"] == pytest.approx(100, rel=1e-6)
+    dates = forecast_date(
+        scaling=Scaling(as_number("2020-01-01"), as_number("2100-01-01"))
+    )
+    assert as_number(dates["p10"]) < as_number(dates["p50"]) < as_number(dates["p90"])
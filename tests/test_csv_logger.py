@@ -0,0 +1,34 @@
+import csv
+import os
+
+import pytest
+
+from src.storage.csv_logger import RUN_FIELDS
+from src.storage.run_writer import RunLogWriter
+
+
+def test_run_rows_migrate_old_header(tmp_path):
+    path = tmp_path / "runs.csv"
+    path.write_text("run_id,status\n1,SUCCESS\n", encoding="utf-8")
+    with RunLogWriter() as writer:
+        writer.csv_row(path, {"run_id": "2", "status": "SUCCESS", "skipped_count": 3}, RUN_FIELDS)
+    with path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["run_id"] for r in rows] == ["1", "2"]
+    assert rows[0]["skipped_count"] == ""
+    assert rows[1]["skipped_count"] == "3"
+
+
+def test_failed_migration_leaves_old_log_intact(tmp_path, monkeypatch):
+    path = tmp_path / "runs.csv"
+    path.write_text("run_id,status\n1,SUCCESS\n", encoding="utf-8")
+    writer = RunLogWriter()
+    writer.csv_row(path, {"run_id": "2", "status": "SUCCESS"}, RUN_FIELDS)
+
+    def failing_replace(_src, _dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        writer.flush()
+    assert path.read_text(encoding="utf-8") == "run_id,status\n1,SUCCESS\n"
@@ -0,0 +1,77 @@
+import os
+from unittest.mock import patch
+
+from src.config.settings import Settings
+from src.llm.openrouter_client import OpenRouterClient
+from src.research.exa_client import ExaClient
+from src.storage.disk_cache import DiskCache
+
+
+def test_cache_hit_and_miss_counters(tmp_path):
+    cache = DiskCache(tmp_path, ttl_seconds=60, max_entries=10)
+    key = DiskCache.key_for("query", b"body")
+    assert cache.get(key) is None
+    cache.put(key, [{"url": "https://example.com"}])
+    assert cache.get(key) == [{"url": "https://example.com"}]
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_cache_entries_expire_after_ttl(tmp_path):
+    cache = DiskCache(tmp_path, ttl_seconds=60, max_entries=10)
+    cache.put("ab" * 32, {"v": 1})
+    with patch("src.storage.disk_cache.time.time", return_value=10**12):
+        assert cache.get("ab" * 32) is None
+    assert not list(tmp_path.glob("*/*.json"))
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, ttl_seconds=60, max_entries=2)
+    keys = [DiskCache.key_for(str(i)) for i in range(3)]
+    cache.put(keys[0], 0)
+    cache.put(keys[1], 1)
+    os.utime(cache._path(keys[0]), (1, 1))
+    os.utime(cache._path(keys[1]), (2, 2))
+    cache.get(keys[0])
+    cache.put(keys[2], 2)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == 0
+    assert cache.get(keys[2]) == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_exa_search_served_from_cache(tmp_path):
+    base = Settings.from_env()
+    settings = Settings(**{**base.__dict__, "exa_api_key": "fake-exa-key"})
+    client = ExaClient(settings, cache=DiskCache(tmp_path, ttl_seconds=60, max_entries=10))
+    response = type("R", (), {"json": lambda self: {"results": [{"url": "https://a", "score": 1}]}})()
+    with patch.object(client.transport, "request", return_value=response) as request_mock:
+        first = client.search("q")
+        second = client.search("q")
+        client.search("q", num_results=5)
+    assert first == second
+    assert request_mock.call_count == 2
+
+
+def test_openrouter_chat_json_served_from_cache(tmp_path):
+    base = Settings.from_env()
+    settings = Settings(**{**base.__dict__, "openrouter_api_key": "fake-openrouter-key"})
+    cache = DiskCache(tmp_path, ttl_seconds=60, max_entries=10)
+    client = OpenRouterClient(settings, cache=cache)
+    other_model = OpenRouterClient(settings, model="other/model", cache=cache)
+    with patch.object(OpenRouterClient, "_complete", return_value='{"probability": 0.4}') as complete:
+        assert client.chat_json("prompt") == {"probability": 0.4}
+        assert client.chat_json("prompt") == {"probability": 0.4}
+        client.chat_json("prompt", system_prompt="system")
+        other_model.chat_json("prompt")
+    assert complete.call_count == 3
+
+
+def test_cache_evicts_in_batches(tmp_path):
+    cache = DiskCache(tmp_path, ttl_seconds=60, max_entries=100)
+    with patch.object(cache, "_entries", wraps=cache._entries) as scans:
+        for i in range(150):
+            cache.put(DiskCache.key_for(str(i)), i)
+    assert len(list(tmp_path.glob("*/*.json"))) <= 100
+    # One scan to count the entries, then one per pass trimming 101 entries to 90.
+    assert scans.call_count == 6
+    assert cache.stats()["evictions"] == 55
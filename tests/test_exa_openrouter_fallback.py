@@ -1,3 +1,6 @@
+import json
+from dataclasses import replace
+from http.client import HTTPMessage
 from unittest.mock import patch
 from urllib.error import HTTPError
 
@@ -5,6 +8,7 @@ import pytest
 
 from src.config.settings import Settings
 from src.llm.openrouter_client import OpenRouterClient
+from src.net.transport import Response
 from src.research.exa_client import ExaClient
 
 
@@ -40,7 +44,7 @@ def test_exa_search_raises_on_http_error():
     settings = _settings()
     client = ExaClient(settings)
 
-    with patch("src.research.exa_client.request.urlopen", side_effect=HTTPError(
+    with patch.object(client.transport, "request", side_effect=HTTPError(
         "http://example.com", 403, "Forbidden", {}, None
     )):
         with pytest.raises(RuntimeError, match="Exa API request failed"):
@@ -58,7 +62,7 @@ def test_openrouter_chat_json_raises_on_http_error():
     settings = _settings()
     client = OpenRouterClient(settings)
 
-    with patch("src.llm.openrouter_client.request.urlopen", side_effect=HTTPError(
+    with patch.object(client.transport, "request", side_effect=HTTPError(
         "http://example.com", 403, "Forbidden", {}, None
     )):
         with pytest.raises(RuntimeError, match="OpenRouter API request failed"):
@@ -76,8 +80,31 @@ def test_openrouter_chat_raises_on_http_error():
     settings = _settings()
     client = OpenRouterClient(settings)
 
-    with patch("src.llm.openrouter_client.request.urlopen", side_effect=HTTPError(
+    with patch.object(client.transport, "request", side_effect=HTTPError(
         "http://example.com", 403, "Forbidden", {}, None
     )):
         with pytest.raises(RuntimeError, match="OpenRouter API request failed"):
             client.chat("test prompt")
+
+
+def _completion(content: str) -> Response:
+    body = json.dumps({"choices": [{"message": {"content": content}}]}).encode("utf-8")
+    return Response(status=200, headers=HTTPMessage(), body=body, url="")
+
+
+def test_openrouter_chat_json_asks_again_after_invalid_json():
+    client = OpenRouterClient(replace(_settings(), retries=2))
+    replies = [_completion("not json"), _completion('{"probability": 0.4}')]
+    with patch.object(client.transport, "request", side_effect=replies) as request:
+        assert client.chat_json("test prompt") == {"probability": 0.4}
+    assert request.call_count == 2
+
+
+def test_openrouter_chat_json_gives_up_after_retries():
+    client = OpenRouterClient(replace(_settings(), retries=2))
+    replies = [_completion("not json"), _completion("still not json")]
+    with (
+        patch.object(client.transport, "request", side_effect=replies),
+        pytest.raises(RuntimeError, match="invalid JSON content"),
+    ):
+        client.chat_json("test prompt")
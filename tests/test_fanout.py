@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+
+from src.llm.fanout import ForecasterFanout, aggregate_outputs, trimmed_mean
+from src.llm.roles import run_roles
+from src.research.evidence import EvidenceBundle
+
+
+class StubModel:
+    def __init__(self, model: str, output: dict | None, delay: float = 0.0):
+        self.model = model
+        self.output = output
+        self.delay = delay
+        self.finished = threading.Event()
+        self.cancelled = threading.Event()
+
+    def chat_json(self, _prompt: str, _system_prompt: str | None = None, cancel=None) -> dict:
+        if cancel is None:
+            time.sleep(self.delay)
+        elif cancel.wait(self.delay):
+            self.cancelled.set()
+            raise RuntimeError("cancelled")
+        self.finished.set()
+        if self.output is None:
+            raise RuntimeError("provider down")
+        return self.output
+
+
+def test_trimmed_mean_drops_extremes():
+    assert trimmed_mean([0.1, 0.5, 0.6, 0.7, 0.99], trim=0.2) == pytest.approx(0.6)
+    assert trimmed_mean([0.3], trim=0.4) == 0.3
+
+
+def test_aggregate_outputs_reduces_probabilities_quantiles_and_distributions():
+    outputs = [
+        {"probability": 0.2, "p50": 1.0, "distribution": [1, 1], "rationale": "a"},
+        {"probability": 0.6, "p50": 3.0, "distribution": [1, 3]},
+        {"probability": 0.9, "p50": "n/a", "distribution": [1, 2, 3]},
+    ]
+    merged = aggregate_outputs(outputs)
+    assert merged["probability"] == 0.6
+    assert merged["p50"] == 2.0
+    assert merged["distribution"] == pytest.approx([1 / 3, 2 / 3])
+    assert merged["rationale"] == "a"
+    with pytest.raises(ValueError):
+        aggregate_outputs(outputs, method="mode")
+
+
+def test_fanout_returns_at_budget_and_cancels_stragglers():
+    slow = StubModel("slow", {"probability": 0.99}, delay=5.0)
+    fanout = ForecasterFanout(
+        [StubModel("a", {"probability": 0.2}), StubModel("b", {"probability": 0.4}), slow],
+        quorum=2,
+        budget_seconds=0.05,
+    )
+    start = time.monotonic()
+    out = fanout.chat_json("prompt")
+    assert time.monotonic() - start < 0.5
+    assert out["probability"] == pytest.approx(0.3)
+    assert sorted(out["models"]) == ["a", "b"]
+    assert slow.cancelled.wait(1.0)
+    assert not slow.finished.is_set()
+
+
+def test_fanout_returns_early_when_every_model_answered_and_skips_failures():
+    fanout = ForecasterFanout(
+        [
+            StubModel("down", None),
+            StubModel("a", {"probability": 0.2}),
+            StubModel("late", {"probability": 0.4}, delay=0.1),
+        ],
+        quorum=2,
+        budget_seconds=5.0,
+    )
+    start = time.monotonic()
+    out = fanout.chat_json("prompt")
+    assert time.monotonic() - start < 1.0
+    assert sorted(out["models"]) == ["a", "late"]
+
+
+def test_fanout_does_not_wait_past_budget_for_quorum():
+    slow = StubModel("slow", {"probability": 0.4}, delay=5.0)
+    fanout = ForecasterFanout([StubModel("a", {"probability": 0.2}), slow], 2, 0.05)
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="1/2"):
+        fanout.chat_json("prompt")
+    assert time.monotonic() - start < 0.5
+    assert slow.cancelled.wait(1.0)
+
+
+def test_fanout_raises_when_every_model_fails():
+    fanout = ForecasterFanout([StubModel("a", None), StubModel("b", None)], 2, 1.0)
+    with pytest.raises(RuntimeError):
+        fanout.chat_json("prompt")
+
+
+def test_run_roles_routes_forecaster_through_role_clients():
+    class SingleModel:
+        def chat_json(self, _prompt: str) -> dict:
+            return {"probability": 0.1}
+
+    fanout = ForecasterFanout([StubModel("a", {"probability": 0.7})], 1, 1.0)
+    outputs = run_roles(
+        {"id": 1, "title": "Test"},
+        EvidenceBundle(question_id=1, items=[]),
+        SingleModel(),
+        role_clients={"forecaster": fanout},
+    )
+    assert outputs["summarizer"] == {"probability": 0.1}
+    assert outputs["forecaster"] == {"probability": 0.7, "models": ["a"]}
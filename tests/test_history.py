@@ -0,0 +1,48 @@
+import json
+
+from src.storage.history import ForecastHistory
+
+
+def _record(run_time: str, qid: int, probability: float, status: str = "SUBMITTED") -> dict:
+    return {
+        "run_time_utc": run_time,
+        "question_id": qid,
+        "question_type": "binary",
+        "baseline": {"probability": 0.5},
+        "stats": {"probability": 0.4},
+        "llm": {"probability": probability},
+        "final_forecast": {"probability": probability},
+        "submission": {"submitted": status == "SUBMITTED", "status": status},
+        "evidence": [{"url": "https://example.com"}],
+    }
+
+
+def test_latest_per_question_and_trajectory(tmp_path):
+    history = ForecastHistory(tmp_path / "history.sqlite3")
+    history.append(
+        [
+            _record("2026-01-01T00:00:00+00:00", 1, 0.2),
+            _record("2026-01-01T00:00:00+00:00", 2, 0.7),
+            _record("2026-01-01T00:30:00+00:00", 1, 0.3, status="SKIPPED_UNCHANGED"),
+        ]
+    )
+    latest = history.latest_per_question()
+    assert [(row["question_id"], row["probability"]) for row in latest] == [(1, 0.3), (2, 0.7)]
+    assert latest[0]["submitted"] is False
+    assert latest[0]["llm"] == {"probability": 0.3}
+
+    trajectory = history.trajectory(1)
+    assert [row["probability"] for row in trajectory] == [0.2, 0.3]
+    history.close()
+
+
+def test_import_jsonl_backfills(tmp_path):
+    jsonl = tmp_path / "forecasts.jsonl"
+    jsonl.write_text(
+        "\n".join(json.dumps(_record(f"2026-01-0{i}T00:00:00+00:00", 5, i / 10)) for i in (1, 2))
+        + "\n",
+        encoding="utf-8",
+    )
+    history = ForecastHistory(tmp_path / "history.sqlite3")
+    assert history.import_jsonl(jsonl) == 2
+    assert len(history.trajectory(5)) == 2
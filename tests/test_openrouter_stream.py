@@ -0,0 +1,110 @@
+import json
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.llm.openrouter_client import AbandonedRequest, OpenRouterClient
+from src.llm.structured import IncrementalJSONParser
+from src.net.transport import HTTPTransport, RetryPolicy, iter_sse_data
+from tests.test_exa_openrouter_fallback import _settings
+
+
+class _SSEHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server.requests.append(body)
+        delay = server.delays.pop(0) if server.delays else 0.0
+        time.sleep(delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [": OPENROUTER PROCESSING"]
+        events += [
+            "data: " + json.dumps({"choices": [{"delta": {"content": piece}}]})
+            for piece in server.pieces
+        ]
+        events.append("data: [DONE]")
+        for event in events:
+            payload = (event + "\n\n").encode("utf-8")
+            self.wfile.write(f"{len(payload):x}\r\n".encode() + payload + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def sse_server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SSEHandler)
+    httpd.requests = []
+    httpd.delays = []
+    httpd.pieces = ['{"probab', 'ility": 0.', '7, "note": "}"}', " trailing text"]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(httpd, **overrides) -> OpenRouterClient:
+    settings = replace(_settings(), llm_stream=True, **overrides)
+    client = OpenRouterClient(settings, transport=HTTPTransport(retry=RetryPolicy(attempts=1)))
+    client._base_url = f"http://127.0.0.1:{httpd.server_address[1]}/chat"
+    return client
+
+
+def test_iter_sse_data_skips_comments_and_joins_lines():
+    lines = [b": ping", b"data: a", b"data: b", b"", b"event: x", b"data:c", b""]
+    assert list(iter_sse_data(lines)) == ["a\nb", "c"]
+
+
+def test_incremental_parser_stops_at_first_complete_object():
+    parser = IncrementalJSONParser()
+    assert parser.feed('Sure: {"a": "{') is None
+    assert parser.feed('x}", "b": {"c": 1}') is None
+    assert parser.feed("} and more {") == '{"a": "{x}", "b": {"c": 1}}'
+
+
+def test_streamed_chat_json_parses_incrementally(sse_server):
+    client = _client(sse_server)
+    assert client.chat_json("prompt") == {"probability": 0.7, "note": "}"}
+    assert sse_server.requests[0]["stream"] is True
+
+
+def test_streamed_chat_joins_all_deltas(sse_server):
+    sse_server.pieces = ["Hello", ", ", "world"]
+    assert _client(sse_server).chat("prompt") == "Hello, world"
+
+
+def test_deadline_bounds_call_across_retries(sse_server):
+    sse_server.delays = [1.0]
+    client = _client(sse_server, llm_deadline_seconds=0.2)
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="OpenRouter API request failed"):
+        client.chat_json("prompt")
+    assert time.monotonic() - start < 0.9
+
+
+def test_hedged_request_answers_before_slow_first_attempt(sse_server):
+    sse_server.delays = [1.0, 0.0]
+    client = _client(sse_server, llm_hedge_after_seconds=0.1)
+    start = time.monotonic()
+    assert client.chat_json("prompt")["probability"] == 0.7
+    assert time.monotonic() - start < 0.9
+    assert len(sse_server.requests) == 2
+
+
+def test_cancelled_chat_json_sends_no_request(sse_server):
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(AbandonedRequest):
+        _client(sse_server).chat_json("prompt", cancel=cancel)
+    assert sse_server.requests == []
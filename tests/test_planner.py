@@ -0,0 +1,70 @@
+import threading
+import time
+
+from src.research.planner import ResearchPlanner, plan_queries
+from src.research.retrieval import retrieve_evidence
+
+QUESTION = {
+    "id": 7,
+    "title": "Will OpenAI release GPT-6 before July 2027?",
+    "description": "OpenAI has announced a successor model. Timelines remain unclear.",
+    "resolution_criteria": "Resolves Yes if OpenAI makes GPT-6 generally available via its API.",
+}
+
+
+class RecordingSearch:
+    def __init__(self, results_per_query: dict[str, list[str]] | None = None, delay: float = 0.0):
+        self.results = results_per_query or {}
+        self.delay = delay
+        self.queries: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def search(self, query: str) -> list[dict]:
+        with self._lock:
+            self.queries.append(query)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        fresh = [f"https://example.com/{len(self.queries)}-{i}" for i in range(3)]
+        urls = self.results.get(query, fresh)
+        return [{"url": url, "title": url, "text": "", "score": 0.5} for url in urls]
+
+
+def test_plan_queries_are_diverse_and_within_budget():
+    queries = plan_queries(QUESTION, max_queries=4)
+    assert queries[0] == QUESTION["title"]
+    assert len(queries) == 4
+    assert any("latest news" in q for q in queries)
+    assert any("generally available" in q for q in queries)
+    assert len(set(queries)) == len(queries)
+    assert len(plan_queries(QUESTION, max_queries=2)) == 2
+
+
+def test_planner_issues_queries_concurrently_up_to_budget():
+    search = RecordingSearch(delay=0.05)
+    rows = ResearchPlanner(max_queries=4, concurrency=2, min_new_sources=0).research(
+        QUESTION, search
+    )
+    assert len(search.queries) == 4
+    assert search.max_active == 2
+    assert len(rows) == 12
+
+
+def test_planner_stops_when_waves_add_few_new_sources():
+    queries = plan_queries(QUESTION, max_queries=4)
+    same = ["https://example.com/only"]
+    search = RecordingSearch({q: same for q in queries})
+    ResearchPlanner(max_queries=4, concurrency=1, min_new_sources=1).research(QUESTION, search)
+    assert search.queries == queries[:2]
+
+
+def test_retrieve_evidence_uses_planner():
+    search = RecordingSearch()
+    evidence = retrieve_evidence(QUESTION, search, planner=ResearchPlanner(max_queries=3))
+    assert len(search.queries) == 3
+    assert evidence.question_id == 7
+    assert evidence.items
@@ -0,0 +1,195 @@
+import random
+import threading
+import time
+from dataclasses import replace
+
+from src.config.settings import Settings
+from src.execution.runner import prepare_forecasts
+from src.research.pool import EvidencePool, keywords
+from src.storage.report import write_summary
+
+
+class CountingSearch:
+    def __init__(self, rows_per_query: dict[str, list[dict]]):
+        self.rows = rows_per_query
+        self.queries: list[str] = []
+
+    def search(self, query: str) -> list[dict]:
+        self.queries.append(query)
+        return self.rows.get(query, [])
+
+
+def _row(url: str, title: str, text: str = "") -> dict:
+    return {"url": url, "title": title, "text": text, "score": 0.5}
+
+
+OPENAI_ROWS = [
+    _row(f"https://example.com/openai-{i}", f"OpenAI GPT-6 release report {i}") for i in range(4)
+]
+
+
+def test_keywords_drop_stopwords_and_short_tokens():
+    assert keywords("Will OpenAI release GPT-6 in 2027?") == {"openai", "release", "gpt", "2027"}
+
+
+def test_overlapping_query_is_answered_from_pool():
+    search = CountingSearch({"OpenAI GPT-6 release": OPENAI_ROWS})
+    pool = EvidencePool(search, min_docs=3)
+
+    assert pool.search("OpenAI GPT-6 release") == OPENAI_ROWS
+    reused = pool.search("When will OpenAI release GPT-6?")
+
+    assert search.queries == ["OpenAI GPT-6 release"]
+    assert {row["url"] for row in reused} == {row["url"] for row in OPENAI_ROWS}
+    stats = pool.stats()
+    assert stats["queries"] == 2
+    assert stats["pool_answers"] == 1
+    assert stats["searches"] == 1
+    assert stats["documents"] == 4
+    assert stats["reuse_ratio"] == 0.5
+
+
+def test_too_few_pooled_documents_searches_and_merges_extras():
+    search = CountingSearch(
+        {
+            "OpenAI GPT-6 release": OPENAI_ROWS[:1],
+            "OpenAI GPT-6 release date": [_row("https://example.com/new", "GPT-6 date")],
+        }
+    )
+    pool = EvidencePool(search, min_docs=3)
+    pool.search("OpenAI GPT-6 release")
+
+    rows = pool.search("OpenAI GPT-6 release date")
+
+    assert search.queries == ["OpenAI GPT-6 release", "OpenAI GPT-6 release date"]
+    assert [row["url"] for row in rows] == ["https://example.com/new", OPENAI_ROWS[0]["url"]]
+    assert pool.stats()["documents_reused"] == 1
+
+
+def test_unrelated_query_does_not_match_pool():
+    search = CountingSearch({"OpenAI GPT-6 release": OPENAI_ROWS})
+    pool = EvidencePool(search, min_docs=1)
+    pool.search("OpenAI GPT-6 release")
+
+    assert pool.lookup("Bank of England interest rate decision") == []
+    pool.search("Bank of England interest rate decision")
+    assert len(search.queries) == 2
+
+
+def test_summary_reports_pool_reuse(tmp_path):
+    path = tmp_path / "summary.md"
+    stats = {
+        "queries": 4,
+        "pool_answers": 1,
+        "searches": 3,
+        "documents_served": 10,
+        "documents_reused": 3,
+        "documents": 7,
+        "reuse_ratio": 0.3,
+    }
+    write_summary(path, [], "2026-10-17T00:00:00Z", "2026-10-16T20:00:00-04:00", pool_stats=stats)
+
+    text = path.read_text(encoding="utf-8")
+    assert "## Evidence pool" in text
+    assert "reuse_ratio=30%" in text
+
+
+def test_views_only_see_documents_from_earlier_views():
+    search = CountingSearch({"OpenAI GPT-6 release": OPENAI_ROWS})
+    pool = EvidencePool(search, min_docs=3)
+    first, second = pool.view(), pool.view()
+
+    assert second.search("When will OpenAI release GPT-6?") == []
+    assert first.search("OpenAI GPT-6 release") == OPENAI_ROWS
+    assert first.resolve(OPENAI_ROWS) == OPENAI_ROWS
+
+    assert second.resolve([]) == OPENAI_ROWS
+    assert search.queries == ["When will OpenAI release GPT-6?", "OpenAI GPT-6 release"]
+
+
+def test_identical_query_is_searched_once_across_views():
+    search = CountingSearch({"OpenAI GPT-6 release": OPENAI_ROWS})
+    pool = EvidencePool(search, min_docs=3)
+    first, second = pool.view(), pool.view()
+
+    assert second.search("OpenAI GPT-6 release") == OPENAI_ROWS
+    assert first.search("OpenAI GPT-6 release") == OPENAI_ROWS
+    assert search.queries == ["OpenAI GPT-6 release"]
+    assert pool.stats()["pool_answers"] == 1
+
+
+def test_resolve_waits_for_earlier_views():
+    search = CountingSearch({"OpenAI GPT-6 release": OPENAI_ROWS})
+    pool = EvidencePool(search, min_docs=3)
+    first, second = pool.view(), pool.view()
+    second.search("OpenAI GPT-6")
+    served: list[list[dict]] = []
+    waiter = threading.Thread(target=lambda: served.append(second.resolve([])))
+    waiter.start()
+    time.sleep(0.05)
+    assert not served
+
+    first.search("OpenAI GPT-6 release")
+    first.done()
+    waiter.join(timeout=2)
+    assert len(served[0]) == 4
+
+
+class SlowSearch:
+    """Records how many searches run at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def search(self, query: str) -> list[dict]:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return [_row(f"https://example.com/{query}", query)]
+
+
+def test_searches_for_different_questions_overlap():
+    settings = replace(Settings.from_env(), workers=4, research_max_queries=1)
+    questions = [{"id": i, "title": f"Question {i}", "type": "binary"} for i in range(4)]
+    search = SlowSearch()
+
+    prepare_forecasts(questions, settings, EvidencePool(search, min_docs=2), StubLLM())
+
+    assert search.peak > 1
+
+
+class JitterySearch:
+    """Shared-topic results returned after a random delay."""
+
+    def search(self, query: str) -> list[dict]:
+        time.sleep(random.uniform(0, 0.02))
+        words = sorted(keywords(query))
+        return [
+            _row(f"https://example.com/{word}-{i}", f"OpenAI GPT-6 {word} report {i}")
+            for word in words
+            for i in range(2)
+        ]
+
+
+class StubLLM:
+    def chat_json(self, _prompt: str) -> dict:
+        return {"probability": 0.6}
+
+
+def test_pooled_evidence_is_independent_of_thread_timing():
+    settings = replace(Settings.from_env(), workers=4)
+    questions = [
+        {"id": i, "title": f"Will OpenAI release GPT-6 {topic}?", "type": "binary"}
+        for i, topic in enumerate(["soon", "this year", "publicly", "via API", "before July"])
+    ]
+    fingerprints = set()
+    for _ in range(10):
+        pool = EvidencePool(JitterySearch(), min_docs=2)
+        prepared = prepare_forecasts(questions, settings, pool, StubLLM())
+        fingerprints.add(tuple(p["fingerprint"] for p in prepared))
+    assert len(fingerprints) == 1
@@ -0,0 +1,60 @@
+from src.llm.prompt_builder import (
+    estimate_tokens,
+    load_template,
+    pack_evidence,
+    role_prompt,
+    shared_prefix,
+)
+from src.llm.roles import run_roles
+from src.research.evidence import EvidenceBundle, EvidenceItem
+
+
+def _item(idx: int, score: float, snippet: str = "x" * 200) -> EvidenceItem:
+    return EvidenceItem(
+        idx=idx, title=f"T{idx}", url=f"https://e.com/{idx}", snippet=snippet, score=score
+    )
+
+
+def test_estimate_tokens_rounds_up_per_four_characters():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcde") == 2
+
+
+def test_pack_evidence_keeps_best_items_within_budget():
+    items = [_item(1, 0.2), _item(2, 0.9), _item(3, 0.5)]
+    packed = pack_evidence(items, budget_tokens=90)
+    assert packed[0].startswith("[2] T2")
+    assert packed[1].startswith("[3] T3")
+    assert packed[1].endswith("...")
+    assert sum(estimate_tokens(block) + 1 for block in packed) <= 90
+
+
+def test_load_template_is_cached_and_falls_back_to_default():
+    assert load_template("forecaster") is load_template("forecaster")
+    assert load_template("missing-role") == load_template("default")
+
+
+def test_role_prompts_share_the_question_prefix():
+    bundle = EvidenceBundle(question_id=1, items=[_item(1, 0.5, "snippet-marker")])
+    prefix = shared_prefix({"title": "Will it rain?", "type": "binary"}, bundle)
+    assert "snippet-marker" in prefix
+    first = role_prompt("researcher", prefix, {})
+    second = role_prompt("forecaster", prefix, {"summarizer": {"brief": "b"}})
+    assert first.startswith(prefix) and second.startswith(prefix)
+    assert second.endswith('Summarizer output: {"brief": "b"}')
+
+
+def test_run_roles_sends_evidence_snippets():
+    class Recording:
+        def __init__(self):
+            self.prompts = []
+
+        def chat_json(self, prompt: str) -> dict:
+            self.prompts.append(prompt)
+            return {}
+
+    client = Recording()
+    bundle = EvidenceBundle(question_id=1, items=[_item(1, 0.5, "snippet-marker")])
+    run_roles({"id": 1, "title": "Test"}, bundle, client)
+    assert len(client.prompts) == 4
+    assert all("snippet-marker" in prompt for prompt in client.prompts)
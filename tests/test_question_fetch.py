@@ -0,0 +1,96 @@
+from datetime import UTC, datetime
+from http.client import HTTPMessage
+from unittest.mock import patch
+
+from src.config.settings import Settings
+from src.execution.runner import prepare_forecasts
+from src.metaculus.client import MetaculusClient
+from src.metaculus.snapshots import QuestionSnapshotStore
+from src.net.transport import Response
+
+
+def _response(status: int, payload: bytes = b"", etag: str | None = None) -> Response:
+    headers = HTTPMessage()
+    if etag:
+        headers["ETag"] = etag
+    return Response(status=status, headers=headers, body=payload, url="")
+
+
+PAGE_1 = (
+    b'{"results": [{"id": 10, "question": {"id": 1, "title": "A"}}],'
+    b' "next": "https://next/page2"}'
+)
+PAGE_2 = (
+    b'{"results": [{"id": 20, "question": {"id": 2, "title": "B"}}, {"id": 30}],'
+    b' "next": null}'
+)
+
+
+def _client() -> MetaculusClient:
+    base = Settings.from_env()
+    return MetaculusClient(Settings(**{**base.__dict__, "tournament_id": 32916}))
+
+
+def test_questions_follow_next_pages():
+    client = _client()
+    responses = [_response(200, PAGE_1), _response(200, PAGE_2)]
+    with patch.object(client.transport, "request", side_effect=responses):
+        questions = client.questions()
+    assert [(q["id"], q["post_id"]) for q in questions] == [(1, 10), (2, 20)]
+
+
+def test_questions_revalidate_pages_with_etag(tmp_path):
+    path = tmp_path / "snapshots.json"
+    client = _client()
+    first = QuestionSnapshotStore(path)
+    responses = [_response(200, PAGE_1, etag='"v1"'), _response(200, PAGE_2, etag='"v2"')]
+    with patch.object(client.transport, "request", side_effect=responses):
+        client.questions(first)
+    first.save()
+    assert first.changed_post_ids == [10, 20]
+
+    second = QuestionSnapshotStore(path)
+    not_modified = [_response(304), _response(304)]
+    with patch.object(client.transport, "request", side_effect=not_modified) as req:
+        questions = client.questions(second)
+    assert [q["id"] for q in questions] == [1, 2]
+    assert req.call_args_list[0].kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert second.changed_post_ids == []
+
+
+class RecordingSearch:
+    def __init__(self):
+        self.queries: list[str] = []
+
+    def search(self, query: str) -> list[dict]:
+        self.queries.append(query)
+        return []
+
+
+class StubLLM:
+    def chat_json(self, _prompt: str) -> dict:
+        return {"probability": 0.6}
+
+
+def test_unchanged_post_within_cooldown_skips_research(tmp_path):
+    snapshots = QuestionSnapshotStore(tmp_path / "snapshots.json")
+    post = {"id": 10, "question": {"id": 1, "title": "Will A happen?", "type": "binary"}}
+    snapshots.observe(post)
+    question = {**post["question"], "post_id": 10}
+    now = datetime.now(UTC).isoformat()
+    settings = Settings.from_env()
+
+    search = RecordingSearch()
+    unchanged = {"1": {"hash": "h", "post_digest": snapshots.digest(10), "timestamp": now}}
+    prepared = prepare_forecasts(
+        [question], settings, search, StubLLM(), unchanged, snapshots=snapshots
+    )
+    assert prepared[0]["skipped"]
+    assert search.queries == []
+
+    changed = {"1": {"hash": "h", "post_digest": "older", "timestamp": now}}
+    prepared = prepare_forecasts(
+        [question], settings, search, StubLLM(), changed, snapshots=snapshots
+    )
+    assert not prepared[0]["skipped"]
+    assert search.queries
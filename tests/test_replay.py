@@ -0,0 +1,137 @@
+import json
+import time
+from dataclasses import replace
+from urllib.error import HTTPError
+
+import pytest
+
+from src.config.settings import Settings
+from src.execution.runner import run_once
+from src.net.replay import (
+    Cassette,
+    RecordingTransport,
+    ReplayServer,
+    ReplayTransport,
+    fixture_cassette,
+)
+from src.net.transport import RetryPolicy
+
+API_URL = "https://api.example.com/items"
+
+
+def _cassette(*bodies: str) -> Cassette:
+    return Cassette(
+        interactions=[
+            {
+                "request": {"method": "GET", "url": API_URL},
+                "response": {"status": 200, "headers": {"ETag": f'"{i}"'}, "body": body},
+            }
+            for i, body in enumerate(bodies)
+        ]
+    )
+
+
+@pytest.fixture
+def replay_server():
+    servers = []
+
+    def start(cassette: Cassette, **kwargs) -> ReplayServer:
+        server = ReplayServer(cassette, **kwargs).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_replay_serves_recordings_in_order_then_repeats_last(replay_server):
+    transport = ReplayTransport(replay_server(_cassette('{"n": 1}', '{"n": 2}')))
+    bodies = [transport.request("GET", API_URL).json()["n"] for _ in range(3)]
+    assert bodies == [1, 2, 2]
+    assert transport.request("GET", API_URL).headers["ETag"] == '"1"'
+
+
+def test_unmatched_request_is_404(replay_server):
+    transport = ReplayTransport(replay_server(_cassette("{}")), retry=RetryPolicy(attempts=1))
+    with pytest.raises(HTTPError) as exc:
+        transport.request("GET", "https://api.example.com/other")
+    assert exc.value.code == 404
+
+
+def test_injected_latency_and_errors(replay_server):
+    slow = ReplayTransport(replay_server(_cassette("{}"), latency_seconds=0.05))
+    start = time.monotonic()
+    slow.request("GET", API_URL)
+    assert time.monotonic() - start >= 0.05
+
+    server = replay_server(_cassette("{}"), error_rate=1.0)
+    failing = ReplayTransport(server, retry=RetryPolicy(attempts=2, backoff_base=0))
+    with pytest.raises(HTTPError) as exc:
+        failing.request("GET", API_URL)
+    assert exc.value.code == 503
+    assert server.stats()["injected_errors"] == 2
+
+
+def test_recorded_cassette_replays_identically(replay_server, tmp_path):
+    live = replay_server(Cassette())
+    live.cassette.interactions.append(
+        {"request": {"method": "POST", "url": live.url}, "response": {"status": 200, "body": "{}"}}
+    )
+    recorder = RecordingTransport(Cassette(tmp_path / "run.json"))
+    recorded = recorder.request("POST", live.url, body=b'{"q": 1}')
+    recorder.close()
+
+    cassette = Cassette.load(tmp_path / "run.json")
+    assert cassette.interactions[0]["request"]["method"] == "POST"
+    replayer = ReplayTransport(replay_server(cassette), retry=RetryPolicy(attempts=1))
+    assert replayer.request("POST", live.url, body=b'{"q": 1}').body == recorded.body
+    with pytest.raises(HTTPError):
+        replayer.request("POST", live.url, body=b'{"q": 2}')
+
+
+def test_run_once_replays_fixtures_offline(tmp_path):
+    base = Settings.from_env()
+    settings = replace(
+        base,
+        metaculus_token="replay",
+        exa_api_key="replay",
+        openrouter_api_key="replay",
+        data_dir=tmp_path,
+        http_mode="replay",
+        cassette_path=tmp_path / "missing.json",
+    )
+    assert fixture_cassette(settings).interactions
+    assert run_once(settings) == 0
+    runs = (tmp_path / "runs.csv").read_text(encoding="utf-8").splitlines()
+    assert runs[1].split(",")[3:6] == ["SUCCESS", "2", "1"]
+    record = json.loads((tmp_path / "forecasts.jsonl").read_text(encoding="utf-8").splitlines()[0])
+    assert record["llm"]["probability"] == 0.5
+
+
+def test_failed_submission_is_retried_on_next_run(tmp_path):
+    settings = replace(
+        Settings.from_env(),
+        metaculus_token="replay",
+        exa_api_key="replay",
+        openrouter_api_key="replay",
+        data_dir=tmp_path,
+        http_mode="replay",
+        cassette_path=tmp_path / "rejecting.json",
+    )
+    cassette = fixture_cassette(settings)
+    for item in cassette.interactions:
+        if item["request"]["url"].endswith("/questions/forecast/"):
+            item["response"].update(status=400, body='{"detail": "rejected"}')
+    cassette.save(settings.cassette_path)
+
+    assert run_once(settings) == 0
+    assert run_once(settings) == 0
+
+    lines = (tmp_path / "forecasts.jsonl").read_text(encoding="utf-8").splitlines()
+    statuses = [
+        json.loads(line)["submission"]["status"]
+        for line in lines
+        if json.loads(line)["question_id"] == 1
+    ]
+    assert statuses == ["SUBMIT_FAILED", "SUBMIT_FAILED"]
@@ -0,0 +1,62 @@
+from email.message import Message
+
+import pytest
+
+from src.execution.risk import RateLimiter, TokenBucket
+from src.net.transport import retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_defer_blocks_callers():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100.0, clock=clock, sleep=clock.sleep)
+    bucket.defer(3.0)
+    assert bucket.acquire() == pytest.approx(3.0)
+
+
+def test_token_bucket_spaces_callers_queued_behind_defer():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1.0, clock=clock, sleep=clock.sleep)
+    bucket.defer(10.0)
+    waits = [bucket._reserve() for _ in range(5)]
+    assert waits == pytest.approx([10.0, 11.0, 12.0, 13.0, 14.0])
+
+
+def test_rate_limiter_reports_requests_and_throttled_time():
+    limiter = RateLimiter({"api.exa.ai": 1000.0})
+    limiter.acquire("api.exa.ai")
+    limiter.acquire("openrouter.ai")
+    stats = limiter.stats()
+    assert stats["api.exa.ai"]["requests"] == 1
+    assert stats["openrouter.ai"] == {"requests": 1, "throttled_seconds": 0.0}
+
+
+def test_retry_after_parses_seconds_and_http_dates():
+    headers = Message()
+    headers["Retry-After"] = "7"
+    assert retry_after_seconds(headers) == 7.0
+    dated = Message()
+    dated["Retry-After"] = "Wed, 21 Oct 2015 07:28:10 GMT"
+    assert retry_after_seconds(dated, now=1445412480.0) == pytest.approx(10.0)
+    assert retry_after_seconds(Message()) is None
@@ -0,0 +1,78 @@
+import csv
+import json
+import os
+import threading
+
+import pytest
+
+from src.storage.csv_logger import RUN_FIELDS
+from src.storage.run_writer import RunLogWriter
+
+
+def test_writer_buffers_until_flush(tmp_path):
+    jsonl = tmp_path / "forecasts.jsonl"
+    runs = tmp_path / "runs.csv"
+    writer = RunLogWriter()
+    writer.jsonl_record(jsonl, {"question_id": 1})
+    writer.csv_row(runs, {"run_id": "r1", "status": "SUCCESS"}, RUN_FIELDS)
+    assert not jsonl.exists()
+    assert not runs.exists()
+    writer.flush()
+    assert json.loads(jsonl.read_text(encoding="utf-8")) == {"question_id": 1}
+    with runs.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["run_id"] == "r1"
+    assert set(tmp_path.iterdir()) == {jsonl, runs}
+
+
+def test_writer_appends_to_existing_sinks_from_many_threads(tmp_path):
+    jsonl = tmp_path / "forecasts.jsonl"
+    jsonl.write_text('{"question_id": 0}\n', encoding="utf-8")
+    with RunLogWriter() as writer:
+        threads = [
+            threading.Thread(target=writer.jsonl_record, args=(jsonl, {"question_id": i}))
+            for i in range(1, 21)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    lines = jsonl.read_text(encoding="utf-8").splitlines()
+    ids = [json.loads(line)["question_id"] for line in lines]
+    assert ids[0] == 0
+    assert sorted(ids) == list(range(21))
+
+
+def test_writer_flushes_on_exception(tmp_path):
+    jsonl = tmp_path / "forecasts.jsonl"
+    try:
+        with RunLogWriter() as writer:
+            writer.jsonl_record(jsonl, {"question_id": 1})
+            raise RuntimeError("crash")
+    except RuntimeError:
+        pass
+    assert jsonl.read_text(encoding="utf-8") == '{"question_id": 1}\n'
+
+
+def test_failed_flush_truncates_back_to_previous_contents(tmp_path, monkeypatch):
+    jsonl = tmp_path / "forecasts.jsonl"
+    jsonl.write_text('{"question_id": 0}\n', encoding="utf-8")
+    writer = RunLogWriter()
+    writer.jsonl_record(jsonl, {"question_id": 1})
+
+    def failing_fsync(_fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        writer.flush()
+    assert jsonl.read_text(encoding="utf-8") == '{"question_id": 0}\n'
+
+
+def test_flush_cuts_off_a_torn_last_line(tmp_path):
+    jsonl = tmp_path / "forecasts.jsonl"
+    jsonl.write_text('{"question_id": 0}\n{"question_', encoding="utf-8")
+    with RunLogWriter() as writer:
+        writer.jsonl_record(jsonl, {"question_id": 1})
+    lines = jsonl.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["question_id"] for line in lines] == [0, 1]
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from src.config.settings import Settings
+from src.config.timezone import now_utc
+from src.execution.runner import prepare_forecasts
+
+
+class SlowExaClient:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def search(self, query: str) -> list[dict]:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return [{"title": query, "url": f"https://example.com/{query}", "text": "x", "score": 0.5}]
+
+
+class StubLLMClient:
+    def chat_json(self, _prompt: str) -> dict:
+        return {"probability": 0.7}
+
+
+def _settings(workers: int) -> Settings:
+    base = Settings.from_env()
+    return Settings(**{**base.__dict__, "workers": workers})
+
+
+def test_prepare_forecasts_preserves_question_order():
+    questions = [{"id": i, "title": f"Q{i}", "type": "binary"} for i in range(6)]
+    prepared = prepare_forecasts(questions, _settings(4), SlowExaClient(), StubLLMClient())
+    assert [p["evidence"].question_id for p in prepared] == [0, 1, 2, 3, 4, 5]
+    assert all(0.01 <= p["final_forecast"]["probability"] <= 0.99 for p in prepared)
+
+
+def test_prepare_forecasts_runs_questions_concurrently():
+    exa = SlowExaClient()
+    questions = [{"id": i, "title": f"Q{i}", "type": "binary"} for i in range(4)]
+    prepare_forecasts(questions, _settings(4), exa, StubLLMClient())
+    assert exa.peak > 1
+
+
+def test_prepare_forecasts_single_worker_is_serial():
+    exa = SlowExaClient()
+    questions = [{"id": i, "title": f"Q{i}", "type": "binary"} for i in range(3)]
+    prepare_forecasts(questions, _settings(1), exa, StubLLMClient())
+    assert exa.peak == 1
+
+
+def test_prepare_forecasts_skips_llm_when_inputs_unchanged():
+    question = {"id": 7, "title": "Q7", "type": "binary"}
+    settings = _settings(1)
+    first = prepare_forecasts([question], settings, SlowExaClient(), StubLLMClient())[0]
+    assert first["skipped"] is False
+
+    class FailingLLMClient:
+        def chat_json(self, _prompt: str) -> dict:
+            raise AssertionError("LLM must not be called for unchanged inputs")
+
+    previous = {"7": {"hash": first["fingerprint"], "timestamp": now_utc().isoformat()}}
+    second = prepare_forecasts(
+        [question], settings, SlowExaClient(), FailingLLMClient(), previous
+    )[0]
+    assert second["skipped"] is True
+
+    changed = {**question, "title": "Q7 revised"}
+    third = prepare_forecasts([changed], settings, SlowExaClient(), StubLLMClient(), previous)[0]
+    assert third["skipped"] is False
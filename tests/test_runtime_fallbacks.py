@@ -1,3 +1,5 @@
+import pytest
+
 from src.llm.roles import run_roles
 from src.research.evidence import EvidenceBundle
 from src.research.retrieval import retrieve_evidence
@@ -37,3 +39,34 @@ def test_run_roles_returns_empty_payloads_on_failure():
     assert outputs["parser"] == {}
     assert outputs["summarizer"] == {}
     assert outputs["forecaster"] == {}
+
+
+class RecordingLLMClient:
+    def __init__(self):
+        self.prompts: list[str] = []
+
+    def chat_json(self, prompt: str) -> dict:
+        self.prompts.append(prompt)
+        if "Return strict JSON with concise evidence brief" in prompt:
+            return {"brief": "summary-marker"}
+        return {"probability": 0.6}
+
+
+def test_run_roles_passes_dependency_outputs_to_dependent_roles():
+    client = RecordingLLMClient()
+    outputs = run_roles({"id": 1, "title": "Test"}, EvidenceBundle(question_id=1, items=[]), client)
+    assert outputs["summarizer"] == {"brief": "summary-marker"}
+    forecaster_prompt = next(p for p in client.prompts if "probabilistic forecast" in p)
+    assert "summary-marker" in forecaster_prompt
+    assert client.prompts[-1] == forecaster_prompt
+
+
+def test_run_roles_rejects_cyclic_graph():
+    graph = {"parser": ("forecaster",), "forecaster": ("parser",)}
+    with pytest.raises(ValueError, match="Unresolvable"):
+        run_roles(
+            {"id": 1, "title": "Test"},
+            EvidenceBundle(question_id=1, items=[]),
+            RecordingLLMClient(),
+            graph,
+        )
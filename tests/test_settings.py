@@ -14,3 +14,18 @@ def test_from_env_reads_metaculus_api_key_alias(monkeypatch):
     monkeypatch.setenv("METACULUS_API_KEY", "alias-token")
     settings = Settings.from_env()
     assert settings.metaculus_token == "alias-token"
+
+
+def test_from_env_parses_forecaster_models(monkeypatch):
+    monkeypatch.setenv("FORECASTER_MODELS", "openai/gpt-4o, anthropic/claude-sonnet ,")
+    settings = Settings.from_env()
+    assert settings.forecaster_models == ("openai/gpt-4o", "anthropic/claude-sonnet")
+
+
+def test_replay_mode_skips_preflight_and_fills_placeholder_keys(monkeypatch):
+    for name in ("METACULUS_TOKEN", "METACULUS_API_KEY", "EXA_API_KEY", "OPENROUTER_API_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTP_MODE", "replay")
+    settings = Settings.from_env()
+    assert settings.exa_api_key == "replay"
+    assert settings.preflight() == (True, [])
@@ -0,0 +1,71 @@
+import time
+
+from src.research.source_ranker import (
+    SimHashIndex,
+    deduplicate_and_rank,
+    hamming,
+    simhash,
+    tokenize,
+)
+
+STORY = (
+    "The central bank raised interest rates by a quarter point on Wednesday, citing "
+    "persistent inflation and a tight labour market, and signalled further increases."
+)
+
+
+def test_simhash_is_close_for_near_duplicates_and_far_otherwise():
+    base = simhash(tokenize(STORY))
+    copy = simhash(tokenize(STORY.replace("Wednesday", "Wednesday afternoon")))
+    galaxy = "A new telescope captured images of a distant galaxy cluster forming."
+    other = simhash(tokenize(galaxy))
+    assert hamming(base, copy) < hamming(base, other)
+
+
+def test_index_finds_fingerprints_within_distance():
+    index = SimHashIndex(max_distance=3)
+    index.add(0b1011, "a")
+    assert index.find(0b1011 ^ 0b111) == "a"
+    assert index.find(0b1011 ^ 0b1111) is None
+
+
+def test_syndicated_copies_collapse_to_highest_scored():
+    rows = [
+        {"url": "https://wire.com/a", "title": "Rates up", "text": STORY, "score": 0.7},
+        {"url": "https://paper.com/b", "title": "Rates up", "text": STORY, "score": 0.9},
+        {"url": "https://paper.com/b", "title": "dup url", "text": "x", "score": 0.1},
+        {
+            "url": "https://other.com/c",
+            "title": "Galaxy",
+            "text": "Telescope images of galaxies reveal a cluster forming in the early universe.",
+            "score": 0.5,
+        },
+    ]
+    out = deduplicate_and_rank(rows)
+    assert [row["url"] for row in out] == ["https://paper.com/b", "https://other.com/c"]
+
+
+def test_query_relevance_reranks_results():
+    rows = [
+        {"url": "https://a.com", "title": "Sports", "text": "football scores " * 5, "score": 0.9},
+        {"url": "https://b.com", "title": "Rates", "text": STORY, "score": 0.6},
+    ]
+    out = deduplicate_and_rank(rows, "Will the central bank raise interest rates?")
+    assert out[0]["url"] == "https://b.com"
+    assert out[0]["rank_score"] > out[1]["rank_score"]
+
+
+def test_ranks_hundreds_of_candidates_quickly():
+    rows = [
+        {
+            "url": f"https://site{i}.com/story",
+            "title": f"Story {i}",
+            "text": f"{STORY} Update number {i} " + " ".join(f"w{i}x{j}" for j in range(40)),
+            "score": i / 500,
+        }
+        for i in range(500)
+    ]
+    start = time.perf_counter()
+    out = deduplicate_and_rank(rows, "central bank interest rates")
+    assert time.perf_counter() - start < 2.0
+    assert len(out) == 6
@@ -0,0 +1,82 @@
+import json
+
+from src.metaculus.state import StateStore
+
+
+def test_record_appends_deltas_replayed_on_load(tmp_path):
+    store = StateStore(tmp_path / "state.json")
+    state = store.load()
+    store.record(state, "submissions", "1", {"hash": "a", "timestamp": "t1"})
+    store.record(state, "submissions", "2", {"hash": "b", "timestamp": "t2"})
+    store.record(state, "submissions", "1", None)
+    assert not (tmp_path / "state.json").exists()
+
+    reloaded = StateStore(tmp_path / "state.json").load()
+    assert reloaded["submissions"] == {"2": {"hash": "b", "timestamp": "t2"}}
+
+
+def test_save_compacts_atomically_and_truncates_log(tmp_path):
+    store = StateStore(tmp_path / "state.json")
+    state = store.load()
+    store.record(state, "inputs", "5", {"hash": "x", "timestamp": "t"})
+    store.save(state)
+    assert not store.log_path.exists()
+    assert json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))["inputs"] == {
+        "5": {"hash": "x", "timestamp": "t"}
+    }
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["state.json"]
+
+
+def test_load_ignores_torn_last_delta(tmp_path):
+    store = StateStore(tmp_path / "state.json")
+    state = store.load()
+    store.record(state, "submissions", "1", {"hash": "a", "timestamp": "t"})
+    with store.log_path.open("a", encoding="utf-8") as f:
+        f.write('{"section": "submissions", "key": "2", "val')
+    assert StateStore(tmp_path / "state.json").load()["submissions"] == {
+        "1": {"hash": "a", "timestamp": "t"}
+    }
+
+
+def test_deltas_after_torn_line_survive_a_second_crash(tmp_path):
+    path = tmp_path / "state.json"
+    store = StateStore(path)
+    state = store.load()
+    store.record(state, "submissions", "1", {"hash": "a", "timestamp": "t"})
+    with store.log_path.open("a", encoding="utf-8") as f:
+        f.write('{"section": "submissions", "key": "2", "val')
+
+    # First crash: the next run loads, records more deltas and dies before compacting.
+    store = StateStore(path)
+    state = store.load()
+    store.record(state, "submissions", "3", {"hash": "c", "timestamp": "t"})
+    with store.log_path.open("a", encoding="utf-8") as f:
+        f.write('{"section": "inputs", "key": "4"')
+
+    # Second crash: every complete delta is still replayed.
+    store = StateStore(path)
+    state = store.load()
+    store.record(state, "inputs", "5", {"hash": "e", "timestamp": "t"})
+    assert StateStore(path).load() == {
+        "submissions": {
+            "1": {"hash": "a", "timestamp": "t"},
+            "3": {"hash": "c", "timestamp": "t"},
+        },
+        "inputs": {"5": {"hash": "e", "timestamp": "t"}},
+    }
+
+
+def test_record_compacts_periodically(tmp_path):
+    store = StateStore(tmp_path / "state.json", compact_every=2)
+    state = store.load()
+    store.record(state, "submissions", "1", {"hash": "a", "timestamp": "t"})
+    store.record(state, "submissions", "2", {"hash": "b", "timestamp": "t"})
+    assert not store.log_path.exists()
+    assert set(StateStore(tmp_path / "state.json").load()["submissions"]) == {"1", "2"}
+
+
+def test_prune_drops_unlisted_questions(tmp_path):
+    store = StateStore(tmp_path / "state.json")
+    state = {"submissions": {"1": {}, "2": {}}, "inputs": {"2": {}, "3": {}}}
+    assert store.prune(state, {"2"}) == 2
+    assert state == {"submissions": {"2": {}}, "inputs": {"2": {}}}
@@ -0,0 +1,54 @@
+from src.config.settings import Settings
+from src.execution.submitter import SubmissionBatcher, maybe_submit
+from src.metaculus.client import MetaculusAPIError
+
+
+class StubMetaculusClient:
+    def __init__(self, reject_ids: set[int] | None = None):
+        self.batches: list[list[int]] = []
+        self.comments: list[int] = []
+        self.reject_ids = reject_ids or set()
+
+    def submit_batch(self, items):
+        ids = [question["id"] for question, _forecast in items]
+        self.batches.append(ids)
+        if self.reject_ids.intersection(ids):
+            raise MetaculusAPIError("HTTP 400", http_status=400)
+        return [{"question": qid} for qid in ids]
+
+    def post_comment(self, post_id, _text):
+        self.comments.append(post_id)
+        return {}
+
+
+def _questions(n: int) -> list[dict]:
+    return [{"id": i, "post_id": 100 + i, "type": "binary"} for i in range(1, n + 1)]
+
+
+def test_batcher_submits_in_batches_and_maps_results():
+    client = StubMetaculusClient()
+    state: dict = {"submissions": {}}
+    batcher = SubmissionBatcher(client, state, batch_size=2, comment_workers=2)
+    settings = Settings.from_env()
+    submissions = [
+        maybe_submit(client, settings, state, q, {"probability": 0.3}, "why", True, batcher=batcher)
+        for q in _questions(3)
+    ]
+    assert all(s["status"] == "QUEUED" for s in submissions)
+    batcher.flush()
+    assert client.batches == [[1, 2], [3]]
+    responses = [s["response"] for s in submissions]
+    assert responses == [{"question": 1}, {"question": 2}, {"question": 3}]
+    assert sorted(client.comments) == [101, 102, 103]
+    assert set(state["submissions"]) == {"1", "2", "3"}
+
+
+def test_batcher_isolates_rejected_forecast():
+    client = StubMetaculusClient(reject_ids={2})
+    state: dict = {"submissions": {}}
+    batcher = SubmissionBatcher(client, state, batch_size=3, comment_workers=1)
+    submissions = [batcher.add(q, {"probability": 0.3}, "why", "h") for q in _questions(3)]
+    batcher.flush()
+    assert [s["status"] for s in submissions] == ["SUBMITTED", "SUBMIT_FAILED", "SUBMITTED"]
+    assert set(state["submissions"]) == {"1", "3"}
+    assert sorted(client.comments) == [101, 103]
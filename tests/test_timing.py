@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from src.execution.timing import Profiler, percentile, timed
+
+
+class StepClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1.0
+        return self.now
+
+
+def test_percentile_interpolates():
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == pytest.approx(2.5)
+    assert percentile([5.0], 95) == 5.0
+    assert percentile([], 50) == 0.0
+
+
+def test_profiler_summarises_stages_and_questions():
+    profiler = Profiler()
+    profiler.record("llm.forecaster", 2.0, question_id=1)
+    profiler.record("llm.forecaster", 4.0, question_id=2)
+    profiler.record("submit", 1.0)
+    summary = profiler.stage_summary()
+    assert summary["llm.forecaster"]["count"] == 2
+    assert summary["llm.forecaster"]["total"] == 6.0
+    assert summary["llm.forecaster"]["p50"] == 3.0
+    assert profiler.question_breakdown() == {
+        "1": {"llm.forecaster": 2.0},
+        "2": {"llm.forecaster": 4.0},
+    }
+
+
+def test_span_and_jsonl_output(tmp_path):
+    profiler = Profiler(clock=StepClock())
+    with timed(profiler, "retrieval.query", 9):
+        pass
+    with timed(None, "ignored"):
+        pass
+    path = tmp_path / "timings.jsonl"
+    profiler.write_jsonl(path, "run-1")
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert lines[0] == {
+        "kind": "question",
+        "run_id": "run-1",
+        "question_id": "9",
+        "stages": {"retrieval.query": 1.0},
+    }
+    assert lines[-1]["kind"] == "run"
+    assert lines[-1]["stages"]["retrieval.query"]["count"] == 1
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+import pytest
+
+from src.execution.risk import RateLimiter
+from src.net.transport import AsyncHTTPTransport, HTTPTransport, RetryPolicy
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.client_ports.add(self.client_address[1])
+        status = server.statuses.pop(0) if server.statuses else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.client_ports = set()
+    httpd.statuses = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(httpd) -> str:
+    return f"http://127.0.0.1:{httpd.server_address[1]}/ping"
+
+
+def test_transport_reuses_keep_alive_connection(server):
+    transport = HTTPTransport(retry=RetryPolicy(attempts=1))
+    for _ in range(5):
+        assert transport.request("GET", _url(server)).json() == {"ok": True}
+    transport.close()
+    assert len(server.client_ports) == 1
+
+
+def test_transport_retries_transient_status(server):
+    server.statuses = [503, 503]
+    transport = HTTPTransport(retry=RetryPolicy(attempts=3, backoff_base=0))
+    assert transport.request("GET", _url(server)).status == 200
+    assert server.statuses == []
+
+
+def test_transport_does_not_retry_client_errors(server):
+    server.statuses = [404, 200]
+    transport = HTTPTransport(retry=RetryPolicy(attempts=3, backoff_base=0))
+    with pytest.raises(HTTPError) as exc:
+        transport.request("GET", _url(server))
+    assert exc.value.code == 404
+    assert server.statuses == [200]
+
+
+def test_async_transport_shares_pool(server):
+    transport = HTTPTransport(retry=RetryPolicy(attempts=1))
+    async_transport = AsyncHTTPTransport(transport)
+
+    async def fetch_all():
+        return await asyncio.gather(*(async_transport.request("GET", _url(server)) for _ in range(4)))
+
+    responses = asyncio.run(fetch_all())
+    assert [r.status for r in responses] == [200, 200, 200, 200]
+
+
+def test_transport_honours_retry_after_through_rate_limiter(server):
+    server.statuses = [429]
+    limiter = RateLimiter({"127.0.0.1": 1000.0})
+    transport = HTTPTransport(retry=RetryPolicy(attempts=2, backoff_base=5), rate_limiter=limiter)
+    assert transport.request("GET", _url(server)).status == 200
+    assert limiter.stats()["127.0.0.1"]["requests"] == 2
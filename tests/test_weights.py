@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from src.forecasting.backtest import fit_weights, load_cases, run_backtest
+from src.forecasting.batch import combine_batch, extremize_all
+from src.forecasting.ensemble import combine
+from src.forecasting.weights import (
+    WEIGHTS_VERSION,
+    EnsembleWeights,
+    TypeWeights,
+    fit_binary,
+    fit_multiclass,
+    load_weights,
+    save_weights,
+    simplex_grid,
+)
+from tests.test_backtest import FIXTURE
+
+
+def test_simplex_grid_sums_to_one():
+    grid = simplex_grid(0.5)
+    assert len(grid) == 6
+    assert all(sum(w) == pytest.approx(1.0) for w in grid)
+
+
+def test_fit_binary_prefers_informative_component():
+    outcomes = [1, 0, 1, 0]
+    fit = fit_binary([0.5] * 4, [0.5] * 4, [0.9, 0.1, 0.8, 0.2], outcomes, 0.01, 0.99)
+    assert fit.weights == (0.0, 0.0, 1.0)
+    assert fit.extremize > 1.0
+    assert fit.count == 4
+
+
+def test_fit_binary_keeps_equal_weights_without_signal():
+    fit = fit_binary([0.5, 0.5], [0.5, 0.5], [0.5, 0.5], [1, 0], 0.01, 0.99)
+    assert fit.weights == (1.0, 1.0, 1.0)
+    assert fit.extremize == 1.0
+
+
+def test_fit_multiclass_mixes_distributions():
+    rows = [[[0.5, 0.5], [0.5, 0.5], [0.9, 0.1]], [[0.5, 0.5], [0.5, 0.5], [0.2, 0.8]]]
+    fit = fit_multiclass(rows, [0, 1])
+    assert fit.weights == (0.0, 0.0, 1.0)
+
+
+def test_combine_applies_weights_and_defaults_without_them():
+    question = {"type": "binary"}
+    parts = ({"probability": 0.4}, {"probability": 0.6}, {"probability": 0.8})
+    assert combine(question, *parts, 0.01, 0.99)["probability"] == pytest.approx(0.6)
+    weights = EnsembleWeights(binary=TypeWeights(weights=(0.0, 0.0, 1.0), extremize=2.0, count=1))
+    expected = extremize_all([0.8], 2.0)[0]
+    assert combine(question, *parts, 0.01, 0.99, weights)["probability"] == pytest.approx(expected)
+
+    mc = {"type": "multiple_choice"}
+    dists = ({"distribution": [0.5, 0.5]}, {"distribution": [1, 3]}, {"distribution": [1, 0]})
+    assert combine_batch([mc], *[[d] for d in dists], 0.01, 0.99, weights)[0] == {
+        "distribution": [0.25, 0.75]
+    }
+
+
+def test_weights_artifact_round_trip_and_version_check(tmp_path):
+    path = tmp_path / "ensemble_weights.json"
+    assert load_weights(path) is None
+    weights = EnsembleWeights(binary=TypeWeights(weights=(0.2, 0.3, 0.5), extremize=1.5))
+    save_weights(weights, path)
+    assert load_weights(path) == weights
+    data = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**data, "version": WEIGHTS_VERSION + 1}), encoding="utf-8")
+    assert load_weights(path) is None
+
+
+def test_fitted_weights_do_not_worsen_backtest():
+    cases = load_cases(FIXTURE)
+    weights = fit_weights(cases, workers=1)
+    base = run_backtest(cases, workers=1)["components"]["ensemble"]["brier"]
+    tuned = run_backtest(cases, workers=1, weights=weights)["components"]["ensemble"]["brier"]
+    assert tuned <= base